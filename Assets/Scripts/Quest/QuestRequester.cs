@@ -22,7 +22,11 @@ public class QuestRequester : MonoBehaviour
     private string memoryServerUrl = "http://127.0.0.1:8123/memory";
     public TextMeshProUGUI buttonText;
 
-    private class FastAPIResponse { public string quest_json; }
+    private class FastAPIResponse
+    {
+        [JsonProperty("quest")] public QuestData Quest;
+        [JsonProperty("memory_queued")] public bool MemoryQueued;
+    }
 
     // ======================================================
     // 전송용 페이로드 정의 (context + memories 함께 전송)
@@ -122,10 +126,10 @@ public class QuestRequester : MonoBehaviour
                 string responseJson = webRequest.downloadHandler.text;
                 Debug.Log($"[QuestRequester] 서버 응답: {responseJson}");
 
-                FastAPIResponse response = JsonUtility.FromJson<FastAPIResponse>(responseJson);
-                string generatedQuestJson = response.quest_json;
+                // 서버가 퀘스트를 JSON 객체로 보내므로 한 번만 파싱
+                FastAPIResponse response = JsonConvert.DeserializeObject<FastAPIResponse>(responseJson);
 
-                if (string.IsNullOrEmpty(generatedQuestJson))
+                if (response == null || response.Quest == null)
                 {
                     Debug.LogError("[QuestRequester] 퀘스트 JSON이 비어있습니다.");
                     if (buttonText != null) buttonText.text = "Error!";
@@ -133,7 +137,7 @@ public class QuestRequester : MonoBehaviour
                 }
 
                 Debug.Log("[QuestRequester] 퀘스트 생성 성공! QuestStartTester로 전달합니다.");
-                questStartTester.StartQuestFromJson(generatedQuestJson);
+                questStartTester.StartQuest(response.Quest);
                 if (buttonText != null) buttonText.text = "Quest Created!";
             }
             else
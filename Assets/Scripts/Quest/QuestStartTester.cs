@@ -56,10 +56,7 @@ public class QuestStartTester : MonoBehaviour
     {
         try
         {
-            currentQuest = JsonConvert.DeserializeObject<QuestData>(json);
-            currentStepIndex = 0;
-
-            StartStep(currentStepIndex);
+            StartQuest(JsonConvert.DeserializeObject<QuestData>(json));
         }
         catch (System.Exception ex)
         {
@@ -67,6 +64,15 @@ public class QuestStartTester : MonoBehaviour
         }
     }
 
+    // 이미 파싱된 퀘스트로 시작 (서버 응답용)
+    public void StartQuest(QuestData quest)
+    {
+        currentQuest = quest;
+        currentStepIndex = 0;
+
+        StartStep(currentStepIndex);
+    }
+
     private void StartStep(int stepIndex)
     {
         if (currentQuest == null || stepIndex >= currentQuest.QuestSteps.Count)
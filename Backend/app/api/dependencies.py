@@ -0,0 +1,49 @@
+"""FastAPI dependency providers for application services.
+
+Each service is created lazily on first use and cached for the lifetime of the
+process (the standard FastAPI singleton pattern). Tests can replace any of them
+via ``app.dependency_overrides``.
+"""
+
+from functools import lru_cache
+
+from app.config import settings
+from app.services.prompt_builder import PromptBuilder
+from app.services.storage_service import StorageService
+from app.services.template_manager import TemplateManager
+from app.services.validator import CharacterValidator
+from app.services.vertex_client import VertexAIClient
+
+
+@lru_cache
+def get_template_manager() -> TemplateManager:
+    """Get the shared TemplateManager instance."""
+    return TemplateManager(settings.templates_dir)
+
+
+@lru_cache
+def get_prompt_builder() -> PromptBuilder:
+    """Get the shared PromptBuilder instance."""
+    return PromptBuilder(get_template_manager())
+
+
+@lru_cache
+def get_storage_service() -> StorageService:
+    """Get the shared StorageService instance."""
+    return StorageService(settings.output_dir, pretty_json=settings.pretty_json_output)
+
+
+@lru_cache
+def get_vertex_client() -> VertexAIClient:
+    """Get the shared VertexAIClient instance.
+
+    Creating the client performs credential discovery, so it is warmed up in
+    the application startup event rather than on the first request.
+    """
+    return VertexAIClient()
+
+
+@lru_cache
+def get_character_validator() -> CharacterValidator:
+    """Get the shared CharacterValidator instance."""
+    return CharacterValidator()
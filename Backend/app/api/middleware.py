@@ -4,11 +4,15 @@ This module defines FastAPI exception handlers for custom exceptions,
 converting them to appropriate HTTP responses.
 """
 
+from typing import Any, Dict, List
+
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
 from app.core.exceptions import (
+    CharacterGeneratorError,
     ConfigurationError,
     LLMGenerationError,
     StorageError,
@@ -20,191 +24,151 @@ from app.models.schemas import ErrorResponse
 
 logger = get_logger(__name__)
 
+# Compiled once; serializes ErrorResponse straight to JSON bytes
+_ERROR_ADAPTER = TypeAdapter(ErrorResponse)
 
-async def validation_error_handler(
-    request: Request,
-    exc: ValidationError
-) -> JSONResponse:
-    """Handle custom ValidationError exceptions.
-
-    Args:
-        request: The incoming request
-        exc: ValidationError exception
-
-    Returns:
-        JSON response with 422 status code
-    """
-    logger.error(f"Validation error: {str(exc)}")
-
-    error_response = ErrorResponse(
-        error_type="validation_error",
-        error_message=str(exc),
-        details={"path": request.url.path}
-    )
 
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump()
-    )
-
-
-async def pydantic_validation_error_handler(
-    request: Request,
-    exc: PydanticValidationError
-) -> JSONResponse:
-    """Handle Pydantic validation errors from request models.
+def _error_response(
+    status_code: int,
+    error_type: str,
+    error_message: str,
+    details: Dict[str, Any]
+) -> Response:
+    """Build a JSON error response without re-validating trusted data.
 
     Args:
-        request: The incoming request
-        exc: Pydantic ValidationError exception
+        status_code: HTTP status code
+        error_type: Machine-readable error type
+        error_message: Human-readable error message
+        details: Additional error details
 
     Returns:
-        JSON response with 422 status code
+        Response carrying the serialized ErrorResponse body
     """
-    logger.error(f"Pydantic validation error: {str(exc)}")
-
-    # Extract error details from Pydantic
-    error_details = {
-        "validation_errors": exc.errors(),
-        "path": request.url.path
-    }
-
-    error_response = ErrorResponse(
-        error_type="request_validation_error",
-        error_message="Invalid request data",
-        details=error_details
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump()
+    body = _ERROR_ADAPTER.dump_json(ErrorResponse.model_construct(
+        error_type=error_type,
+        error_message=error_message,
+        details=details
+    ))
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json"
     )
 
 
-async def llm_generation_error_handler(
-    request: Request,
-    exc: LLMGenerationError
-) -> JSONResponse:
-    """Handle LLM generation errors.
-
-    Args:
-        request: The incoming request
-        exc: LLMGenerationError exception
-
-    Returns:
-        JSON response with 503 status code
-    """
-    logger.error(f"LLM generation error: {str(exc)}")
-
-    error_response = ErrorResponse(
-        error_type="llm_generation_error",
-        error_message="Failed to generate character sheet from LLM",
-        details={
-            "reason": str(exc),
-            "path": request.url.path
-        }
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        content=error_response.model_dump()
-    )
+# Error table: exception type -> (status code, error type, error message, log label)
+# An error message of None means the exception text itself is reported to the client.
+_ERROR_TABLE = {
+    ValidationError: (
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "validation_error",
+        None,
+        "Validation error"
+    ),
+    LLMGenerationError: (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "llm_generation_error",
+        "Failed to generate character sheet from LLM",
+        "LLM generation error"
+    ),
+    StorageError: (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "storage_error",
+        "Failed to save character sheet to storage",
+        "Storage error"
+    ),
+    TemplateError: (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "template_error",
+        "Failed to load required templates",
+        "Template error"
+    ),
+    ConfigurationError: (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "configuration_error",
+        "Application configuration error",
+        "Configuration error"
+    ),
+}
+
+_DEFAULT_ERROR = (
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+    "internal_server_error",
+    "An unexpected error occurred",
+    "Application error"
+)
 
 
-async def storage_error_handler(
+async def character_generator_error_handler(
     request: Request,
-    exc: StorageError
-) -> JSONResponse:
-    """Handle file storage errors.
-
-    Args:
-        request: The incoming request
-        exc: StorageError exception
-
-    Returns:
-        JSON response with 500 status code
-    """
-    logger.error(f"Storage error: {str(exc)}")
+    exc: CharacterGeneratorError
+) -> Response:
+    """Handle all custom application exceptions.
 
-    error_response = ErrorResponse(
-        error_type="storage_error",
-        error_message="Failed to save character sheet to storage",
-        details={
-            "reason": str(exc),
-            "path": request.url.path
-        }
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump()
-    )
-
-
-async def template_error_handler(
-    request: Request,
-    exc: TemplateError
-) -> JSONResponse:
-    """Handle template loading errors.
+    A single handler is registered on the CharacterGeneratorError base class
+    and dispatches via _ERROR_TABLE on the closest listed class in the
+    exception's MRO.
 
     Args:
         request: The incoming request
-        exc: TemplateError exception
+        exc: CharacterGeneratorError (or subclass) exception
 
     Returns:
-        JSON response with 500 status code
+        JSON response with the status code mapped to the exception type
     """
-    logger.error(f"Template error: {str(exc)}")
+    # Walk the MRO so subclasses of a listed exception map like their parent
+    status_code, error_type, error_message, log_label = next(
+        (_ERROR_TABLE[cls] for cls in type(exc).__mro__ if cls in _ERROR_TABLE),
+        _DEFAULT_ERROR
+    )
+    logger.error("%s: %s", log_label, exc)
 
-    error_response = ErrorResponse(
-        error_type="template_error",
-        error_message="Failed to load required templates",
-        details={
+    if error_message is None:
+        error_message = str(exc)
+        details = {"path": request.url.path}
+    else:
+        details = {
             "reason": str(exc),
             "path": request.url.path
         }
-    )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump()
-    )
+    return _error_response(status_code, error_type, error_message, details)
 
 
-async def configuration_error_handler(
+async def pydantic_validation_error_handler(
     request: Request,
-    exc: ConfigurationError
-) -> JSONResponse:
-    """Handle configuration errors.
+    exc: PydanticValidationError
+) -> Response:
+    """Handle Pydantic validation errors from request models.
 
     Args:
         request: The incoming request
-        exc: ConfigurationError exception
+        exc: Pydantic ValidationError exception
 
     Returns:
-        JSON response with 500 status code
+        JSON response with 422 status code
     """
-    logger.error(f"Configuration error: {str(exc)}")
+    logger.error("Pydantic validation error: %s", exc)
 
-    error_response = ErrorResponse(
-        error_type="configuration_error",
-        error_message="Application configuration error",
-        details={
-            "reason": str(exc),
-            "path": request.url.path
-        }
-    )
+    # Extract error details from Pydantic
+    error_details = {
+        "validation_errors": exc.errors(),
+        "path": request.url.path
+    }
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump()
+    return _error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "request_validation_error",
+        "Invalid request data",
+        error_details
     )
 
 
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> Response:
     """Handle unexpected exceptions.
 
     Args:
@@ -214,26 +178,45 @@ async def general_exception_handler(
     Returns:
         JSON response with 500 status code
     """
-    logger.exception(f"Unhandled exception: {str(exc)}")
+    logger.exception("Unhandled exception: %s", exc)
 
-    error_response = ErrorResponse(
-        error_type="internal_server_error",
-        error_message="An unexpected error occurred",
-        details={
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "internal_server_error",
+        "An unexpected error occurred",
+        {
             "exception_type": type(exc).__name__,
             "path": request.url.path
         }
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump()
-    )
+
+def _all_subclasses(cls: type) -> List[type]:
+    """Collect every (transitive) subclass of a class.
+
+    Args:
+        cls: Base class to walk
+
+    Returns:
+        List of subclasses, the base class itself included
+    """
+    found = [cls]
+    stack = [cls]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            found.append(subclass)
+            stack.append(subclass)
+    return found
 
 
 def register_exception_handlers(app):
     """Register all exception handlers with the FastAPI app.
 
+    Every concrete CharacterGeneratorError subclass is registered directly, so
+    Starlette resolves the handler on the first step of its MRO walk (a single
+    dict hit) instead of climbing to the base class. The flat table is also
+    exposed as ``app.state.exception_table``.
+
     Args:
         app: FastAPI application instance
 
@@ -242,12 +225,16 @@ def register_exception_handlers(app):
         >>> app = FastAPI()
         >>> register_exception_handlers(app)
     """
-    app.add_exception_handler(ValidationError, validation_error_handler)
-    app.add_exception_handler(PydanticValidationError, pydantic_validation_error_handler)
-    app.add_exception_handler(LLMGenerationError, llm_generation_error_handler)
-    app.add_exception_handler(StorageError, storage_error_handler)
-    app.add_exception_handler(TemplateError, template_error_handler)
-    app.add_exception_handler(ConfigurationError, configuration_error_handler)
-    app.add_exception_handler(Exception, general_exception_handler)
-
-    logger.info("Exception handlers registered")
+    exception_table = {
+        exc_class: character_generator_error_handler
+        for exc_class in _all_subclasses(CharacterGeneratorError)
+    }
+    exception_table[PydanticValidationError] = pydantic_validation_error_handler
+    exception_table[Exception] = general_exception_handler
+
+    for exc_class, handler in exception_table.items():
+        app.add_exception_handler(exc_class, handler)
+
+    app.state.exception_table = exception_table
+
+    logger.info("Exception handlers registered: %d", len(exception_table))
@@ -3,15 +3,35 @@
 This module defines the FastAPI endpoints for character sheet generation.
 """
 
-from datetime import datetime
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError as PydanticValidationError
 
+from app.api.dependencies import (
+    get_character_validator,
+    get_prompt_builder,
+    get_storage_service,
+    get_template_manager,
+    get_vertex_client,
+)
+from app.api.responses import PydanticResponse
 from app.config import settings
 from app.core.logger import get_logger
+from app.database import InsertCharacterSheetinDatabase
 from app.models.character_sheet import CharacterSheet
-from app.models.schemas import CharacterRequest, CharacterResponse, HealthResponse
+from app.models.schemas import (
+    BatchCharacterRequest,
+    BatchCharacterResponse,
+    CharacterRequest,
+    CharacterResponse,
+    ErrorResponse,
+    HealthResponse,
+)
 from app.services.prompt_builder import PromptBuilder
 from app.services.storage_service import StorageService
 from app.services.template_manager import TemplateManager
@@ -23,16 +43,52 @@ logger = get_logger(__name__)
 # Create router
 router = APIRouter()
 
-# Initialize services (these will be created once when the module is imported)
-template_manager = TemplateManager(settings.templates_dir)
-prompt_builder = PromptBuilder(template_manager)
-storage_service = StorageService(settings.output_dir)
-vertex_client = VertexAIClient()
-character_validator = CharacterValidator()
+# Limits Vertex AI calls in flight at once (shared by all endpoints)
+_generation_semaphore = asyncio.BoundedSemaphore(settings.max_concurrent_generations)
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check():
+def _release_if_acquired(acquire: "asyncio.Future") -> None:
+    """Give back a permit that an abandoned acquire() managed to take"""
+    if not acquire.cancelled() and acquire.exception() is None:
+        _generation_semaphore.release()
+
+
+async def _acquire_generation_slot(queue_timeout: Optional[float]) -> bool:
+    """
+    Take a slot from the shared generation semaphore
+
+    Args:
+        queue_timeout: Seconds to wait for a slot (0 = only take a free slot,
+            None = wait as long as needed)
+
+    Returns:
+        True if a slot was acquired (the caller must release it)
+    """
+    if queue_timeout is None or not _generation_semaphore.locked():
+        # A free permit is taken without suspending
+        await _generation_semaphore.acquire()
+        return True
+    if queue_timeout <= 0:
+        return False
+
+    # asyncio.wait() does not cancel on timeout, so a permit handed over at the
+    # last moment is released explicitly instead of leaking
+    acquire = asyncio.ensure_future(_generation_semaphore.acquire())
+    try:
+        done, _ = await asyncio.wait({acquire}, timeout=queue_timeout)
+    except asyncio.CancelledError:
+        acquire.cancel()
+        acquire.add_done_callback(_release_if_acquired)
+        raise
+    if done:
+        return True
+    acquire.cancel()
+    acquire.add_done_callback(_release_if_acquired)
+    return False
+
+
+@router.get("/health", response_model=HealthResponse, response_model_exclude_none=True)
+async def health_check() -> PydanticResponse:
     """Health check endpoint.
 
     Returns:
@@ -42,15 +98,27 @@ async def health_check():
         GET /api/v1/health
     """
     logger.debug("Health check requested")
-    return HealthResponse(
+    # Response data is built internally, so skip validation with model_construct
+    return PydanticResponse(HealthResponse.model_construct(
         status="healthy",
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
         version="1.0.0"
-    )
-
-
-@router.post("/generate-character-sheet", response_model=CharacterResponse)
-async def generate_character_sheet(request: CharacterRequest):
+    ))
+
+
+@router.post(
+    "/generate-character-sheet",
+    response_model=CharacterResponse,
+    response_model_exclude_none=True
+)
+async def generate_character_sheet(
+    request: CharacterRequest,
+    template_manager: TemplateManager = Depends(get_template_manager),
+    prompt_builder: PromptBuilder = Depends(get_prompt_builder),
+    vertex_client: VertexAIClient = Depends(get_vertex_client),
+    character_validator: CharacterValidator = Depends(get_character_validator),
+    storage_service: StorageService = Depends(get_storage_service)
+) -> PydanticResponse:
     """Generate a complete NPC character sheet from a seed description.
 
     This endpoint orchestrates the complete character generation workflow:
@@ -63,6 +131,11 @@ async def generate_character_sheet(request: CharacterRequest):
 
     Args:
         request: Character generation request containing character_id and seed_description
+        template_manager: Injected TemplateManager dependency
+        prompt_builder: Injected PromptBuilder dependency
+        vertex_client: Injected VertexAIClient dependency
+        character_validator: Injected CharacterValidator dependency
+        storage_service: Injected StorageService dependency
 
     Returns:
         CharacterResponse with file path and generation timestamp
@@ -77,30 +150,168 @@ async def generate_character_sheet(request: CharacterRequest):
             "seed_description": "A wandering mage seeking forgotten knowledge..."
         }
     """
-    logger.info(f"Character generation requested: {request.character_id}")
-    logger.debug(f"Seed description: {request.seed_description}")
+    character_response = await _generate_character(
+        request,
+        template_manager=template_manager,
+        prompt_builder=prompt_builder,
+        vertex_client=vertex_client,
+        character_validator=character_validator,
+        storage_service=storage_service,
+        queue_timeout=settings.generation_queue_timeout
+    )
+    return PydanticResponse(character_response)
+
+
+@router.post(
+    "/generate-character-sheets",
+    response_model=BatchCharacterResponse,
+    response_model_exclude_none=True
+)
+async def generate_character_sheets(
+    batch: BatchCharacterRequest,
+    template_manager: TemplateManager = Depends(get_template_manager),
+    prompt_builder: PromptBuilder = Depends(get_prompt_builder),
+    vertex_client: VertexAIClient = Depends(get_vertex_client),
+    character_validator: CharacterValidator = Depends(get_character_validator),
+    storage_service: StorageService = Depends(get_storage_service)
+) -> PydanticResponse:
+    """Generate several NPC character sheets concurrently.
+
+    Each item runs the same workflow as /generate-character-sheet. Vertex AI
+    calls share the module-level concurrency limit, so a large batch cannot
+    starve single requests. Batch items wait for a free slot instead of
+    failing with 429, so batches larger than the limit still complete. A
+    failing item is reported in place and does not abort the rest of the batch.
 
-    # Step 1: Build prompt
-    logger.info("Building generation prompt")
-    prompt = prompt_builder.build_character_prompt(
-        character_id=request.character_id,
-        seed_description=request.seed_description
+    Args:
+        batch: Batch request containing the individual character requests
+        template_manager: Injected TemplateManager dependency
+        prompt_builder: Injected PromptBuilder dependency
+        vertex_client: Injected VertexAIClient dependency
+        character_validator: Injected CharacterValidator dependency
+        storage_service: Injected StorageService dependency
+
+    Returns:
+        BatchCharacterResponse with per-character results in request order
+
+    Example:
+        POST /api/v1/generate-character-sheets
+        {
+            "characters": [
+                {"character_id": "npc_a", "seed_description": "..."},
+                {"character_id": "npc_b", "seed_description": "..."}
+            ]
+        }
+    """
+    logger.info("Batch character generation requested: %d characters", len(batch.characters))
+
+    outcomes = await asyncio.gather(
+        *(
+            _generate_character(
+                request,
+                template_manager=template_manager,
+                prompt_builder=prompt_builder,
+                vertex_client=vertex_client,
+                character_validator=character_validator,
+                storage_service=storage_service
+            )
+            for request in batch.characters
+        ),
+        return_exceptions=True
     )
 
-    # Step 2: Load schema
-    logger.info("Loading character sheet schema")
-    schema = template_manager.load_character_schema()
+    results = []
+    failed = 0
+    for request, outcome in zip(batch.characters, outcomes):
+        if isinstance(outcome, Exception):
+            failed += 1
+            logger.error("Batch item %s failed: %s", request.character_id, outcome)
+            results.append(ErrorResponse.model_construct(
+                error_type="character_generation_error",
+                error_message=str(outcome),
+                details={
+                    "character_id": request.character_id,
+                    "exception_type": type(outcome).__name__
+                }
+            ))
+        else:
+            results.append(outcome)
+
+    logger.info(
+        "Batch character generation finished: %d succeeded, %d failed",
+        len(results) - failed, failed
+    )
+
+    return PydanticResponse(BatchCharacterResponse.model_construct(
+        total=len(results),
+        succeeded=len(results) - failed,
+        failed=failed,
+        results=results
+    ))
+
+
+async def _generate_character(
+    request: CharacterRequest,
+    template_manager: TemplateManager,
+    prompt_builder: PromptBuilder,
+    vertex_client: VertexAIClient,
+    character_validator: CharacterValidator,
+    storage_service: StorageService,
+    queue_timeout: Optional[float] = None
+) -> CharacterResponse:
+    """Run the character generation workflow for a single request.
+
+    Args:
+        request: Character generation request
+        template_manager: TemplateManager instance
+        prompt_builder: PromptBuilder instance
+        vertex_client: VertexAIClient instance
+        character_validator: CharacterValidator instance
+        storage_service: StorageService instance
+        queue_timeout: Seconds to wait for a free generation slot before
+            failing with 429 (None waits as long as needed)
+
+    Returns:
+        CharacterResponse for the generated character
+    """
+    logger.info("Character generation requested: %s", request.character_id)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Seed description: %s", request.seed_description)
+
+    # Step 1-2: Build prompt and load schema (independent, so run them concurrently off the event loop)
+    logger.info("Building generation prompt and loading character sheet schema")
+    prompt, schema = await asyncio.gather(
+        asyncio.to_thread(
+            prompt_builder.build_character_prompt,
+            character_id=request.character_id,
+            seed_description=request.seed_description
+        ),
+        asyncio.to_thread(template_manager.load_genai_schema)
+    )
 
     # Step 3: Generate character sheet via Vertex AI
     logger.info("Calling Vertex AI for character generation")
-    character_data = vertex_client.generate_character_sheet(
-        prompt=prompt,
-        schema=schema
-    )
+    # (bounded by the shared semaphore; with a queue timeout, tell the client
+    # to back off if no slot frees up in time instead of queueing forever)
+    if not await _acquire_generation_slot(queue_timeout):
+        logger.warning("Generation queue full, rejecting request: %s", request.character_id)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many character generations in progress, please retry later"
+        )
+
+    try:
+        # settings.api_timeout applies to each attempt inside the client's retry loop
+        character_data = await vertex_client.generate_character_sheet(
+            prompt=prompt,
+            schema=schema
+        )
+    finally:
+        _generation_semaphore.release()
 
     # Step 3.5: Insert Charactere Sheet into Database
-    from app.database import InsertCharacterSheetinDatabase
-    InsertCharacterSheetinDatabase(character_data)
+    # (sqlite3 is blocking, so run it in a worker thread to keep the event loop free)
+    await asyncio.to_thread(InsertCharacterSheetinDatabase, character_data)
 
 
     # Step 4: Validate with Pydantic model
@@ -108,7 +319,7 @@ async def generate_character_sheet(request: CharacterRequest):
     try:
         character_sheet = CharacterSheet.model_validate(character_data)
     except PydanticValidationError as e:
-        logger.error(f"Pydantic validation failed: {str(e)}")
+        logger.error("Pydantic validation failed: %s", e)
         raise
 
     # Step 5: Business logic validation
@@ -117,28 +328,33 @@ async def generate_character_sheet(request: CharacterRequest):
 
     # Step 6: Save to storage
     logger.info("Saving character sheet to storage")
-    file_path = storage_service.save_character_sheet(
+    file_path = await storage_service.asave_character_sheet(
         character_id=request.character_id,
         data=character_data
     )
 
     # Step 7: Return success response
-    logger.info(f"Character sheet generated successfully: {file_path}")
+    logger.info("Character sheet generated successfully: %s", file_path)
 
-    return CharacterResponse(
+    # Response data is built internally (trusted), so skip validation with model_construct
+    return CharacterResponse.model_construct(
         character_id=request.character_id,
         file_path=str(file_path),
-        generated_at=datetime.utcnow(),
+        generated_at=datetime.now(timezone.utc),
         message="Character sheet generated successfully"
     )
 
 
 @router.get("/character/{character_id}")
-async def get_character(character_id: str):
+async def get_character(
+    character_id: str,
+    storage_service: StorageService = Depends(get_storage_service)
+) -> ORJSONResponse:
     """Retrieve an existing character sheet.
 
     Args:
         character_id: Unique character identifier
+        storage_service: Injected StorageService dependency
 
     Returns:
         Character sheet data
@@ -146,25 +362,29 @@ async def get_character(character_id: str):
     Example:
         GET /api/v1/character/npc_wandering_mage_elara
     """
-    logger.info(f"Character retrieval requested: {character_id}")
+    logger.info("Character retrieval requested: %s", character_id)
 
     character_data = storage_service.load_character_sheet(character_id)
 
     if character_data is None:
-        from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Character '{character_id}' not found"
         )
 
-    logger.info(f"Character retrieved: {character_id}")
-    return character_data
+    logger.info("Character retrieved: %s", character_id)
+    return ORJSONResponse(character_data)
 
 
 @router.get("/characters")
-async def list_characters():
+async def list_characters(
+    storage_service: StorageService = Depends(get_storage_service)
+) -> ORJSONResponse:
     """List all available character sheets.
 
+    Args:
+        storage_service: Injected StorageService dependency
+
     Returns:
         List of character IDs
 
@@ -175,19 +395,23 @@ async def list_characters():
 
     character_ids = storage_service.list_all_characters()
 
-    logger.info(f"Found {len(character_ids)} characters")
-    return {
+    logger.info("Found %d characters", len(character_ids))
+    return ORJSONResponse({
         "total": len(character_ids),
         "characters": character_ids
-    }
+    })
 
 
 @router.delete("/character/{character_id}")
-async def delete_character(character_id: str):
+async def delete_character(
+    character_id: str,
+    storage_service: StorageService = Depends(get_storage_service)
+):
     """Delete a character sheet.
 
     Args:
         character_id: Unique character identifier
+        storage_service: Injected StorageService dependency
 
     Returns:
         Deletion confirmation
@@ -195,18 +419,17 @@ async def delete_character(character_id: str):
     Example:
         DELETE /api/v1/character/npc_wandering_mage_elara
     """
-    logger.info(f"Character deletion requested: {character_id}")
+    logger.info("Character deletion requested: %s", character_id)
 
     deleted = storage_service.delete_character_sheet(character_id)
 
     if not deleted:
-        from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Character '{character_id}' not found"
         )
 
-    logger.info(f"Character deleted: {character_id}")
+    logger.info("Character deleted: %s", character_id)
     return {
         "success": True,
         "message": f"Character '{character_id}' deleted successfully"
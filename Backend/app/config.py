@@ -7,7 +7,7 @@ support and type validation. All paths use pathlib.Path for Windows compatibilit
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -72,6 +72,36 @@ class Settings(BaseSettings):
         ge=0,
         description="Maximum retry attempts for failed API calls"
     )
+    max_backoff_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Upper bound on the wait between retry attempts in seconds"
+    )
+    max_concurrent_generations: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum number of character generations running at once"
+    )
+    generation_queue_timeout: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="Seconds to wait for a free generation slot before returning 429 "
+                    "(0 = reject at once when every slot is busy)"
+    )
+    http_max_connections: int = Field(
+        default=200,
+        gt=0,
+        description="Maximum pooled HTTP connections to the Vertex AI API"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=100,
+        ge=0,
+        description="Maximum idle keep-alive connections kept in the pool"
+    )
+    http2_enabled: bool = Field(
+        default=True,
+        description="Multiplex concurrent Vertex AI calls over HTTP/2"
+    )
 
     # Application Settings
     debug: bool = Field(
@@ -82,6 +112,10 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
+    pretty_json_output: bool = Field(
+        default=False,
+        description="Write character sheets as indented JSON (for debugging)"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -90,11 +124,15 @@ class Settings(BaseSettings):
         extra="ignore"
     )
 
-    def __init__(self, **kwargs):
-        """Initialize settings and ensure output directory exists."""
-        super().__init__(**kwargs)
-        # Create output directory if it doesn't exist (Windows compatible)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+    @field_validator("output_dir")
+    @classmethod
+    def resolve_output_dir(cls, value: Path) -> Path:
+        """Resolve the output directory to an absolute path once at load time.
+
+        The directory itself is created by the application startup event, so
+        importing settings never touches the filesystem.
+        """
+        return value.resolve()
 
 
 # Global settings instance
@@ -0,0 +1,95 @@
+"""Shared helpers for calling the Gemini API.
+
+This module centralizes the retry policy for LLM calls: which errors are
+transient and how long to back off between attempts.
+"""
+
+import asyncio
+
+import httpx
+from google.genai import errors as genai_errors
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from app.config import settings
+from app.core.exceptions import LLMGenerationError
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# HTTP status codes from the API that are worth retrying (timeout, rate limit)
+RETRYABLE_CLIENT_CODES = frozenset({408, 429})
+
+# Exception types that are always transient. httpx transport errors do not
+# subclass ConnectionError, so they are listed explicitly.
+RETRYABLE_ERRORS = (
+    LLMGenerationError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    httpx.TimeoutException,
+)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Check whether a failed LLM call should be retried.
+
+    Server errors (5xx), rate limiting, timeouts, dropped connections
+    (including httpx transport errors from the async client) and empty
+    responses are transient. Other client errors (bad request, permission denied, invalid
+    schema) will fail the same way again, so they are not retried.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(error, genai_errors.ServerError):
+        return True
+    if isinstance(error, genai_errors.ClientError):
+        return error.code in RETRYABLE_CLIENT_CODES
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """Log a failed attempt before tenacity sleeps and retries it."""
+    error = retry_state.outcome.exception()
+    logger.warning(
+        "LLM attempt %d failed: %s. Retrying in %.2f seconds...",
+        retry_state.attempt_number,
+        error,
+        retry_state.next_action.sleep,
+    )
+
+
+def llm_retrying(max_attempts: int) -> AsyncRetrying:
+    """Build the retry controller for an async LLM call.
+
+    Transient errors are retried with exponential backoff plus jitter
+    (capped at settings.max_backoff_seconds), so workers sharing one quota do
+    not retry in lockstep. Non-retryable errors are raised immediately; when
+    attempts run out, tenacity raises RetryError.
+
+    Args:
+        max_attempts: Total number of attempts, including the first one
+
+    Returns:
+        AsyncRetrying instance to iterate with ``async for``
+
+    Example:
+        >>> async for attempt in llm_retrying(3):
+        ...     with attempt:
+        ...         response = await client.aio.models.generate_content(...)
+    """
+    return AsyncRetrying(
+        retry=retry_if_exception(is_retryable),
+        wait=wait_exponential_jitter(initial=1, max=settings.max_backoff_seconds),
+        stop=stop_after_attempt(max_attempts),
+        before_sleep=_log_retry,
+    )
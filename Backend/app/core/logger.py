@@ -2,13 +2,41 @@
 
 This module provides centralized logging setup with both file and console handlers.
 Windows-compatible path handling ensures logs are written correctly on all platforms.
+Records are handed to a queue and written by a background listener thread, so
+request handlers never block on log I/O.
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Background listener that drains the log queue to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second.
+
+    The date format has one-second resolution, so consecutive records in the
+    same second share one strftime call. Records are formatted only by the
+    queue listener thread, so the cache needs no locking.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_asctime = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_asctime = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_asctime
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -17,6 +45,9 @@ def setup_logging(
 ) -> None:
     """Configure application-wide logging with file and console handlers.
 
+    The root logger only enqueues records; a QueueListener thread writes them to
+    a rotating log file and the console. Call shutdown_logging() on exit to flush.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory for log files (default: logs/)
@@ -30,26 +61,30 @@ def setup_logging(
         log_dir = Path("logs")
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    # Configure log format
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # Configure log format (one formatter shared by all handlers)
+    log_format = "{asctime} - {name} - {levelname} - {message}"
     date_format = "%Y-%m-%d %H:%M:%S"
+    formatter = _CachedTimeFormatter(log_format, datefmt=date_format, style="{")
 
-    # File handler (with UTF-8 encoding for Windows)
-    file_handler = logging.FileHandler(
+    # Rotating file handler (with UTF-8 encoding for Windows)
+    file_handler = logging.handlers.RotatingFileHandler(
         log_dir / log_file,
+        maxBytes=50_000_000,
+        backupCount=5,
         encoding="utf-8"
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(
-        logging.Formatter(log_format, datefmt=date_format)
-    )
+    file_handler.setFormatter(formatter)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(
-        logging.Formatter(log_format, datefmt=date_format)
-    )
+    console_handler.setFormatter(formatter)
+
+    # Skip per-record thread/process lookups (not part of the log format)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     # Root logger configuration
     root_logger = logging.getLogger()
@@ -57,15 +92,39 @@ def setup_logging(
 
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
-
-    # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    shutdown_logging()
+
+    # Route records through a queue; the listener thread performs the actual writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Log initial message
     root_logger.info(f"Logging initialized - Level: {log_level}")
 
 
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing any queued records.
+
+    Safe to call multiple times or before setup_logging().
+
+    Example:
+        >>> shutdown_logging()
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module.
 
@@ -3,8 +3,21 @@
 This module provides helper functions for schema conversion and other common operations.
 """
 
+import copy
+import json
+from functools import lru_cache
 from typing import Any, Dict
 
+# OpenAPI (lowercase) -> Google GenAI (uppercase) type names
+GENAI_TYPE_MAP: Dict[str, str] = {
+    "string": "STRING",
+    "number": "NUMBER",
+    "integer": "INTEGER",
+    "boolean": "BOOLEAN",
+    "array": "ARRAY",
+    "object": "OBJECT"
+}
+
 
 def convert_openapi_to_genai_schema(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
     """Convert OpenAPI 3.0 schema format to Google GenAI schema format.
@@ -12,6 +25,10 @@ def convert_openapi_to_genai_schema(openapi_schema: Dict[str, Any]) -> Dict[str,
     The new Google GenAI SDK uses uppercase type names (STRING, OBJECT, ARRAY)
     instead of lowercase (string, object, array) used in OpenAPI.
 
+    The input schema is deep-copied once and the copy is converted in place
+    with an iterative walk, so the caller's schema is never modified and deep
+    schemas cannot hit the recursion limit.
+
     Args:
         openapi_schema: OpenAPI 3.0 compatible JSON schema
 
@@ -24,42 +41,44 @@ def convert_openapi_to_genai_schema(openapi_schema: Dict[str, Any]) -> Dict[str,
         >>> genai["type"]
         'OBJECT'
     """
-    def convert_type(schema_type: str) -> str:
-        """Convert type from lowercase to uppercase format."""
-        type_mapping = {
-            "string": "STRING",
-            "number": "NUMBER",
-            "integer": "INTEGER",
-            "boolean": "BOOLEAN",
-            "array": "ARRAY",
-            "object": "OBJECT"
-        }
-        return type_mapping.get(schema_type, schema_type.upper())
-
-    def convert_schema_recursive(schema: Any) -> Any:
-        """Recursively convert schema structure."""
-        if not isinstance(schema, dict):
-            return schema
-
-        converted = {}
-
-        for key, value in schema.items():
-            if key == "type":
-                # Convert type to uppercase
-                converted[key] = convert_type(value)
-            elif key == "properties":
-                # Recursively convert nested properties
-                converted[key] = {
-                    prop_name: convert_schema_recursive(prop_value)
-                    for prop_name, prop_value in value.items()
-                }
-            elif key == "items":
-                # Recursively convert array items schema
-                converted[key] = convert_schema_recursive(value)
-            else:
-                # Keep other fields as-is
-                converted[key] = value
-
-        return converted
-
-    return convert_schema_recursive(openapi_schema)
+    converted = copy.deepcopy(openapi_schema)
+
+    # Iterative walk: only "type" is rewritten, and only "properties"/"items" are descended
+    stack = [converted]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        if "type" in node:
+            node["type"] = GENAI_TYPE_MAP.get(node["type"], node["type"].upper())
+
+        if "properties" in node:
+            stack.extend(node["properties"].values())
+
+        if "items" in node:
+            stack.append(node["items"])
+
+    return converted
+
+
+@lru_cache(maxsize=4)
+def convert_schema_text_to_genai(schema_text: str) -> Dict[str, Any]:
+    """Parse a raw OpenAPI JSON schema and convert it to GenAI format (cached).
+
+    The character schema is static at runtime, so the conversion result is
+    memoized on the raw schema text. The returned dict is shared between
+    callers and must not be modified.
+
+    Args:
+        schema_text: Raw JSON text of an OpenAPI 3.0 schema
+
+    Returns:
+        Schema in Google GenAI format
+
+    Example:
+        >>> genai = convert_schema_text_to_genai('{"type": "string"}')
+        >>> genai["type"]
+        'STRING'
+    """
+    return convert_openapi_to_genai_schema(json.loads(schema_text))
@@ -1,15 +1,48 @@
+import logging
 import sqlite3
+import threading
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DB_PATH = '../Assets/StreamingAssets/StaticDB.db'
+
+INSERT_NPC_QUERY = "INSERT INTO NPC VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Shared connection (opened lazily, reused across calls)
+_connection = None
+_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    global _connection
+
+    if _connection is None:
+        # Calls arrive from worker threads, so allow cross-thread use and guard with _lock
+        # (journal settings are left at SQLite's defaults: the file ships
+        # with the Unity project, and journal_mode=WAL would persist in it)
+        _connection = sqlite3.connect(DB_PATH, check_same_thread=False)
+
+    return _connection
+
+
+def close_connection() -> None:
+    """Close the shared connection if it was opened (called on shutdown)."""
+    global _connection
+
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
 
 # Insert generated character sheet at database
 def InsertCharacterSheetinDatabase(json_file: str):
 
-    # Create a database connection
-    connection = sqlite3.connect('../Assets/StreamingAssets/StaticDB.db')
-    cursor = connection.cursor()
-    
     # Load character sheet JSON data from file
     json_data = json_file
-    
+
     # Parse JSON data
     npc_id = json_data.get('npc_id')
     name = json_data.get('name')
@@ -22,12 +55,19 @@ def InsertCharacterSheetinDatabase(json_file: str):
     speaking_style = json_data.get('psychological_profile').get('speaking_style')
     location = json_data.get('primary_location')
 
-    print(f"Parsed NPC Data: {npc_id}, {name}, {age}, {gender}, {role}, {faction}, {personality}, {speaking_style}, {location}")
-    
-    # Insert parsed data into the NPC table
-    insert_query = f"INSERT INTO NPC VALUES ('{npc_id}', '{name}', '{age}', '{gender}', '{role}', '{faction}', '{personality}', '{speaking_style}', '{location}')"
-    cursor.execute(insert_query)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Parsed NPC Data: %s, %s, %s, %s, %s, %s, %s, %s, %s",
+            npc_id, name, age, gender, role, faction, personality, speaking_style, location
+        )
+
+    # Insert parsed data into the NPC table (parameterized, so SQLite can reuse the prepared statement)
+    values = (npc_id, name, age, gender, role, faction, personality, speaking_style, location)
+
+    with _lock:
+        connection = _get_connection()
+        cursor = connection.cursor()
+        cursor.execute(INSERT_NPC_QUERY, values)
 
-    # Commit changes and close the connection
-    connection.commit()
-    connection.close()
+        # Commit changes (connection stays open for the next insert)
+        connection.commit()
@@ -6,12 +6,14 @@ configures middleware, registers routes, and sets up error handling.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.api.dependencies import get_template_manager, get_vertex_client
 from app.api.middleware import register_exception_handlers
 from app.api.routes import character
 from app.config import settings
-from app.core.logger import get_logger, setup_logging
-from app.database import InsertCharacterSheetinDatabase
+from app.core.logger import get_logger, setup_logging, shutdown_logging
+from app.database import InsertCharacterSheetinDatabase, close_connection
 
 # Initialize logging
 setup_logging(log_level=settings.log_level)
@@ -36,7 +38,8 @@ def create_app() -> FastAPI:
         ),
         docs_url="/docs",
         redoc_url="/redoc",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse
     )
 
     # Configure CORS (adjust origins as needed for production)
@@ -72,16 +75,26 @@ def create_app() -> FastAPI:
         logger.info(f"Output Directory: {settings.output_dir}")
         logger.info("=" * 60)
 
+        # Create output directory if it doesn't exist (Windows compatible)
+        settings.output_dir.mkdir(parents=True, exist_ok=True)
+
         # Validate templates on startup
         try:
-            from app.services.template_manager import TemplateManager
-            template_manager = TemplateManager(settings.templates_dir)
-            template_manager.validate_templates()
+            get_template_manager().validate_templates()
             logger.info("✓ Templates validated successfully")
         except Exception as e:
             logger.error(f"✗ Template validation failed: {str(e)}")
             logger.warning("Application started but template issues detected")
 
+        # Create the Vertex AI client now so the first request does not pay for it
+        try:
+            vertex_client = get_vertex_client()
+            logger.info("✓ Vertex AI client initialized")
+            await vertex_client.warmup()
+        except Exception as e:
+            logger.error(f"✗ Vertex AI client initialization failed: {str(e)}")
+            logger.warning("Client will be retried on the first generation request")
+
     
     # Shutdown event
     @app.on_event("shutdown")
@@ -89,6 +102,17 @@ def create_app() -> FastAPI:
         """Run on application shutdown."""
         logger.info("Character Sheet Generator API Shutting Down")
 
+        # Close the Vertex AI client only if it was ever created
+        if get_vertex_client.cache_info().currsize:
+            await get_vertex_client().aclose()
+            get_vertex_client().close()
+            get_vertex_client.cache_clear()
+
+        # Close the shared SQLite connection
+        close_connection()
+
+        shutdown_logging()
+
     # Root endpoint
     @app.get("/")
     async def root():
@@ -4,9 +4,10 @@ This module defines the Pydantic model representing the complete NPC character s
 structure. This model is used for validation of LLM-generated JSON output.
 """
 
-from typing import List
+from functools import cache
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PsychologicalProfile(BaseModel):
@@ -29,6 +30,8 @@ class PsychologicalProfile(BaseModel):
         description="Character's core values and beliefs"
     )
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class GoalsAndMotivations(BaseModel):
     """Goals and motivations nested model."""
@@ -42,6 +45,8 @@ class GoalsAndMotivations(BaseModel):
         description="Character's immediate short-term goal"
     )
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class Relationship(BaseModel):
     """Character relationship model."""
@@ -59,6 +64,8 @@ class Relationship(BaseModel):
         description="Reason or description of the relationship"
     )
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class KnowledgeBase(BaseModel):
     """Knowledge base nested model."""
@@ -72,6 +79,8 @@ class KnowledgeBase(BaseModel):
         description="Rumors the character has heard"
     )
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class RelationshipsAndKnowledge(BaseModel):
     """Relationships and knowledge nested model."""
@@ -85,6 +94,74 @@ class RelationshipsAndKnowledge(BaseModel):
         description="Character's knowledge of facts and rumors"
     )
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+@cache
+def _character_sheet_examples() -> List[Dict[str, Any]]:
+    """Build the CharacterSheet JSON schema examples (once, on first use).
+
+    Returns:
+        List of example character sheets
+    """
+    return [
+        {
+            "npc_id": "npc_wandering_mage_elara",
+            "name": "Elara",
+            "age": "32",
+            "gender": "Female",
+            "role_title": "Wandering Mage",
+            "faction": "Unaffiliated",
+            "primary_location": "The Great Library",
+            "psychological_profile": {
+                "personality_keywords": ["Prickly", "Scholarly", "Guarded"],
+                "speaking_style": "Curt and dismissive initially, but engages thoughtfully if interested",
+                "example_lines": [
+                    "Unless you have a pre-Cataclysmic tome to discuss, I'm quite busy.",
+                    "That marking... it's from the Sunken City of Aeridor. Where did you see it?"
+                ],
+                "core_values": [
+                    "Knowledge is the only treasure that cannot be stolen.",
+                    "The past must be preserved to prevent its mistakes from being repeated."
+                ]
+            },
+            "goals_and_motivations": {
+                "long_term_goal": "To discover the location of the lost Library of Ashurban",
+                "short_term_goal": "To acquire the 'Star-Chart of the Navigator King'"
+            },
+            "relationships_and_knowledge": {
+                "relationships": [
+                    {
+                        "target_id": "npc_rival_cassian",
+                        "type": "rival",
+                        "reason": "Both seeking the same ancient artifacts"
+                    }
+                ],
+                "knowledge_base": {
+                    "facts": [
+                        "The magical ley lines around Dragon's Tooth Mountains are unusually potent"
+                    ],
+                    "rumors": [
+                        "A rival seeker has found a map piece and is heading towards the Coastal Village"
+                    ]
+                }
+            }
+        }
+    ]
+
+
+def _add_schema_examples(schema: Dict[str, Any]) -> None:
+    """Attach description and examples to the CharacterSheet JSON schema.
+
+    Used as a callable json_schema_extra so the examples literal is only built
+    when the schema is requested (e.g. for /openapi.json), not at import time.
+
+    Args:
+        schema: JSON schema generated for CharacterSheet (modified in place)
+    """
+    schema["description"] = "NPC Character Sheet for Medieval Fantasy RPG"
+    schema["examples"] = _character_sheet_examples()
+
 
 class CharacterSheet(BaseModel):
     """Complete NPC character sheet model (Custom Medieval Fantasy RPG).
@@ -139,51 +216,9 @@ class CharacterSheet(BaseModel):
     )
 
     model_config = {
-        "json_schema_extra": {
-            "description": "NPC Character Sheet for Medieval Fantasy RPG",
-            "examples": [
-                {
-                    "npc_id": "npc_wandering_mage_elara",
-                    "name": "Elara",
-                    "age": "32",
-                    "gender": "Female",
-                    "role_title": "Wandering Mage",
-                    "faction": "Unaffiliated",
-                    "primary_location": "The Great Library",
-                    "psychological_profile": {
-                        "personality_keywords": ["Prickly", "Scholarly", "Guarded"],
-                        "speaking_style": "Curt and dismissive initially, but engages thoughtfully if interested",
-                        "example_lines": [
-                            "Unless you have a pre-Cataclysmic tome to discuss, I'm quite busy.",
-                            "That marking... it's from the Sunken City of Aeridor. Where did you see it?"
-                        ],
-                        "core_values": [
-                            "Knowledge is the only treasure that cannot be stolen.",
-                            "The past must be preserved to prevent its mistakes from being repeated."
-                        ]
-                    },
-                    "goals_and_motivations": {
-                        "long_term_goal": "To discover the location of the lost Library of Ashurban",
-                        "short_term_goal": "To acquire the 'Star-Chart of the Navigator King'"
-                    },
-                    "relationships_and_knowledge": {
-                        "relationships": [
-                            {
-                                "target_id": "npc_rival_cassian",
-                                "type": "rival",
-                                "reason": "Both seeking the same ancient artifacts"
-                            }
-                        ],
-                        "knowledge_base": {
-                            "facts": [
-                                "The magical ley lines around Dragon's Tooth Mountains are unusually potent"
-                            ],
-                            "rumors": [
-                                "A rival seeker has found a map piece and is heading towards the Coastal Village"
-                            ]
-                        }
-                    }
-                }
-            ]
-        }
+        # Reject unknown keys and make instances immutable once validated
+        "extra": "forbid",
+        "frozen": True,
+        # Examples are attached only when the JSON schema is generated
+        "json_schema_extra": _add_schema_examples
     }
@@ -5,7 +5,7 @@ validation and response formatting.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -159,3 +159,39 @@ class HealthResponse(BaseModel):
             ]
         }
     }
+
+
+class BatchCharacterRequest(BaseModel):
+    """Request model for generating several character sheets in one call."""
+
+    characters: List[CharacterRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Character generation requests, processed concurrently"
+    )
+
+
+class BatchCharacterResponse(BaseModel):
+    """Response model for batch character sheet generation.
+
+    Results are returned in request order. A failed item is reported as an
+    ErrorResponse in its slot without failing the whole batch.
+    """
+
+    total: int = Field(
+        ...,
+        description="Number of requested characters"
+    )
+    succeeded: int = Field(
+        ...,
+        description="Number of characters generated successfully"
+    )
+    failed: int = Field(
+        ...,
+        description="Number of characters that failed to generate"
+    )
+    results: List[Union[CharacterResponse, ErrorResponse]] = Field(
+        ...,
+        description="Per-character results, in request order"
+    )
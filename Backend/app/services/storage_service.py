@@ -4,16 +4,122 @@ This module handles saving and retrieving character sheet JSON files with
 Windows-compatible path handling and filename sanitization.
 """
 
+import asyncio
 import json
-from datetime import datetime
+import os
+import tempfile
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library json module
+    orjson = None
 
 from app.core.exceptions import StorageError
 from app.core.logger import get_logger
+from app.models.character_sheet import (
+    CharacterSheet,
+    GoalsAndMotivations,
+    KnowledgeBase,
+    PsychologicalProfile,
+    Relationship,
+    RelationshipsAndKnowledge,
+)
 
 logger = get_logger(__name__)
 
+# Mode for saved sheets (mkstemp would otherwise leave them owner-only)
+_SHEET_FILE_MODE = 0o644
+
+
+def _dumps(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (orjson when available).
+
+    Args:
+        data: Data to serialize
+        pretty: Indent with 2 spaces instead of writing compact JSON
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available).
+
+    Args:
+        raw: UTF-8 encoded JSON document
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _construct_character_sheet(data: Dict[str, Any]) -> CharacterSheet:
+    """Build a CharacterSheet from trusted data without running validation.
+
+    Nested models are constructed explicitly, since model_construct does not
+    recurse into sub-models.
+
+    Args:
+        data: Character sheet data previously written by this service
+
+    Returns:
+        CharacterSheet instance
+    """
+    rel_data = data["relationships_and_knowledge"]
+    return CharacterSheet.model_construct(**{
+        **data,
+        "psychological_profile": PsychologicalProfile.model_construct(
+            **data["psychological_profile"]
+        ),
+        "goals_and_motivations": GoalsAndMotivations.model_construct(
+            **data["goals_and_motivations"]
+        ),
+        "relationships_and_knowledge": RelationshipsAndKnowledge.model_construct(
+            relationships=[
+                Relationship.model_construct(**rel)
+                for rel in rel_data.get("relationships", [])
+            ],
+            knowledge_base=KnowledgeBase.model_construct(**rel_data["knowledge_base"])
+        )
+    })
+
+
+@lru_cache(maxsize=2048)
+def _path_for_cached(output_dir: str, character_id: str) -> Path:
+    """Resolve the JSON file path for a character ID.
+
+    Module-level (rather than a cached method) so the cache does not hold a
+    reference to the service instance.
+
+    Args:
+        output_dir: Storage directory as a string (hashable cache key)
+        character_id: Unique character identifier
+
+    Returns:
+        Path to the character sheet JSON file
+    """
+    return Path(output_dir) / f"{StorageService._sanitize_filename(character_id)}.json"
+
 
 class StorageService:
     """Manages file-based storage of character sheets.
@@ -24,19 +130,24 @@ class StorageService:
 
     # Windows-invalid filename characters
     INVALID_CHARS = '<>:"/\\|?*'
+    # Translation table mapping every invalid character to "_" (single-pass sanitize)
+    _SANITIZE_TABLE = str.maketrans(INVALID_CHARS, "_" * len(INVALID_CHARS))
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, pretty_json: bool = False):
         """Initialize storage service.
 
         Args:
             output_dir: Directory for storing character sheet files (Windows-compatible Path)
+            pretty_json: Write indented JSON by default (for debugging)
         """
         self.output_dir = output_dir
+        self.pretty_json = pretty_json
         # Ensure output directory exists (Windows compatible)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"StorageService initialized with directory: {output_dir}")
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _sanitize_filename(filename: str) -> str:
         """Remove Windows-invalid characters from filename.
 
@@ -50,16 +161,47 @@ class StorageService:
             >>> StorageService._sanitize_filename('char:name?')
             'char_name_'
         """
-        sanitized = filename
-        for char in StorageService.INVALID_CHARS:
-            sanitized = sanitized.replace(char, "_")
-        return sanitized
+        return filename.translate(StorageService._SANITIZE_TABLE)
+
+    @staticmethod
+    def _atomic_write_bytes(file_path: Path, payload: bytes) -> None:
+        """Write bytes to a file atomically.
+
+        The payload goes to a temp file in the same directory, which is then
+        swapped into place with os.replace, so readers never see a partially
+        written sheet.
+
+        Args:
+            file_path: Destination file path
+            payload: File contents
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{file_path.stem}.",
+            suffix=".json.tmp",
+            dir=file_path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mkstemp creates the file 0600; widen it so other
+                # readers (Unity, tooling) can open it
+                if hasattr(os, "fchmod"):
+                    os.fchmod(f.fileno(), _SHEET_FILE_MODE)
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            # Clean up the temp file on any failure
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def save_character_sheet(
         self,
         character_id: str,
         data: Dict[str, Any],
-        overwrite: bool = True
+        overwrite: bool = True,
+        pretty: Optional[bool] = None
     ) -> Path:
         """Save character sheet to JSON file.
 
@@ -67,6 +209,8 @@ class StorageService:
             character_id: Unique character identifier (used as filename)
             data: Character sheet data as dictionary
             overwrite: Whether to overwrite existing file (default: True)
+            pretty: Write indented JSON for human reading
+                (default: the service's pretty_json setting)
 
         Returns:
             Path to the saved JSON file
@@ -79,9 +223,7 @@ class StorageService:
             >>> path = service.save_character_sheet("npc_mage", {...})
         """
         try:
-            # Sanitize filename for Windows compatibility
-            safe_id = self._sanitize_filename(character_id)
-            file_path = self.output_dir / f"{safe_id}.json"
+            file_path = _path_for_cached(str(self.output_dir), character_id)
 
             # Check if file exists and overwrite is False
             if file_path.exists() and not overwrite:
@@ -90,24 +232,25 @@ class StorageService:
                     f"Set overwrite=True to replace it."
                 )
 
-            # Add metadata
-            data_with_metadata = data.copy()
-            data_with_metadata["_metadata"] = {
-                "generated_at": datetime.utcnow().isoformat() + "Z",
-                "schema_version": "2.2",
-                "file_path": str(file_path)
+            # Add metadata (built in one dict literal rather than copy-then-insert)
+            data_with_metadata = {
+                **data,
+                "_metadata": {
+                    "generated_at": datetime.now(timezone.utc).isoformat(
+                        timespec="milliseconds"
+                    ).replace("+00:00", "Z"),
+                    "schema_version": "2.2",
+                    "file_path": str(file_path)
+                }
             }
 
+            if pretty is None:
+                pretty = self.pretty_json
+
             logger.debug(f"Saving character sheet to: {file_path}")
 
-            # Write to file with UTF-8 encoding (Windows compatible)
-            with file_path.open("w", encoding="utf-8") as f:
-                json.dump(
-                    data_with_metadata,
-                    f,
-                    indent=2,
-                    ensure_ascii=False  # Allow Unicode characters
-                )
+            # Write UTF-8 bytes (Windows compatible, Unicode kept unescaped)
+            self._atomic_write_bytes(file_path, _dumps(data_with_metadata, pretty))
 
             logger.info(f"Character sheet saved successfully: {file_path}")
             return file_path
@@ -122,6 +265,43 @@ class StorageService:
         except Exception as e:
             raise StorageError(f"Unexpected error saving character sheet: {str(e)}")
 
+    async def asave_character_sheet(
+        self,
+        character_id: str,
+        data: Dict[str, Any],
+        overwrite: bool = True,
+        pretty: Optional[bool] = None
+    ) -> Path:
+        """Save character sheet without blocking the event loop.
+
+        Runs save_character_sheet (JSON encoding and file write) in a worker
+        thread so other requests are served while the write completes.
+
+        Args:
+            character_id: Unique character identifier (used as filename)
+            data: Character sheet data as dictionary
+            overwrite: Whether to overwrite existing file (default: True)
+            pretty: Write indented JSON for human reading
+                (default: the service's pretty_json setting)
+
+        Returns:
+            Path to the saved JSON file
+
+        Raises:
+            StorageError: If file cannot be saved
+
+        Example:
+            >>> service = StorageService(Path("data/npcs"))
+            >>> path = await service.asave_character_sheet("npc_mage", {...})
+        """
+        return await asyncio.to_thread(
+            self.save_character_sheet,
+            character_id,
+            data,
+            overwrite,
+            pretty
+        )
+
     def load_character_sheet(self, character_id: str) -> Optional[Dict[str, Any]]:
         """Load character sheet from JSON file.
 
@@ -139,9 +319,7 @@ class StorageService:
             >>> data = service.load_character_sheet("npc_mage")
         """
         try:
-            # Sanitize filename
-            safe_id = self._sanitize_filename(character_id)
-            file_path = self.output_dir / f"{safe_id}.json"
+            file_path = _path_for_cached(str(self.output_dir), character_id)
 
             if not file_path.exists():
                 logger.warning(f"Character sheet not found: {file_path}")
@@ -149,9 +327,8 @@ class StorageService:
 
             logger.debug(f"Loading character sheet from: {file_path}")
 
-            # Read from file with UTF-8 encoding
-            with file_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Read raw UTF-8 bytes and parse them in one step
+            data = _loads(file_path.read_bytes())
 
             logger.info(f"Character sheet loaded successfully: {file_path}")
             return data
@@ -161,6 +338,37 @@ class StorageService:
         except Exception as e:
             raise StorageError(f"Failed to load character sheet: {str(e)}")
 
+    def load_character_sheet_as_model(self, character_id: str) -> Optional[CharacterSheet]:
+        """Load a character sheet as a CharacterSheet model without re-validating it.
+
+        Only use this for sheets produced by our own pipeline, which were already
+        checked by Pydantic and CharacterValidator before being saved. External
+        payloads must still go through CharacterSheet.model_validate.
+
+        Args:
+            character_id: Unique character identifier
+
+        Returns:
+            CharacterSheet instance, or None if not found
+
+        Raises:
+            StorageError: If file exists but cannot be loaded
+
+        Example:
+            >>> service = StorageService(Path("data/npcs"))
+            >>> sheet = service.load_character_sheet_as_model("npc_mage")
+        """
+        data = self.load_character_sheet(character_id)
+        if data is None:
+            return None
+
+        data.pop("_metadata", None)
+
+        try:
+            return _construct_character_sheet(data)
+        except (KeyError, TypeError) as e:
+            raise StorageError(f"Malformed character sheet '{character_id}': {str(e)}")
+
     def character_exists(self, character_id: str) -> bool:
         """Check if character sheet file exists.
 
@@ -175,8 +383,7 @@ class StorageService:
             >>> if service.character_exists("npc_mage"):
             ...     print("Character found")
         """
-        safe_id = self._sanitize_filename(character_id)
-        file_path = self.output_dir / f"{safe_id}.json"
+        file_path = _path_for_cached(str(self.output_dir), character_id)
         return file_path.exists()
 
     def delete_character_sheet(self, character_id: str) -> bool:
@@ -196,8 +403,7 @@ class StorageService:
             >>> service.delete_character_sheet("npc_mage")
         """
         try:
-            safe_id = self._sanitize_filename(character_id)
-            file_path = self.output_dir / f"{safe_id}.json"
+            file_path = _path_for_cached(str(self.output_dir), character_id)
 
             if not file_path.exists():
                 logger.warning(f"Character sheet not found for deletion: {file_path}")
@@ -215,9 +421,32 @@ class StorageService:
         except Exception as e:
             raise StorageError(f"Failed to delete character sheet: {str(e)}")
 
-    def list_all_characters(self) -> list[str]:
+    def iter_all_characters(self) -> Iterator[str]:
+        """Yield character IDs that have saved sheets, in directory order.
+
+        Uses os.scandir directly so no Path object is built per entry.
+
+        Yields:
+            Character IDs
+
+        Example:
+            >>> service = StorageService(Path("data/npcs"))
+            >>> for character_id in service.iter_all_characters():
+            ...     print(character_id)
+        """
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # Extract character IDs from filenames (remove .json extension)
+                if name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                    yield name[:-5]
+
+    def list_all_characters(self, ordered: bool = True) -> list[str]:
         """List all character IDs that have saved sheets.
 
+        Args:
+            ordered: Sort the IDs alphabetically (default: True)
+
         Returns:
             List of character IDs
 
@@ -227,11 +456,11 @@ class StorageService:
             >>> print(f"Found {len(characters)} characters")
         """
         try:
-            json_files = self.output_dir.glob("*.json")
-            # Extract character IDs from filenames (remove .json extension)
-            character_ids = [f.stem for f in json_files]
+            character_ids = list(self.iter_all_characters())
             logger.debug(f"Found {len(character_ids)} character sheets")
-            return sorted(character_ids)
+            if ordered:
+                character_ids.sort()
+            return character_ids
 
         except Exception as e:
             logger.error(f"Error listing character sheets: {str(e)}")
@@ -11,6 +11,7 @@ from typing import Any, Dict
 
 from app.core.exceptions import TemplateError
 from app.core.logger import get_logger
+from app.core.utils import convert_schema_text_to_genai
 
 logger = get_logger(__name__)
 
@@ -74,6 +75,35 @@ class TemplateManager:
         except Exception as e:
             raise TemplateError(f"Failed to load system prompt: {str(e)}")
 
+    @lru_cache(maxsize=1)
+    def load_character_schema_text(self) -> str:
+        """Load and cache the raw text of the character sheet JSON schema.
+
+        Returns:
+            Character sheet schema file contents as a string
+
+        Raises:
+            TemplateError: If the schema file cannot be loaded
+
+        Example:
+            >>> manager = TemplateManager(Path("app/templates"))
+            >>> schema_text = manager.load_character_schema_text()
+        """
+        schema_path = self.templates_dir / "character_sheet_schema.json"
+
+        try:
+            logger.debug(f"Loading character schema from: {schema_path}")
+            # Use UTF-8 encoding for Windows compatibility
+            return schema_path.read_text(encoding="utf-8")
+
+        except FileNotFoundError:
+            raise TemplateError(
+                f"Character schema file not found: {schema_path}. "
+                f"Please create 'character_sheet_schema.json' in the templates directory."
+            )
+        except Exception as e:
+            raise TemplateError(f"Failed to load character schema: {str(e)}")
+
     @lru_cache(maxsize=1)
     def load_character_schema(self) -> Dict[str, Any]:
         """Load and cache the character sheet JSON schema.
@@ -88,13 +118,10 @@ class TemplateManager:
             >>> manager = TemplateManager(Path("app/templates"))
             >>> schema = manager.load_character_schema()
         """
-        schema_path = self.templates_dir / "character_sheet_schema.json"
+        schema_text = self.load_character_schema_text()
 
         try:
-            logger.debug(f"Loading character schema from: {schema_path}")
-            # Use UTF-8 encoding for Windows compatibility
-            with schema_path.open(encoding="utf-8") as f:
-                schema = json.load(f)
+            schema = json.loads(schema_text)
 
             if not schema:
                 raise TemplateError("Character schema file is empty")
@@ -106,16 +133,33 @@ class TemplateManager:
             logger.info("Character schema loaded successfully")
             return schema
 
-        except FileNotFoundError:
-            raise TemplateError(
-                f"Character schema file not found: {schema_path}. "
-                f"Please create 'character_sheet_schema.json' in the templates directory."
-            )
         except json.JSONDecodeError as e:
             raise TemplateError(f"Invalid JSON in character schema: {str(e)}")
+        except TemplateError:
+            raise
         except Exception as e:
             raise TemplateError(f"Failed to load character schema: {str(e)}")
 
+    def load_genai_schema(self) -> Dict[str, Any]:
+        """Get the character sheet schema converted to Google GenAI format.
+
+        The conversion is memoized on the raw schema text, so only the first
+        call walks the schema. The returned dict is shared and must not be modified.
+
+        Returns:
+            Character sheet schema in Google GenAI format (uppercase types)
+
+        Raises:
+            TemplateError: If the schema file cannot be loaded or parsed
+
+        Example:
+            >>> manager = TemplateManager(Path("app/templates"))
+            >>> genai_schema = manager.load_genai_schema()
+        """
+        # Validate the schema first (cached after the first call)
+        self.load_character_schema()
+        return convert_schema_text_to_genai(self.load_character_schema_text())
+
     def reload_templates(self) -> None:
         """Clear cache and reload templates.
 
@@ -129,6 +173,7 @@ class TemplateManager:
         """
         logger.info("Clearing template cache")
         self.load_system_prompt.cache_clear()
+        self.load_character_schema_text.cache_clear()
         self.load_character_schema.cache_clear()
         logger.info("Template cache cleared successfully")
 
@@ -149,6 +194,8 @@ class TemplateManager:
         try:
             self.load_system_prompt()
             self.load_character_schema()
+            # Warm the converted schema cache so the first request skips conversion
+            self.load_genai_schema()
             logger.info("All templates validated successfully")
             return True
         except TemplateError as e:
@@ -4,7 +4,10 @@ This module provides business logic validation beyond basic Pydantic schema vali
 It checks for content quality, consistency, and completeness.
 """
 
-from typing import List
+import re
+import sys
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from app.core.exceptions import ValidationError
 from app.core.logger import get_logger
@@ -12,6 +15,162 @@ from app.models.character_sheet import CharacterSheet
 
 logger = get_logger(__name__)
 
+# Matches the first non-whitespace character
+_NONEMPTY = re.compile(r"\S")
+
+# Required top-level string fields and the error reported when one is blank
+_CRITICAL_FIELDS = (
+    ("npc_id", "Character must have a non-empty NPC ID"),
+    ("name", "Character must have a non-empty name"),
+    ("role_title", "Character must have a non-empty role title"),
+    ("faction", "Character must have a non-empty faction"),
+    ("primary_location", "Character must have a non-empty primary location"),
+)
+
+# Per-relationship error templates (formatted only when a check fails)
+_REL_TARGET_EMPTY = sys.intern("Relationship {} must have a non-empty target_id")
+_REL_TYPE_EMPTY = sys.intern("Relationship {} must have a non-empty type")
+_REL_REASON_EMPTY = sys.intern("Relationship {} must have a non-empty reason")
+
+
+def _is_blank(value: Optional[str]) -> bool:
+    """Check whether a string is empty or whitespace-only without copying it.
+
+    Args:
+        value: String to check
+
+    Returns:
+        True if the string is None, empty, or only whitespace
+    """
+    return not value or _NONEMPTY.search(value) is None
+
+
+def _validate_critical_fields(sheet: CharacterSheet) -> Iterator[str]:
+    """Validate that critical fields are not empty.
+
+    Args:
+        sheet: CharacterSheet instance
+
+    Yields:
+        Error messages (nothing if validation passes)
+    """
+    # Check required string fields are not empty
+    for attr, message in _CRITICAL_FIELDS:
+        if _is_blank(getattr(sheet, attr)):
+            yield message
+
+
+def _validate_psychological_profile(sheet: CharacterSheet) -> Iterator[str]:
+    """Validate psychological profile content.
+
+    Args:
+        sheet: CharacterSheet instance
+
+    Yields:
+        Error messages (nothing if validation passes)
+    """
+    profile = sheet.psychological_profile
+    keywords = profile.personality_keywords
+    core_values = profile.core_values
+    example_lines = profile.example_lines
+
+    # Check personality keywords
+    if not keywords or len(keywords) == 0:
+        yield "Character must have at least one personality keyword"
+    else:
+        if any(_is_blank(k) for k in keywords):
+            yield "Personality keywords cannot be empty"
+
+    # Check speaking style
+    if _is_blank(profile.speaking_style):
+        yield "Character must have a non-empty speaking style"
+
+    # Check core values
+    if not core_values or len(core_values) == 0:
+        yield "Character must have at least one core value"
+    else:
+        if any(_is_blank(v) for v in core_values):
+            yield "Core values cannot be empty"
+
+    # Check example lines (optional, but if present shouldn't be empty)
+    if example_lines:
+        if any(_is_blank(line) for line in example_lines):
+            yield "Example dialogue lines cannot be empty"
+
+
+def _validate_goals(sheet: CharacterSheet) -> Iterator[str]:
+    """Validate goals and motivations content.
+
+    Args:
+        sheet: CharacterSheet instance
+
+    Yields:
+        Error messages (nothing if validation passes)
+    """
+    goals = sheet.goals_and_motivations
+
+    # Check long-term goal
+    if _is_blank(goals.long_term_goal):
+        yield "Character must have a non-empty long-term goal"
+
+    # Check short-term goal
+    if _is_blank(goals.short_term_goal):
+        yield "Character must have a non-empty short-term goal"
+
+
+def _validate_relationships_and_knowledge(sheet: CharacterSheet) -> Iterator[str]:
+    """Validate relationships and knowledge base content.
+
+    Args:
+        sheet: CharacterSheet instance
+
+    Yields:
+        Error messages (nothing if validation passes)
+    """
+    data = sheet.relationships_and_knowledge
+    relationships = data.relationships
+    kb = data.knowledge_base
+    facts = kb.facts
+    rumors = kb.rumors
+
+    # Validate relationships (can be empty, but if present must be valid)
+    for i, rel in enumerate(relationships):
+        # Check target_id is not empty
+        if _is_blank(rel.target_id):
+            yield _REL_TARGET_EMPTY.format(i + 1)
+
+        # Check type is not empty
+        if _is_blank(rel.type):
+            yield _REL_TYPE_EMPTY.format(i + 1)
+
+        # Check reason is not empty
+        if _is_blank(rel.reason):
+            yield _REL_REASON_EMPTY.format(i + 1)
+
+    # Validate knowledge base
+    # Check facts (should have at least one)
+    if not facts or len(facts) == 0:
+        yield "Character must have at least one fact in knowledge base"
+    else:
+        if any(_is_blank(f) for f in facts):
+            yield "Knowledge base facts cannot be empty"
+
+    # Check rumors (should have at least one)
+    if not rumors or len(rumors) == 0:
+        yield "Character must have at least one rumor in knowledge base"
+    else:
+        if any(_is_blank(r) for r in rumors):
+            yield "Knowledge base rumors cannot be empty"
+
+
+# Checks run in order by CharacterValidator; each yields error messages
+_VALIDATORS = (
+    _validate_critical_fields,
+    _validate_psychological_profile,
+    _validate_goals,
+    _validate_relationships_and_knowledge,
+)
+
 
 class CharacterValidator:
     """Validates character sheets for business logic and content quality.
@@ -20,12 +179,19 @@ class CharacterValidator:
     to ensure character sheets meet quality standards and business rules.
     """
 
+    # Individual checks (module-level functions, kept here for existing callers)
+    _validate_critical_fields = staticmethod(_validate_critical_fields)
+    _validate_psychological_profile = staticmethod(_validate_psychological_profile)
+    _validate_goals = staticmethod(_validate_goals)
+    _validate_relationships_and_knowledge = staticmethod(_validate_relationships_and_knowledge)
+
     @staticmethod
-    def validate_character_sheet(sheet: CharacterSheet) -> None:
+    def validate_character_sheet(sheet: CharacterSheet, collect_all: bool = False) -> None:
         """Perform comprehensive business logic validation.
 
         Args:
             sheet: CharacterSheet instance to validate
+            collect_all: Report every failed check instead of only the first one
 
         Raises:
             ValidationError: If validation fails with detailed error messages
@@ -36,22 +202,16 @@ class CharacterValidator:
         """
         logger.debug(f"Validating character sheet: {sheet.npc_id}")
 
-        errors: List[str] = []
-
-        # Validate critical fields are not empty
-        errors.extend(CharacterValidator._validate_critical_fields(sheet))
-
-        # Validate psychological profile
-        errors.extend(CharacterValidator._validate_psychological_profile(sheet))
-
-        # Validate goals and motivations
-        errors.extend(CharacterValidator._validate_goals(sheet))
-
-        # Validate relationships and knowledge
-        errors.extend(CharacterValidator._validate_relationships_and_knowledge(sheet))
+        # Run the checks lazily so a valid sheet allocates no error lists and an
+        # invalid one stops at the first failure unless collect_all is requested
+        error_iter = CharacterValidator._iter_errors(sheet)
+        first_error = next(error_iter, None)
 
         # If any errors found, raise ValidationError
-        if errors:
+        if first_error is not None:
+            errors: List[str] = [first_error]
+            if collect_all:
+                errors.extend(error_iter)
             error_message = "; ".join(errors)
             logger.error(f"Validation failed for {sheet.npc_id}: {error_message}")
             raise ValidationError(error_message)
@@ -59,146 +219,58 @@ class CharacterValidator:
         logger.info(f"Character sheet validation passed: {sheet.npc_id}")
 
     @staticmethod
-    def _validate_critical_fields(sheet: CharacterSheet) -> List[str]:
-        """Validate that critical fields are not empty.
+    def validate_batch(
+        sheets: Iterable[CharacterSheet],
+        collect_all: bool = False
+    ) -> List[Tuple[int, str, List[str]]]:
+        """Validate many character sheets without raising.
 
-        Args:
-            sheet: CharacterSheet instance
-
-        Returns:
-            List of error messages (empty if validation passes)
-        """
-        errors = []
-
-        # Check required string fields are not empty
-        if not sheet.npc_id or not sheet.npc_id.strip():
-            errors.append("Character must have a non-empty NPC ID")
-
-        if not sheet.name or not sheet.name.strip():
-            errors.append("Character must have a non-empty name")
-
-        if not sheet.role_title or not sheet.role_title.strip():
-            errors.append("Character must have a non-empty role title")
-
-        if not sheet.faction or not sheet.faction.strip():
-            errors.append("Character must have a non-empty faction")
-
-        if not sheet.primary_location or not sheet.primary_location.strip():
-            errors.append("Character must have a non-empty primary location")
-
-        return errors
-
-    @staticmethod
-    def _validate_psychological_profile(sheet: CharacterSheet) -> List[str]:
-        """Validate psychological profile content.
+        Intended for bulk jobs such as regenerating an NPC corpus, where one bad
+        sheet should not stop the rest. Valid sheets cost a single pass over the
+        lazy error stream and produce no entries.
 
         Args:
-            sheet: CharacterSheet instance
+            sheets: CharacterSheet instances to validate
+            collect_all: Report every failed check per sheet instead of only the first
 
         Returns:
-            List of error messages (empty if validation passes)
-        """
-        errors = []
-        profile = sheet.psychological_profile
-
-        # Check personality keywords
-        if not profile.personality_keywords or len(profile.personality_keywords) == 0:
-            errors.append("Character must have at least one personality keyword")
-        else:
-            empty_keywords = [k for k in profile.personality_keywords if not k or not k.strip()]
-            if empty_keywords:
-                errors.append("Personality keywords cannot be empty")
+            (batch index, npc_id, error messages) for failing sheets only, in
+            batch order. Keyed by index so sheets with a blank or duplicated
+            npc_id are all reported.
 
-        # Check speaking style
-        if not profile.speaking_style or not profile.speaking_style.strip():
-            errors.append("Character must have a non-empty speaking style")
-
-        # Check core values
-        if not profile.core_values or len(profile.core_values) == 0:
-            errors.append("Character must have at least one core value")
-        else:
-            empty_values = [v for v in profile.core_values if not v or not v.strip()]
-            if empty_values:
-                errors.append("Core values cannot be empty")
-
-        # Check example lines (optional, but if present shouldn't be empty)
-        if profile.example_lines:
-            empty_lines = [line for line in profile.example_lines if not line or not line.strip()]
-            if empty_lines:
-                errors.append("Example dialogue lines cannot be empty")
-
-        return errors
-
-    @staticmethod
-    def _validate_goals(sheet: CharacterSheet) -> List[str]:
-        """Validate goals and motivations content.
-
-        Args:
-            sheet: CharacterSheet instance
-
-        Returns:
-            List of error messages (empty if validation passes)
+        Example:
+            >>> failures = CharacterValidator.validate_batch(sheets)
+            >>> for index, npc_id, errors in failures:
+            ...     print(index, npc_id, errors)
         """
-        errors = []
-        goals = sheet.goals_and_motivations
+        failures: List[Tuple[int, str, List[str]]] = []
+        iter_errors = CharacterValidator._iter_errors
 
-        # Check long-term goal
-        if not goals.long_term_goal or not goals.long_term_goal.strip():
-            errors.append("Character must have a non-empty long-term goal")
+        for index, sheet in enumerate(sheets):
+            error_iter = iter_errors(sheet)
+            first_error = next(error_iter, None)
+            if first_error is None:
+                continue
 
-        # Check short-term goal
-        if not goals.short_term_goal or not goals.short_term_goal.strip():
-            errors.append("Character must have a non-empty short-term goal")
+            errors = [first_error]
+            if collect_all:
+                errors.extend(error_iter)
+            failures.append((index, sheet.npc_id, errors))
 
-        return errors
+        logger.info(f"Batch validation finished: {len(failures)} failing sheets")
+        return failures
 
     @staticmethod
-    def _validate_relationships_and_knowledge(sheet: CharacterSheet) -> List[str]:
-        """Validate relationships and knowledge base content.
+    def _iter_errors(sheet: CharacterSheet) -> Iterator[str]:
+        """Chain all validation checks into a single lazy error stream.
 
         Args:
             sheet: CharacterSheet instance
 
-        Returns:
-            List of error messages (empty if validation passes)
+        Yields:
+            Error messages from every check, in order
         """
-        errors = []
-        data = sheet.relationships_and_knowledge
-
-        # Validate relationships (can be empty, but if present must be valid)
-        for i, rel in enumerate(data.relationships):
-            # Check target_id is not empty
-            if not rel.target_id or not rel.target_id.strip():
-                errors.append(f"Relationship {i+1} must have a non-empty target_id")
-
-            # Check type is not empty
-            if not rel.type or not rel.type.strip():
-                errors.append(f"Relationship {i+1} must have a non-empty type")
-
-            # Check reason is not empty
-            if not rel.reason or not rel.reason.strip():
-                errors.append(f"Relationship {i+1} must have a non-empty reason")
-
-        # Validate knowledge base
-        kb = data.knowledge_base
-
-        # Check facts (should have at least one)
-        if not kb.facts or len(kb.facts) == 0:
-            errors.append("Character must have at least one fact in knowledge base")
-        else:
-            empty_facts = [f for f in kb.facts if not f or not f.strip()]
-            if empty_facts:
-                errors.append("Knowledge base facts cannot be empty")
-
-        # Check rumors (should have at least one)
-        if not kb.rumors or len(kb.rumors) == 0:
-            errors.append("Character must have at least one rumor in knowledge base")
-        else:
-            empty_rumors = [r for r in kb.rumors if not r or not r.strip()]
-            if empty_rumors:
-                errors.append("Knowledge base rumors cannot be empty")
-
-        return errors
+        return chain.from_iterable(validate(sheet) for validate in _VALIDATORS)
 
     @staticmethod
     def validate_and_warn(sheet: CharacterSheet) -> List[str]:
@@ -220,13 +292,8 @@ class CharacterValidator:
         """
         logger.debug(f"Performing soft validation: {sheet.npc_id}")
 
-        warnings: List[str] = []
-
         # Collect all validation errors as warnings
-        warnings.extend(CharacterValidator._validate_critical_fields(sheet))
-        warnings.extend(CharacterValidator._validate_psychological_profile(sheet))
-        warnings.extend(CharacterValidator._validate_goals(sheet))
-        warnings.extend(CharacterValidator._validate_relationships_and_knowledge(sheet))
+        warnings: List[str] = list(CharacterValidator._iter_errors(sheet))
 
         if warnings:
             logger.warning(f"Validation warnings for {sheet.npc_id}: {warnings}")
@@ -4,18 +4,20 @@ This module handles communication with Google's Vertex AI Gemini API for
 character sheet generation using structured output with the new GenAI SDK.
 """
 
+import asyncio
 import json
 import os
-import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import httpx
 from google import genai
-from google.genai.types import GenerateContentConfig, GoogleSearch
+from google.genai.types import GenerateContentConfig, GoogleSearch, HttpOptions
+from tenacity import RetryError
 
 from app.config import settings
 from app.core.exceptions import ConfigurationError, LLMGenerationError
+from app.core.llm_utils import llm_retrying
 from app.core.logger import get_logger
-from app.core.utils import convert_openapi_to_genai_schema
 
 logger = get_logger(__name__)
 
@@ -51,7 +53,8 @@ class VertexAIClient:
             self.client = genai.Client(
                 vertexai=True,
                 project=settings.google_cloud_project,
-                location=settings.google_cloud_location
+                location=settings.google_cloud_location,
+                http_options=self._http_options()
             )
 
             logger.info(
@@ -65,7 +68,34 @@ class VertexAIClient:
                 f"Please check your Google Cloud configuration and credentials."
             )
 
-    def generate_character_sheet(
+    @staticmethod
+    def _http_options() -> Optional[HttpOptions]:
+        """Build HTTP options for the async httpx client behind client.aio.
+
+        The pool is sized for concurrent generations and uses HTTP/2 so
+        in-flight calls share one keep-alive connection.
+
+        Returns:
+            HttpOptions, or None (SDK defaults) if the installed google-genai
+            has no async_client_args
+        """
+        if "async_client_args" not in HttpOptions.model_fields:
+            logger.warning(
+                "google-genai does not support async_client_args; "
+                "using the SDK's default HTTP client settings"
+            )
+            return None
+        return HttpOptions(
+            async_client_args={
+                "limits": httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections
+                ),
+                "http2": settings.http2_enabled
+            }
+        )
+
+    async def generate_character_sheet(
         self,
         prompt: str,
         schema: Dict[str, Any]
@@ -77,7 +107,8 @@ class VertexAIClient:
 
         Args:
             prompt: Complete prompt for character generation
-            schema: OpenAPI 3.0 compatible JSON schema for output structure
+            schema: Output structure schema in Google GenAI format
+                (see TemplateManager.load_genai_schema)
 
         Returns:
             Generated character sheet as a dictionary
@@ -87,22 +118,18 @@ class VertexAIClient:
 
         Example:
             >>> client = VertexAIClient()
-            >>> result = client.generate_character_sheet(prompt, schema)
+            >>> result = await client.generate_character_sheet(prompt, schema)
         """
         logger.info("Starting character sheet generation")
         logger.debug(f"Prompt length: {len(prompt)} characters")
 
         try:
-            # Convert OpenAPI schema to GenAI format (uppercase types)
-            genai_schema = convert_openapi_to_genai_schema(schema)
-            logger.debug("Converted schema to GenAI format")
-
             # Configure generation with structured output
             generation_config = GenerateContentConfig(
                 temperature=settings.temperature,
                 max_output_tokens=settings.max_output_tokens,
                 response_mime_type="application/json",
-                response_schema=genai_schema
+                response_schema=schema
             )
 
             logger.debug(
@@ -111,7 +138,7 @@ class VertexAIClient:
             )
 
             # Generate content with retry logic
-            response = self._generate_with_retry(prompt, generation_config)
+            response = await self._generate_with_retry(prompt, generation_config)
 
             # Parse JSON response
             try:
@@ -134,7 +161,7 @@ class VertexAIClient:
             logger.exception("Full error traceback:")
             raise LLMGenerationError(f"Character generation failed: {str(e)}")
 
-    def _generate_with_retry(
+    async def _generate_with_retry(
         self,
         prompt: str,
         generation_config: GenerateContentConfig,
@@ -142,6 +169,10 @@ class VertexAIClient:
     ):
         """Generate content with retry logic for transient failures.
 
+        Uses the SDK's async surface and the shared retry policy from
+        app.core.llm_utils (non-blocking exponential backoff with jitter). Only
+        transient errors are retried (see llm_utils.is_retryable).
+
         Args:
             prompt: Prompt text
             generation_config: Generation configuration
@@ -156,43 +187,87 @@ class VertexAIClient:
         if max_retries is None:
             max_retries = settings.max_retries
 
-        last_error = None
+        try:
+            async for attempt in llm_retrying(max_retries + 1):
+                with attempt:
+                    logger.debug(
+                        f"Generation attempt {attempt.retry_state.attempt_number}/{max_retries + 1}"
+                    )
+
+                    # Use the new GenAI SDK's generate_content method
+                    # (each attempt is capped at settings.api_timeout; a
+                    # timeout is retried like any other transient error)
+                    response = await asyncio.wait_for(
+                        self.client.aio.models.generate_content(
+                            model=settings.gemini_model,
+                            contents=prompt,
+                            config=generation_config
+                        ),
+                        timeout=settings.api_timeout
+                    )
+
+                    # Check if response is valid
+                    if not response or not response.text:
+                        raise LLMGenerationError("Empty response from LLM")
+
+            return response
+
+        except RetryError as e:
+            # All retries failed
+            last_error = e.last_attempt.exception()
+            logger.error(f"All {max_retries + 1} generation attempts failed")
+            raise LLMGenerationError(
+                f"Failed after {max_retries + 1} attempts. Last error: {str(last_error)}"
+            )
 
-        for attempt in range(max_retries + 1):
-            try:
-                logger.debug(f"Generation attempt {attempt + 1}/{max_retries + 1}")
+        except Exception as e:
+            logger.error(f"Non-retryable generation error: {type(e).__name__}")
+            raise LLMGenerationError(f"Generation failed: {str(e)}")
 
-                # Use the new GenAI SDK's generate_content method
-                response = self.client.models.generate_content(
-                    model=settings.gemini_model,
-                    contents=prompt,
-                    config=generation_config
-                )
+    async def warmup(self) -> None:
+        """Open the connection to Vertex AI ahead of the first request.
 
-                # Check if response is valid
-                if not response or not response.text:
-                    raise LLMGenerationError("Empty response from LLM")
+        Issues a lightweight model metadata lookup through the async client,
+        so DNS resolution, the TLS handshake and HTTP/2 session setup happen
+        at startup on the same connection pool that generation calls use.
+        Failures are logged and otherwise ignored.
 
-                logger.debug(f"Generation successful on attempt {attempt + 1}")
-                return response
+        Example:
+            >>> client = VertexAIClient()
+            >>> await client.warmup()
+        """
+        try:
+            logger.info("Warming up Vertex AI connection")
+            await self.client.aio.models.get(model=settings.gemini_model)
+            logger.info("Vertex AI connection warmed up")
 
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    f"Generation attempt {attempt + 1} failed: {str(e)}"
-                )
+        except Exception as e:
+            logger.warning("Vertex AI warmup failed: %s", e)
 
-                # If not the last attempt, wait before retrying
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+    def close(self) -> None:
+        """Release the underlying HTTP connections held by the GenAI client.
 
-        # All retries failed
-        logger.error(f"All {max_retries + 1} generation attempts failed")
-        raise LLMGenerationError(
-            f"Failed after {max_retries + 1} attempts. Last error: {str(last_error)}"
-        )
+        Example:
+            >>> client = VertexAIClient()
+            >>> client.close()
+        """
+        # Client.close() is only available in newer google-genai releases
+        close_client = getattr(self.client, "close", None)
+        if callable(close_client):
+            close_client()
+        logger.info("Vertex AI client closed")
+
+    async def aclose(self) -> None:
+        """Release the pooled async HTTP connections used for generation.
+
+        Example:
+            >>> client = VertexAIClient()
+            >>> await client.aclose()
+        """
+        # AsyncClient.aclose() is only available in newer google-genai releases
+        close_async_client = getattr(self.client.aio, "aclose", None)
+        if callable(close_async_client):
+            await close_async_client()
 
     def test_connection(self) -> bool:
         """Test connection to Vertex AI by generating a simple response.
@@ -0,0 +1,9 @@
+"""Shared pytest setup for the Backend test suite.
+
+app.config builds its settings at import time, so the required Google Cloud
+project is set before any app module is imported.
+"""
+
+import os
+
+os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "test-project")
@@ -0,0 +1,82 @@
+"""Tests for per-item error reporting in the batch generation endpoint."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.api.routes import character
+from app.core.exceptions import LLMGenerationError
+from app.models.schemas import BatchCharacterRequest, CharacterRequest
+from app.services.storage_service import StorageService
+from app.services.validator import CharacterValidator
+
+# A shipped NPC sheet stands in for the Vertex AI output
+SAMPLE_SHEET = (
+    Path(__file__).resolve().parents[3]
+    / "Assets" / "StreamingAssets" / "npcs" / "NPC001_Garon.json"
+)
+
+
+class FakePromptBuilder:
+    def build_character_prompt(self, character_id: str, seed_description: str) -> str:
+        return character_id
+
+
+class FakeTemplateManager:
+    def load_genai_schema(self) -> dict:
+        return {}
+
+
+class FakeVertexClient:
+    """Returns the sample sheet, or fails for character ids marked broken."""
+
+    def __init__(self, sheet: dict):
+        self.sheet = sheet
+
+    async def generate_character_sheet(self, prompt: str, schema: dict) -> dict:
+        if "broken" in prompt:
+            raise LLMGenerationError(f"Generation failed for {prompt}")
+        return dict(self.sheet)
+
+
+@pytest.fixture
+def sample_sheet() -> dict:
+    if not SAMPLE_SHEET.exists():
+        pytest.skip("Sample NPC sheet not available")
+    sheet = json.loads(SAMPLE_SHEET.read_text(encoding="utf-8"))
+    sheet.pop("_metadata", None)
+    return sheet
+
+
+@pytest.mark.asyncio
+async def test_failed_item_is_reported_in_place(monkeypatch, tmp_path, sample_sheet):
+    # Keep the test away from the Unity database
+    monkeypatch.setattr(character, "InsertCharacterSheetinDatabase", lambda data: None)
+    batch = BatchCharacterRequest(characters=[
+        CharacterRequest(character_id="npc_first", seed_description="A gruff but kind blacksmith"),
+        CharacterRequest(character_id="npc_broken", seed_description="A sheet that never arrives"),
+        CharacterRequest(character_id="npc_third", seed_description="Another gruff blacksmith"),
+    ])
+
+    response = await character.generate_character_sheets(
+        batch,
+        template_manager=FakeTemplateManager(),
+        prompt_builder=FakePromptBuilder(),
+        vertex_client=FakeVertexClient(sample_sheet),
+        character_validator=CharacterValidator(),
+        storage_service=StorageService(tmp_path)
+    )
+    body = json.loads(response.body)
+
+    assert (body["total"], body["succeeded"], body["failed"]) == (3, 2, 1)
+    first, broken, third = body["results"]
+    assert first["character_id"] == "npc_first"
+    assert third["character_id"] == "npc_third"
+    assert broken["error_type"] == "character_generation_error"
+    assert broken["details"] == {
+        "character_id": "npc_broken",
+        "exception_type": "LLMGenerationError"
+    }
+    assert (tmp_path / "npc_first.json").exists()
+    assert not (tmp_path / "npc_broken.json").exists()
@@ -0,0 +1,105 @@
+"""Tests for the shared generation semaphore and its queue timeout."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes import character
+from app.models.schemas import CharacterRequest
+
+
+class FakePromptBuilder:
+    def build_character_prompt(self, character_id: str, seed_description: str) -> str:
+        return f"prompt for {character_id}"
+
+
+class FakeTemplateManager:
+    def load_genai_schema(self) -> dict:
+        return {}
+
+
+class UnusedVertexClient:
+    async def generate_character_sheet(self, prompt: str, schema: dict) -> dict:
+        raise AssertionError("Vertex AI must not be called when the queue is full")
+
+
+@pytest.fixture
+def semaphore(monkeypatch):
+    """Replace the shared semaphore with a single-slot one."""
+    sem = asyncio.BoundedSemaphore(1)
+    monkeypatch.setattr(character, "_generation_semaphore", sem)
+    return sem
+
+
+@pytest.mark.asyncio
+async def test_zero_timeout_takes_free_slot(semaphore):
+    assert await character._acquire_generation_slot(0)
+    assert semaphore.locked()
+    semaphore.release()
+
+
+@pytest.mark.asyncio
+async def test_zero_timeout_rejects_when_busy(semaphore):
+    await semaphore.acquire()
+    assert not await character._acquire_generation_slot(0)
+    semaphore.release()
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_timeout_expires_without_leaking_permit(semaphore):
+    await semaphore.acquire()
+    assert not await character._acquire_generation_slot(0.05)
+
+    semaphore.release()
+    await asyncio.sleep(0)
+    # The abandoned waiter must not keep the slot it was handed
+    assert await character._acquire_generation_slot(0)
+    semaphore.release()
+
+
+@pytest.mark.asyncio
+async def test_waits_for_slot_released_in_time(semaphore):
+    await semaphore.acquire()
+    asyncio.get_running_loop().call_later(0.01, semaphore.release)
+    assert await character._acquire_generation_slot(1.0)
+    semaphore.release()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_permit(semaphore):
+    await semaphore.acquire()
+    waiter = asyncio.ensure_future(character._acquire_generation_slot(1.0))
+    await asyncio.sleep(0.01)
+
+    semaphore.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0)
+
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_generate_character_returns_429_when_queue_full(semaphore):
+    await semaphore.acquire()
+    request = CharacterRequest(
+        character_id="npc_busy",
+        seed_description="A blacksmith waiting for a free forge"
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await character._generate_character(
+            request,
+            template_manager=FakeTemplateManager(),
+            prompt_builder=FakePromptBuilder(),
+            vertex_client=UnusedVertexClient(),
+            character_validator=None,
+            storage_service=None,
+            queue_timeout=0
+        )
+
+    assert exc_info.value.status_code == 429
+    semaphore.release()
@@ -10,10 +10,17 @@ This module provides FastAPI endpoints for administrative tasks:
 - Bulk import/export operations
 - System health monitoring
 """
+import asyncio
+import base64
+import heapq
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, Path, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from models.requests import BulkImportRequest, UpdateMemoryRequest
 from models.responses import (
@@ -32,13 +39,16 @@ from models.admin import (
 from models.memory import MemoryEntry, MemoryWithLocation, NPCMemoryStats
 from services.memory_manager import MemoryManager
 from utils.embeddings import EmbeddingService
+from api import cache
+from api.cache import registry_cache
 
 logger = logging.getLogger(__name__)
 
-# Router configuration
+# Router configuration (responses are encoded with orjson)
 router = APIRouter(
     prefix="/admin",
     tags=["Admin Operations"],
+    default_response_class=ORJSONResponse,
     responses={
         400: {"description": "Validation error", "model": ErrorResponse},
         404: {"description": "Resource not found", "model": ErrorResponse},
@@ -52,6 +62,13 @@ _memory_manager: Optional[MemoryManager] = None
 _embedding_service: Optional[EmbeddingService] = None
 _chroma_client: Optional[Any] = None
 
+# Last healthy /health response: (computed_at, response)
+_health_cache: Optional[Tuple[float, HealthResponse]] = None
+_HEALTH_CACHE_TTL = 5.0  # seconds
+
+# Worker threads for reading the recent/buffer/longterm tiers concurrently
+_tier_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="admin-tier")
+
 
 def set_memory_manager(manager: MemoryManager) -> None:
     """Set the global memory manager instance."""
@@ -123,88 +140,128 @@ def get_chroma_client() -> Any:
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_all_memories_with_location(
-    npc_id: str,
-    manager: MemoryManager
-) -> List[MemoryWithLocation]:
+def _with_location(
+    mem: MemoryEntry,
+    location: str,
+    embedding_id: Optional[str] = None
+) -> MemoryWithLocation:
     """
-    Get all memories for an NPC from all storage locations with location metadata.
+    Tag an already validated MemoryEntry with its storage location.
 
-    Args:
-        npc_id: NPC identifier
-        manager: MemoryManager instance
-
-    Returns:
-        List of MemoryWithLocation objects
+    Uses model_construct on the entry's field values, skipping the
+    model_dump() round-trip and re-validation of every field.
     """
-    all_memories: List[MemoryWithLocation] = []
+    return MemoryWithLocation.model_construct(
+        **dict(mem),
+        location=location,
+        embedding_id=embedding_id
+    )
 
-    # Get recent memories
+
+def _fetch_recent_with_location(npc_id: str, manager: MemoryManager) -> List[MemoryWithLocation]:
+    """Get an NPC's recent memories tagged with location "recent"."""
     try:
         recent_memories = manager.recent_service.get_recent(npc_id)
-        for mem in recent_memories:
-            mem_with_loc = MemoryWithLocation(
-                **mem.model_dump(),
-                location="recent",
-                embedding_id=None
-            )
-            all_memories.append(mem_with_loc)
         logger.debug(f"Found {len(recent_memories)} recent memories for {npc_id}")
+        return [_with_location(mem, "recent") for mem in recent_memories]
     except Exception as e:
         logger.warning(f"Error fetching recent memories for {npc_id}: {e}")
+        return []
 
-    # Get buffer memories
+
+def _fetch_buffer_with_location(npc_id: str, manager: MemoryManager) -> List[MemoryWithLocation]:
+    """Get an NPC's buffered memories tagged with location "buffer"."""
     try:
-        buffer_data = manager.longterm_service._load_buffer(npc_id)
-        for mem_dict in buffer_data:
-            # Convert dict to MemoryEntry then to MemoryWithLocation
-            mem_entry = MemoryEntry(**mem_dict)
-            mem_with_loc = MemoryWithLocation(
-                **mem_entry.model_dump(),
-                location="buffer",
-                embedding_id=None
-            )
-            all_memories.append(mem_with_loc)
+        buffer_data = manager.longterm_service.load_buffer_entries(npc_id)
         logger.debug(f"Found {len(buffer_data)} buffer memories for {npc_id}")
+        return [_with_location(mem_entry, "buffer") for mem_entry in buffer_data]
     except Exception as e:
         logger.warning(f"Error fetching buffer memories for {npc_id}: {e}")
+        return []
 
-    # Get longterm memories
+
+def _fetch_longterm_with_location(npc_id: str, manager: MemoryManager) -> List[MemoryWithLocation]:
+    """Get an NPC's long-term memories tagged with location "longterm"."""
     try:
         longterm_memories = manager.longterm_service.get_all_memories(npc_id)
-
-        # Try to get embedding IDs from ChromaDB
-        embedding_ids = {}
-        try:
-            if _chroma_client:
-                collection_name = f"npc_{npc_id}_longterm"
-                collection = _chroma_client.get_or_create_collection(name=collection_name)
-                results = collection.get()
-
-                # Map memory IDs to embedding IDs
-                if results and 'ids' in results and 'metadatas' in results:
-                    for emb_id, metadata in zip(results['ids'], results['metadatas']):
-                        if metadata and 'memory_id' in metadata:
-                            embedding_ids[metadata['memory_id']] = emb_id
-        except Exception as e:
-            logger.warning(f"Could not fetch embedding IDs for {npc_id}: {e}")
-
-        for mem in longterm_memories:
-            emb_id = embedding_ids.get(mem.id)
-            mem_with_loc = MemoryWithLocation(
-                **mem.model_dump(),
-                location="longterm",
-                embedding_id=emb_id
-            )
-            all_memories.append(mem_with_loc)
         logger.debug(f"Found {len(longterm_memories)} longterm memories for {npc_id}")
+
+        # ChromaDB embedding IDs are the memory IDs
+        return [_with_location(mem, "longterm", mem.id) for mem in longterm_memories]
     except Exception as e:
         logger.warning(f"Error fetching longterm memories for {npc_id}: {e}")
+        return []
+
 
-    # Sort by timestamp (newest first)
-    all_memories.sort(key=lambda m: m.timestamp, reverse=True)
+def _newest_first(memories: List[MemoryWithLocation]) -> List[MemoryWithLocation]:
+    """Sort one tier newest first (linear for tiers already in time order)."""
+    return sorted(memories, key=lambda m: m.timestamp, reverse=True)
 
-    return all_memories
+
+_TIER_FETCHERS = (
+    _fetch_recent_with_location,
+    _fetch_buffer_with_location,
+    _fetch_longterm_with_location
+)
+
+
+def get_all_memories_with_location(
+    npc_id: str,
+    manager: MemoryManager
+) -> List[MemoryWithLocation]:
+    """
+    Get all memories for an NPC from all storage locations with location metadata.
+
+    The three tiers are independent (memory, buffer file, ChromaDB), so they
+    are read concurrently on _tier_executor.
+
+    Args:
+        npc_id: NPC identifier
+        manager: MemoryManager instance
+
+    Returns:
+        List of MemoryWithLocation objects
+    """
+    tiers = _tier_executor.map(
+        lambda fetch: _newest_first(fetch(npc_id, manager)),
+        _TIER_FETCHERS
+    )
+
+    # Merge the sorted tiers by timestamp (newest first)
+    return list(heapq.merge(*tiers, key=lambda m: m.timestamp, reverse=True))
+
+
+def _encode_cursor(mem: MemoryEntry, longterm_end: Optional[int]) -> str:
+    """
+    Encode a keyset cursor for the memory after `mem`.
+
+    Format (base64url): "<unix timestamp>|<longterm position or empty>|<memory id>"
+    """
+    end = "" if longterm_end is None else str(longterm_end)
+    raw = f"{mem.timestamp.timestamp()!r}|{end}|{mem.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Tuple[float, str], Optional[int]]:
+    """
+    Decode a keyset cursor into ((timestamp, memory_id), longterm_end).
+
+    Raises:
+        HTTPException: If the cursor is malformed (400)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        timestamp, end, memory_id = raw.split("|", 2)
+        return (float(timestamp), memory_id), (int(end) if end else None)
+    except Exception:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status": "error",
+                "message": "Invalid pagination cursor",
+                "error_code": "INVALID_PAGINATION"
+            }
+        )
 
 
 def find_memory_location(
@@ -224,30 +281,64 @@ def find_memory_location(
         Tuple of (location, MemoryEntry) if found, None otherwise
         location is one of: "recent", "buffer", "longterm"
     """
+    # Try the indexed location first; fall back to scanning on a stale hint
+    indexed = manager.get_indexed_location(memory_id)
+    if indexed is not None and indexed[0] == npc_id:
+        location = indexed[1]
+        try:
+            mem = _lookup_in_location(location, npc_id, memory_id, manager)
+            if mem is not None:
+                return (location, mem)
+        except Exception as e:
+            logger.warning(f"Error searching {location} for {memory_id}: {e}")
+
+    result = _scan_memory_location(npc_id, memory_id, manager)
+    if result is not None:
+        manager.index_location(memory_id, npc_id, result[0])
+    return result
+
+
+def _lookup_in_location(
+    location: str,
+    npc_id: str,
+    memory_id: str,
+    manager: MemoryManager
+) -> Optional[MemoryEntry]:
+    """Look up a memory in one storage location only."""
+    if location == "recent":
+        return manager.recent_service.get_by_id(npc_id, memory_id)
+    if location == "buffer":
+        return manager.longterm_service.get_buffered_by_id(npc_id, memory_id)
+    return manager.longterm_service.get_by_id(npc_id, memory_id)
+
+
+def _scan_memory_location(
+    npc_id: str,
+    memory_id: str,
+    manager: MemoryManager
+) -> Optional[Tuple[str, MemoryEntry]]:
+    """Search recent, buffer and longterm in turn for a memory."""
     # Check recent
     try:
-        recent_memories = manager.recent_service.get_recent(npc_id)
-        for mem in recent_memories:
-            if mem.id == memory_id:
-                return ("recent", mem)
+        mem = manager.recent_service.get_by_id(npc_id, memory_id)
+        if mem is not None:
+            return ("recent", mem)
     except Exception as e:
         logger.warning(f"Error searching recent for {memory_id}: {e}")
 
     # Check buffer
     try:
-        buffer_data = manager.longterm_service._load_buffer(npc_id)
-        for mem_dict in buffer_data:
-            if mem_dict.get('id') == memory_id:
-                return ("buffer", MemoryEntry(**mem_dict))
+        mem = manager.longterm_service.get_buffered_by_id(npc_id, memory_id)
+        if mem is not None:
+            return ("buffer", mem)
     except Exception as e:
         logger.warning(f"Error searching buffer for {memory_id}: {e}")
 
-    # Check longterm (try to get by ID)
+    # Check longterm (direct lookup by ID)
     try:
-        longterm_memories = manager.longterm_service.get_all_memories(npc_id)
-        for mem in longterm_memories:
-            if mem.id == memory_id:
-                return ("longterm", mem)
+        mem = manager.longterm_service.get_by_id(npc_id, memory_id)
+        if mem is not None:
+            return ("longterm", mem)
     except Exception as e:
         logger.warning(f"Error searching longterm for {memory_id}: {e}")
 
@@ -283,27 +374,29 @@ async def list_npcs(
     try:
         logger.info("GET /admin/npcs - retrieving all NPC stats")
 
+        cached = registry_cache.get(cache.NPC_LIST_KEY)
+        if cached is not None:
+            return cached
+
         # Get all NPC IDs
         npc_ids = manager.get_all_npcs()
 
-        # Get stats for each NPC
-        npc_stats_list: List[NPCMemoryStats] = []
-        for npc_id in npc_ids:
-            try:
-                stats = manager.get_stats(npc_id)
-                npc_stats_list.append(stats)
-            except Exception as e:
-                logger.warning(f"Could not get stats for NPC {npc_id}: {e}")
-                continue
+        # Get stats for all NPCs in one bulk pass, off the event loop
+        npc_stats_list: List[NPCMemoryStats] = await asyncio.to_thread(
+            manager.get_stats_bulk, npc_ids
+        )
 
         logger.info(f"Retrieved stats for {len(npc_stats_list)} NPCs")
 
-        return NPCListResponse(
+        response = NPCListResponse(
             status="success",
             message=f"Found {len(npc_stats_list)} NPCs",
             npcs=npc_stats_list,
             total_npcs=len(npc_stats_list)
         )
+        registry_cache.set(cache.NPC_LIST_KEY, response, cache.NPC_LIST_TTL)
+
+        return response
 
     except Exception as e:
         logger.error(f"Error listing NPCs: {e}", exc_info=True)
@@ -329,18 +422,25 @@ async def get_paginated_memories(
     npc_id: str = Path(..., min_length=1, description="NPC identifier"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(50, ge=1, le=100, description="Items per page (max 100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (seeks instead of page offset)"),
     manager: MemoryManager = Depends(get_memory_manager)
 ) -> PaginatedMemories:
     """
     Get paginated memories for an NPC across all storage locations.
 
     Returns memories from recent, buffer, and longterm storage,
-    sorted by timestamp (newest first) with pagination.
+    newest first with pagination. Only the requested page is read
+    from storage (see MemoryManager.get_memories_page).
+
+    The first page and cursor requests use keyset pagination and return
+    next_cursor; following it seeks straight to the next page instead of
+    skipping (page - 1) * limit memories.
 
     Args:
         npc_id: NPC identifier
         page: Page number (starts at 1)
         limit: Number of items per page (1-100)
+        cursor: Optional keyset cursor from a previous response
         manager: Injected MemoryManager dependency
 
     Returns:
@@ -349,15 +449,38 @@ async def get_paginated_memories(
     try:
         logger.info(f"GET /admin/npc/{npc_id}/memories - page {page}, limit {limit}")
 
-        # Get all memories with location metadata
-        all_memories = get_all_memories_with_location(npc_id, manager)
-        total_memories = len(all_memories)
+        cache_key = cache.page_key(npc_id, page, limit, cursor)
+        cached = registry_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        next_cursor = None
+        if cursor is not None or page == 1:
+            before, longterm_end = _decode_cursor(cursor) if cursor else (None, None)
+
+            page_entries, total_memories, longterm_start = await asyncio.to_thread(
+                manager.get_memories_before,
+                npc_id, before=before, longterm_end=longterm_end, limit=limit
+            )
+
+            if len(page_entries) == limit:
+                last_location, last_mem = page_entries[-1]
+                if last_location != "longterm":
+                    next_cursor = _encode_cursor(last_mem, None)
+                elif longterm_start:
+                    next_cursor = _encode_cursor(last_mem, longterm_start)
+        else:
+            # Get the requested page plus the total count
+            page_entries, total_memories = await asyncio.to_thread(
+                manager.get_memories_page,
+                npc_id, offset=(page - 1) * limit, limit=limit
+            )
 
         # Calculate pagination
         total_pages = (total_memories + limit - 1) // limit if total_memories > 0 else 0
 
         # Validate page number
-        if page > total_pages and total_memories > 0:
+        if cursor is None and page > total_pages and total_memories > 0:
             raise HTTPException(
                 status_code=400,
                 detail={
@@ -367,24 +490,29 @@ async def get_paginated_memories(
                 }
             )
 
-        # Calculate slice indices
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_memories = all_memories[start_idx:end_idx]
+        # ChromaDB embedding IDs are the memory IDs
+        paginated_memories = [
+            _with_location(mem, location, mem.id if location == "longterm" else None)
+            for location, mem in page_entries
+        ]
 
         logger.info(
             f"Returning page {page}/{total_pages} "
             f"({len(paginated_memories)}/{total_memories} memories) for {npc_id}"
         )
 
-        return PaginatedMemories(
+        response = PaginatedMemories(
             npc_id=npc_id,
             page=page,
             limit=limit,
             total_memories=total_memories,
             total_pages=total_pages,
-            memories=paginated_memories
+            memories=paginated_memories,
+            next_cursor=next_cursor
         )
+        registry_cache.set(cache_key, response, cache.PAGE_TTL)
+
+        return response
 
     except HTTPException:
         raise
@@ -434,7 +562,7 @@ async def update_memory(
         logger.info(f"PUT /admin/memory/{npc_id}/{memory_id} - updating content")
 
         # Find memory location
-        result = find_memory_location(npc_id, memory_id, manager)
+        result = await asyncio.to_thread(find_memory_location, npc_id, memory_id, manager)
 
         if result is None:
             raise HTTPException(
@@ -470,21 +598,21 @@ async def update_memory(
             logger.info(f"Updated memory {memory_id} in recent storage")
 
         elif location == "buffer":
-            # Update buffer JSON file
-            buffer_data = manager.longterm_service._load_buffer(npc_id)
-            for mem_dict in buffer_data:
-                if mem_dict.get('id') == memory_id:
-                    mem_dict['content'] = request.content
-                    mem_dict['timestamp'] = datetime.now(timezone.utc).isoformat()
-                    if request.metadata is not None:
-                        mem_dict['metadata'] = request.metadata
-                    break
-            manager.longterm_service._save_buffer(npc_id, buffer_data)
+            # Journal the edit instead of rewriting the buffer JSON file.
+            # Edits keep the original timestamp in every tier, so the memory
+            # keeps its place in time order and in pagination.
+            fields = {'content': request.content}
+            if request.metadata is not None:
+                fields['metadata'] = request.metadata
+            await asyncio.to_thread(
+                manager.longterm_service.patch_buffer_item, npc_id, memory_id, fields
+            )
             logger.info(f"Updated memory {memory_id} in buffer")
 
         elif location == "longterm":
             # Update in vector DB (will re-embed)
-            success = manager.longterm_service.update_memory(
+            success = await asyncio.to_thread(
+                manager.longterm_service.update_memory,
                 npc_id=npc_id,
                 memory_id=memory_id,
                 new_content=request.content
@@ -500,6 +628,8 @@ async def update_memory(
                 )
             logger.info(f"Updated memory {memory_id} in longterm storage (re-embedded)")
 
+        registry_cache.invalidate_npc(npc_id)
+
         return BaseResponse(
             status="success",
             message=f"Memory {memory_id} updated successfully in {location} storage"
@@ -550,7 +680,7 @@ async def delete_memory(
         logger.warning(f"DELETE /admin/memory/{npc_id}/{memory_id} - deleting memory")
 
         # Find memory location
-        result = find_memory_location(npc_id, memory_id, manager)
+        result = await asyncio.to_thread(find_memory_location, npc_id, memory_id, manager)
 
         if result is None:
             raise HTTPException(
@@ -581,15 +711,17 @@ async def delete_memory(
             logger.info(f"Deleted memory {memory_id} from recent storage")
 
         elif location == "buffer":
-            # Remove from buffer JSON file
-            buffer_data = manager.longterm_service._load_buffer(npc_id)
-            buffer_data = [m for m in buffer_data if m.get('id') != memory_id]
-            manager.longterm_service._save_buffer(npc_id, buffer_data)
+            # Journal the delete instead of rewriting the buffer JSON file
+            await asyncio.to_thread(
+                manager.longterm_service.delete_buffer_item, npc_id, memory_id
+            )
             logger.info(f"Deleted memory {memory_id} from buffer")
 
         elif location == "longterm":
             # Delete from vector DB
-            success = manager.longterm_service.delete_memory(npc_id, memory_id)
+            success = await asyncio.to_thread(
+                manager.longterm_service.delete_memory, npc_id, memory_id
+            )
             if not success:
                 raise HTTPException(
                     status_code=500,
@@ -601,6 +733,9 @@ async def delete_memory(
                 )
             logger.info(f"Deleted memory {memory_id} from longterm storage")
 
+        manager.forget_location(memory_id)
+        registry_cache.invalidate_npc(npc_id)
+
         return BaseResponse(
             status="success",
             message=f"Memory {memory_id} deleted successfully from {location} storage"
@@ -649,10 +784,13 @@ async def force_embed_buffer(
         logger.info(f"POST /admin/npc/{npc_id}/embed-now - forcing buffer embed")
 
         # Check buffer count before embedding
-        buffer_count_before = manager.longterm_service.get_buffer_count(npc_id)
+        buffer_count_before = await asyncio.to_thread(
+            manager.longterm_service.get_buffer_count, npc_id
+        )
 
         # Force embedding
-        embedded_count = manager.force_embed_buffer(npc_id)
+        embedded_count = await asyncio.to_thread(manager.force_embed_buffer, npc_id)
+        registry_cache.invalidate_npc(npc_id)
 
         buffer_was_empty = (buffer_count_before == 0)
 
@@ -708,7 +846,8 @@ async def clear_npc_memories(
         logger.warning(f"DELETE /admin/npc/{npc_id}/clear - clearing ALL memories")
 
         # Clear all memories
-        result = manager.clear_npc(npc_id)
+        result = await manager.clear_npc(npc_id)
+        registry_cache.invalidate_npc(npc_id)
 
         deleted_recent = result.get("recent", 0)
         deleted_buffer = result.get("buffer", 0)
@@ -755,9 +894,10 @@ async def bulk_import_memories(
     """
     Bulk import memories for an NPC.
 
-    Imports multiple memories at once. Each memory goes through the normal
-    flow (recent → buffer → longterm). Validates each memory individually
-    and continues on errors (partial success is OK).
+    Imports multiple memories at once. Memories go through the normal
+    flow (recent → buffer → longterm) in one batch: one buffer write and
+    at most one embedding pass. Validates each memory individually and
+    continues on errors (partial success is OK).
 
     Args:
         request: Bulk import request with NPC ID and list of memories
@@ -772,30 +912,35 @@ async def bulk_import_memories(
             f"memories for {request.npc_id}"
         )
 
-        imported_count = 0
-        failed_count = 0
-        errors: List[str] = []
-
+        # Validate content up front (memory_data is a dict)
+        failures: List[Tuple[int, str]] = []
+        valid: List[Tuple[int, str, Optional[Dict[str, Any]]]] = []
         for idx, memory_data in enumerate(request.memories):
-            try:
-                # Validate content (memory_data is a dict)
-                content = memory_data.get("content", "")
-                if len(content) < 1 or len(content) > 10000:
-                    raise ValueError("content must be 1-10000 characters")
+            content = memory_data.get("content", "")
+            if isinstance(content, str) and 1 <= len(content) <= 10000:
+                valid.append((idx, content, memory_data.get("metadata")))
+            else:
+                failures.append((idx, "content must be 1-10000 characters"))
 
-                metadata = memory_data.get("metadata")
+        # Add all valid memories to the memory system in one batch
+        result = await asyncio.to_thread(
+            manager.add_memories_bulk,
+            request.npc_id,
+            [(content, metadata) for _, content, metadata in valid]
+        )
+        failures.extend((valid[pos][0], error) for pos, error in result["errors"].items())
 
-                # Add to memory system
-                result = manager.add_memory(request.npc_id, content, metadata)
-                imported_count += 1
+        for idx, error in failures:
+            logger.warning(f"Failed to import memory {idx} for {request.npc_id}: {error}")
 
-                logger.debug(f"Imported memory {idx} for {request.npc_id}: {result['memory_id']}")
+        imported_count = len(result["memory_ids"])
+        failed_count = len(failures)
+        errors = [f"Memory {idx}: {error}" for idx, error in sorted(failures)]
+        if result["embedding_error"]:
+            errors.append(f"Auto-embed failed (memories kept in buffer): {result['embedding_error']}")
 
-            except Exception as e:
-                failed_count += 1
-                error_msg = f"Memory {idx}: {str(e)}"
-                errors.append(error_msg)
-                logger.warning(f"Failed to import memory {idx} for {request.npc_id}: {e}")
+        # Imports can trigger auto-embedding into the longterm collection
+        registry_cache.invalidate_npc(request.npc_id)
 
         logger.info(
             f"Import complete for {request.npc_id}: "
@@ -832,7 +977,7 @@ async def bulk_import_memories(
 async def export_memories(
     npc_id: str = Path(..., min_length=1, description="NPC identifier"),
     manager: MemoryManager = Depends(get_memory_manager)
-) -> ExportData:
+) -> ORJSONResponse:
     """
     Export all memories for an NPC.
 
@@ -844,24 +989,32 @@ async def export_memories(
         manager: Injected MemoryManager dependency
 
     Returns:
-        ExportData with all memories and export metadata
+        ORJSONResponse with the ExportData payload (all memories and export metadata)
     """
     try:
         logger.info(f"GET /admin/export/{npc_id} - exporting all memories")
 
+        cached = registry_cache.get(cache.export_key(npc_id))
+        if cached is not None:
+            return ORJSONResponse(content=cached)
+
         # Get all memories with location metadata
-        all_memories = get_all_memories_with_location(npc_id, manager)
+        all_memories = await asyncio.to_thread(get_all_memories_with_location, npc_id, manager)
+
+        # Memories are already validated: build the ExportData payload as
+        # plain dicts and let orjson encode it, skipping response_model
+        export_data = {
+            "npc_id": npc_id,
+            "exported_at": datetime.now(timezone.utc),
+            "total_memories": len(all_memories),
+            "memories": [dict(mem) for mem in all_memories]
+        }
 
-        export_data = ExportData(
-            npc_id=npc_id,
-            exported_at=datetime.now(timezone.utc),
-            total_memories=len(all_memories),
-            memories=all_memories
-        )
+        registry_cache.set(cache.export_key(npc_id), export_data, cache.EXPORT_TTL)
 
         logger.info(f"Exported {len(all_memories)} memories for {npc_id}")
 
-        return export_data
+        return ORJSONResponse(content=export_data)
 
     except Exception as e:
         logger.error(f"Error exporting memories for {npc_id}: {e}", exc_info=True)
@@ -876,6 +1029,63 @@ async def export_memories(
         )
 
 
+@router.get(
+    "/export/{npc_id}/stream",
+    status_code=200,
+    summary="Stream memory export",
+    description="Export all memories for an NPC as NDJSON, streamed memory by memory."
+)
+async def export_memories_stream(
+    npc_id: str = Path(..., min_length=1, description="NPC identifier"),
+    manager: MemoryManager = Depends(get_memory_manager)
+) -> StreamingResponse:
+    """
+    Stream all memories for an NPC as NDJSON.
+
+    Same content as /admin/export/{npc_id}, but memories are read lazily
+    (long-term in ChromaDB batches) and written one line at a time, so
+    large NPCs never build the full export in memory.
+
+    Args:
+        npc_id: NPC identifier
+        manager: Injected MemoryManager dependency
+
+    Returns:
+        NDJSON stream, one object per line:
+            {"npc_id": ..., "exported_at": ..., "total_memories": ...}   # Header
+            {"id": ..., "content": ..., "location": ..., ...}            # One per memory
+    """
+    logger.info(f"GET /admin/export/{npc_id}/stream - streaming all memories")
+
+    stats = await asyncio.to_thread(manager.get_stats, npc_id)
+
+    # Sync generator: Starlette iterates it in a worker thread
+    def ndjson_lines():
+        yield orjson.dumps({
+            "npc_id": npc_id,
+            "exported_at": datetime.now(timezone.utc),
+            "total_memories": stats.total_count
+        }) + b"\n"
+
+        count = 0
+        try:
+            for location, mem in manager.iter_all_memories(npc_id):
+                yield orjson.dumps({
+                    **dict(mem),
+                    "location": location,
+                    # ChromaDB embedding IDs are the memory IDs
+                    "embedding_id": mem.id if location == "longterm" else None
+                }) + b"\n"
+                count += 1
+        except Exception as e:
+            logger.error(f"Export stream for {npc_id} failed after {count} memories: {e}", exc_info=True)
+            return
+
+        logger.info(f"Streamed {count} memories for {npc_id}")
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -895,6 +1105,9 @@ async def health_check(
     - ChromaDB (connected/disconnected)
     - Recent memory service (operational/unavailable)
 
+    Probes run concurrently. A healthy result is reused for 5 seconds so
+    frequent load-balancer polls don't re-probe every backend.
+
     Args:
         manager: Injected MemoryManager dependency
         embedding_service: Injected EmbeddingService dependency
@@ -905,54 +1118,44 @@ async def health_check(
     try:
         logger.info("GET /admin/health - checking system health")
 
-        health_status = {
-            "status": "healthy",
-            "embedding_service": "unknown",
-            "chromadb": "unknown",
-            "recent_memory": "unknown"
-        }
+        cached = _health_cache
+        if cached is not None and time.monotonic() - cached[0] < _HEALTH_CACHE_TTL:
+            return cached[1]
 
-        # Check embedding service
-        try:
-            if embedding_service.is_loaded():
-                health_status["embedding_service"] = "loaded"
-            else:
-                health_status["embedding_service"] = "unloaded"
-                health_status["status"] = "degraded"
-        except Exception as e:
-            logger.warning(f"Embedding service check failed: {e}")
-            health_status["embedding_service"] = "error"
-            health_status["status"] = "unhealthy"
+        # Probes are independent blocking calls, so run them concurrently
+        (embedding, embedding_status), (chromadb, chroma_status), (recent, recent_status) = (
+            await asyncio.gather(
+                asyncio.to_thread(_check_embedding_service, embedding_service),
+                asyncio.to_thread(_check_chromadb),
+                asyncio.to_thread(_check_recent_memory, manager)
+            )
+        )
 
-        # Check ChromaDB
-        try:
-            if _chroma_client:
-                _chroma_client.list_collections()
-                health_status["chromadb"] = "connected"
-            else:
-                health_status["chromadb"] = "disconnected"
-                health_status["status"] = "unhealthy"
-        except Exception as e:
-            logger.warning(f"ChromaDB check failed: {e}")
-            health_status["chromadb"] = "disconnected"
-            health_status["status"] = "unhealthy"
+        statuses = {embedding_status, chroma_status, recent_status}
+        if "unhealthy" in statuses:
+            status = "unhealthy"
+        elif "degraded" in statuses:
+            status = "degraded"
+        else:
+            status = "healthy"
+
+        response = HealthResponse(
+            status=status,
+            embedding_service=embedding,
+            chromadb=chromadb,
+            recent_memory=recent
+        )
 
-        # Check recent memory service
-        try:
-            # Simple check - try to get count for non-existent NPC
-            manager.recent_service.get_count("_health_check_test")
-            health_status["recent_memory"] = "operational"
-        except Exception as e:
-            logger.warning(f"Recent memory check failed: {e}")
-            health_status["recent_memory"] = "error"
-            health_status["status"] = "unhealthy"
+        logger.info(f"Health check complete: {status}")
 
-        logger.info(f"Health check complete: {health_status['status']}")
+        # Only cache healthy results so a failing probe is rerun immediately
+        _set_health_cache(response if status == "healthy" else None)
 
-        return HealthResponse(**health_status)
+        return response
 
     except Exception as e:
         logger.error(f"Error during health check: {e}", exc_info=True)
+        _set_health_cache(None)
         # Still return a response indicating unhealthy
         return HealthResponse(
             status="unhealthy",
@@ -960,3 +1163,43 @@ async def health_check(
             chromadb="error",
             recent_memory="error"
         )
+
+
+def _set_health_cache(response: Optional[HealthResponse]) -> None:
+    """Cache a health response, or clear the cache when given None."""
+    global _health_cache
+    _health_cache = (time.monotonic(), response) if response is not None else None
+
+
+def _check_embedding_service(embedding_service: EmbeddingService) -> Tuple[str, str]:
+    """Probe the embedding service. Returns (component status, overall status)."""
+    try:
+        if embedding_service.is_loaded():
+            return "loaded", "healthy"
+        return "unloaded", "degraded"
+    except Exception as e:
+        logger.warning(f"Embedding service check failed: {e}")
+        return "error", "unhealthy"
+
+
+def _check_chromadb() -> Tuple[str, str]:
+    """Probe ChromaDB. Returns (component status, overall status)."""
+    try:
+        if _chroma_client:
+            _chroma_client.list_collections()
+            return "connected", "healthy"
+        return "disconnected", "unhealthy"
+    except Exception as e:
+        logger.warning(f"ChromaDB check failed: {e}")
+        return "disconnected", "unhealthy"
+
+
+def _check_recent_memory(manager: MemoryManager) -> Tuple[str, str]:
+    """Probe the recent memory service. Returns (component status, overall status)."""
+    try:
+        # Simple check - try to get count for non-existent NPC
+        manager.recent_service.get_count("_health_check_test")
+        return "operational", "healthy"
+    except Exception as e:
+        logger.warning(f"Recent memory check failed: {e}")
+        return "error", "unhealthy"
@@ -0,0 +1,124 @@
+"""
+Admin Response Cache - Short-lived cache for read-heavy admin endpoints.
+
+The NPC list, memory pages and exports only change when memories are
+added, updated, deleted, embedded or cleared. Responses are cached
+in-process for a few seconds and invalidated on every mutation, with the
+TTL as a safety net for writes that bypass invalidation.
+
+Key layout:
+- mem:npcs:list                                (NPC list)
+- mem:page:{npc_id}:{page}:{limit}:{cursor}    (memory pages)
+- mem:export:{npc_id}                          (exports)
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+NPC_LIST_KEY = "mem:npcs:list"
+
+NPC_LIST_TTL = 20.0  # seconds
+PAGE_TTL = 15.0  # seconds
+EXPORT_TTL = 60.0  # seconds
+
+# Upper bound on cached responses. Cursor pages create a new key per cursor
+# and are rarely read twice, so without a bound they pile up until expiry.
+MAX_ENTRIES = 128
+
+
+def page_key(npc_id: str, page: int, limit: int, cursor: Optional[str]) -> str:
+    """Cache key for one page of an NPC's memories."""
+    return f"mem:page:{npc_id}:{page}:{limit}:{cursor or ''}"
+
+
+def export_key(npc_id: str) -> str:
+    """Cache key for an NPC's export."""
+    return f"mem:export:{npc_id}"
+
+
+class ResponseCache:
+    """
+    Thread-safe in-process key/value cache with per-key TTLs.
+
+    Expired entries are dropped when read and swept when the cache is full.
+    If it is still full after the sweep, the oldest entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached entries
+        """
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            # Re-insert so dict order stays oldest-first
+            self._entries.pop(key, None)
+
+            if len(self._entries) >= self._max_entries:
+                for expired in [k for k, (expires_at, _) in self._entries.items() if now >= expires_at]:
+                    del self._entries[expired]
+            while len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = (now + ttl, value)
+
+    def delete(self, key: str) -> None:
+        """Remove one key (no-op if missing)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Remove every key starting with prefix."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def invalidate_npc(self, npc_id: str) -> None:
+        """
+        Drop everything derived from an NPC's memories (call after any mutation).
+
+        Args:
+            npc_id: NPC identifier
+        """
+        self.invalidate_prefix(f"mem:page:{npc_id}:")
+        self.delete(export_key(npc_id))
+        self.delete(NPC_LIST_KEY)
+
+
+# Global cache instance shared by the API modules
+registry_cache = ResponseCache()
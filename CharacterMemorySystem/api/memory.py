@@ -8,6 +8,7 @@ This module provides FastAPI endpoints for managing NPC memories:
 - Get combined context (recent + relevant)
 - Clear all memories for an NPC
 """
+import asyncio
 import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends, Path, Query
@@ -25,6 +26,7 @@ from models.memory import MemoryEntry, SimilarMemory
 from models.memory import MemoryEntry, SimilarMemory
 from services.memory_manager import MemoryManager
 from config import settings
+from api.cache import registry_cache
 
 logger = logging.getLogger(__name__)
 
@@ -116,14 +118,16 @@ async def add_memory(
         HTTPException: 400 for validation errors, 500 for internal errors
     """
     try:
-        logger.info(f"Adding memory for NPC: {npc_id}")
+        logger.info("Adding memory for NPC: %s", npc_id)
 
         # Add memory via manager
-        result = manager.add_memory(
+        result = await asyncio.to_thread(
+            manager.add_memory,
             npc_id=npc_id,
             content=request.content,
             metadata=request.metadata
         )
+        registry_cache.invalidate_npc(npc_id)
 
         # Build response
         response = AddMemoryResponse(
@@ -196,7 +200,7 @@ async def get_recent_memories(
         HTTPException: 500 for internal errors
     """
     try:
-        logger.info(f"Fetching recent memories for NPC: {npc_id}")
+        logger.info("Fetching recent memories for NPC: %s", npc_id)
 
         # Get context without query (only recent memories)
         context = manager.get_context(npc_id=npc_id, query=None)
@@ -204,7 +208,7 @@ async def get_recent_memories(
         memories = context.get("recent", [])
         count = context.get("recent_count", 0)
 
-        logger.info(f"Retrieved {count} recent memories for NPC {npc_id}")
+        logger.info("Retrieved %d recent memories for NPC %s", count, npc_id)
 
         return RecentMemoryResponse(
             status="success",
@@ -259,17 +263,18 @@ async def search_memories(
         HTTPException: 400 for validation, 404 if no memories, 500 for errors
     """
     try:
-        logger.info(f"Searching memories for NPC {npc_id} with query: '{query[:50]}...'")
+        logger.info("Searching memories for NPC %s with query: '%.50s...'", npc_id, query)
 
         # Search long-term memory
-        results = manager.search_longterm(
+        results = await asyncio.to_thread(
+            manager.search_longterm,
             npc_id=npc_id,
             query=query,
             top_k=top_k
         )
 
         count = len(results)
-        logger.info(f"Found {count} similar memories for NPC {npc_id}")
+        logger.info("Found %d similar memories for NPC %s", count, npc_id)
 
         return SearchMemoryResponse(
             status="success",
@@ -344,7 +349,8 @@ async def get_context(
         )
 
         # Get combined context
-        context = manager.get_context(
+        context = await asyncio.to_thread(
+            manager.get_context,
             npc_id=npc_id,
             query=query,
             top_k=top_k if query else 0
@@ -428,7 +434,8 @@ async def clear_memories(
         logger.warning(f"Clearing all memories for NPC: {npc_id}")
 
         # Clear all memories
-        result = manager.clear_npc(npc_id)
+        result = await manager.clear_npc(npc_id)
+        registry_cache.invalidate_npc(npc_id)
 
         total = result.get("total", 0)
         recent = result.get("recent", 0)
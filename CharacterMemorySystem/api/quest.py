@@ -6,24 +6,34 @@ memory saving to CharacterMemorySystem.
 
 Integration of Backend2 functionality into CharacterMemorySystem.
 """
-import json
+import asyncio
 import logging
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Annotated, Any, Dict, List, Optional, Set
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import Field, TypeAdapter, ValidationError
 
 from services.quest_generator import QuestGeneratorService, QuestContext, get_quest_generator
 from services.memory_manager import MemoryManager
+from api.cache import registry_cache
 
 logger = logging.getLogger(__name__)
 
+# Responses are encoded with orjson; the quest is sent as a JSON object
 router = APIRouter(
     prefix="/quest",
-    tags=["Quest Generation"]
+    tags=["Quest Generation"],
+    default_response_class=ORJSONResponse
 )
 
 # Global memory manager instance (set during application startup)
 _memory_manager: Optional[MemoryManager] = None
 
+# Background quest memory saves still in flight
+_pending_memory_saves: Set[asyncio.Task] = set()
+
 
 def set_memory_manager(manager: MemoryManager) -> None:
     """
@@ -63,9 +73,54 @@ def get_memory_manager() -> MemoryManager:
     return _memory_manager
 
 
-@router.post("/generate")
+# Request bodies are decoded straight from JSON bytes by pydantic-core,
+# skipping FastAPI's intermediate dict parse. The schemas are declared
+# explicitly so the endpoints stay documented in /docs.
+# Batches are capped like the Backend's character batch requests.
+_QUEST_LIST_ADAPTER = TypeAdapter(
+    Annotated[List[QuestContext], Field(min_length=1, max_length=50)]
+)
+
+
+def _json_body(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Build openapi_extra declaring a required JSON request body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}}
+        }
+    }
+
+
+async def parse_quest_context(request: Request) -> QuestContext:
+    """
+    Dependency that validates a QuestContext directly from the raw body.
+    
+    Raises:
+        RequestValidationError: If the body is not a valid QuestContext (422)
+    """
+    try:
+        return QuestContext.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+async def parse_quest_contexts(request: Request) -> List[QuestContext]:
+    """
+    Dependency that validates a list of QuestContext directly from the raw body.
+    
+    Raises:
+        RequestValidationError: If the body is not a list of 1-50 valid contexts (422)
+    """
+    try:
+        return _QUEST_LIST_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+@router.post("/generate", openapi_extra=_json_body(QuestContext.model_json_schema()))
 async def generate_quest(
-    context: QuestContext,
+    context: QuestContext = Depends(parse_quest_context),
     quest_gen: QuestGeneratorService = Depends(get_quest_generator),
     memory_mgr: MemoryManager = Depends(get_memory_manager)
 ):
@@ -75,7 +130,7 @@ async def generate_quest(
     This endpoint:
     1. Receives quest context from Unity (NPCs, location, monster, dungeon, player dialogue)
     2. Generates quest JSON using Gemini AI
-    3. Automatically saves quest memory to NPC's memory system (direct call)
+    3. Queues the quest memory save to NPC's memory system (background task)
     4. Returns quest JSON to Unity
     
     Args:
@@ -85,61 +140,231 @@ async def generate_quest(
     
     Returns:
         {
-            "quest_json": "...",     # Quest JSON string for Unity
-            "memory_saved": bool     # Whether memory was saved successfully
+            "quest": {...},          # Quest object for Unity (QuestData)
+            "memory_queued": bool    # Whether a memory save was queued (false on a cache hit)
         }
     
     Raises:
         HTTPException: If quest generation fails
     """
     try:
-        logger.info(f"Quest generation request for NPC {context.quest_giver_npc_id}")
-        
-        # Generate quest using Gemini
-        result = await quest_gen.generate_quest(context)
-        
-        # Save memory DIRECTLY (no HTTP call!)
-        memory_saved = False
-        if result.get("memory_data"):
-            try:
-                memory_data = result["memory_data"]
-                npc_id = memory_data.get("npc_id")
-                content = memory_data.get("content")
-                
-                if npc_id and content:
-                    # Direct internal call to memory manager
-                    memory_mgr.add_memory(
-                        npc_id=npc_id,
-                        content=content,
-                        metadata={
-                            "source": "quest_generation",
-                            "quest_giver": npc_id,
-                            "player_dialogue": context.player_dialogue if context.player_dialogue else None
-                        }
-                    )
-                    memory_saved = True
-                    logger.info(f"Quest memory saved for NPC {npc_id}")
-                else:
-                    logger.warning(f"Invalid memory data: npc_id={npc_id}, content={content}")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to save quest memory: {e}")
-                # Don't fail quest generation if memory save fails
-        
-        # Return quest JSON to Unity
-        return {
-            "quest_json": json.dumps(result["quest_data"]),
-            "memory_saved": memory_saved
-        }
-        
+        return await _generate_and_save(context, quest_gen, memory_mgr)
+
     except Exception as e:
-        logger.error(f"Quest generation failed: {e}", exc_info=True)
+        logger.error("Quest generation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Quest generation failed: {str(e)}"
         )
 
 
+@router.post("/generate/batch", openapi_extra=_json_body(_QUEST_LIST_ADAPTER.json_schema()))
+async def generate_quest_batch(
+    contexts: List[QuestContext] = Depends(parse_quest_contexts),
+    quest_gen: QuestGeneratorService = Depends(get_quest_generator),
+    memory_mgr: MemoryManager = Depends(get_memory_manager)
+):
+    """
+    Generate several quests concurrently (offline tools / bulk requests).
+    
+    Each context goes through the same workflow as /quest/generate. Gemini
+    calls share the generator's concurrency limit. A failing item is reported
+    in place and does not fail the whole batch.
+    
+    Args:
+        contexts: List of quest generation contexts (1-50 items)
+        quest_gen: Quest generator service (dependency injection)
+        memory_mgr: Memory manager service (dependency injection)
+    
+    Returns:
+        {
+            "results": [...]   # Per-context result or error, in request order
+        }
+    """
+    logger.info("Batch quest generation request: %d contexts", len(contexts))
+    
+    outcomes = await asyncio.gather(
+        *(_generate_and_save(context, quest_gen, memory_mgr) for context in contexts),
+        return_exceptions=True
+    )
+    
+    results = []
+    for context, outcome in zip(contexts, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Batch quest generation failed for NPC %s: %s", context.quest_giver_npc_id, outcome)
+            results.append({
+                "status": "error",
+                "quest_giver_npc_id": context.quest_giver_npc_id,
+                "message": f"Quest generation failed: {str(outcome)}"
+            })
+        else:
+            results.append(outcome)
+    
+    return {"results": results}
+
+
+@router.post("/generate/stream", openapi_extra=_json_body(QuestContext.model_json_schema()))
+async def generate_quest_stream(
+    context: QuestContext = Depends(parse_quest_context),
+    quest_gen: QuestGeneratorService = Depends(get_quest_generator),
+    memory_mgr: MemoryManager = Depends(get_memory_manager)
+):
+    """
+    Generate a quest and stream it to Unity as it is produced.
+    
+    Same workflow as /quest/generate, but the response is NDJSON so the
+    client can start handling output at the first token instead of waiting
+    for the whole quest. The memory save is queued once the quest is complete.
+    
+    Args:
+        context: Quest generation context from Unity
+        quest_gen: Quest generator service (dependency injection)
+        memory_mgr: Memory manager service (dependency injection)
+    
+    Returns:
+        NDJSON stream, one object per line:
+            {"type": "chunk", "text": "..."}          # Quest JSON fragment
+            {"type": "done", "memory_queued": bool}   # Concatenated chunks are complete
+            {"type": "error", "message": "..."}       # Generation failed mid-stream
+    """
+    logger.info("Streaming quest generation request for NPC %s", context.quest_giver_npc_id)
+    
+    async def ndjson_lines():
+        chunks: List[str] = []
+        cache_hit = False
+        try:
+            async for text, cache_hit in quest_gen.stream_quest(context):
+                chunks.append(text)
+                yield orjson.dumps({"type": "chunk", "text": text}) + b"\n"
+            
+            # A cached quest's memory was saved when it was first generated
+            memory_queued = False
+            if not cache_hit:
+                result = orjson.loads("".join(chunks))
+                memory_queued = _schedule_quest_memory_save(result, context, memory_mgr)
+            yield orjson.dumps({"type": "done", "memory_queued": memory_queued}) + b"\n"
+        
+        except Exception as e:
+            logger.error("Streaming quest generation failed: %s", e, exc_info=True)
+            yield orjson.dumps({"type": "error", "message": f"Quest generation failed: {str(e)}"}) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+async def _generate_and_save(
+    context: QuestContext,
+    quest_gen: QuestGeneratorService,
+    memory_mgr: MemoryManager
+) -> Dict[str, Any]:
+    """
+    Generate one quest and queue its memory save.
+    
+    Args:
+        context: Quest generation context from Unity
+        quest_gen: Quest generator service
+        memory_mgr: Memory manager service
+    
+    Returns:
+        {"quest": {...}, "memory_queued": bool}
+    """
+    logger.info("Quest generation request for NPC %s", context.quest_giver_npc_id)
+    
+    # Generate quest using Gemini
+    result = await quest_gen.generate_quest(context)
+    
+    # A cached quest's memory was saved when it was first generated
+    memory_queued = False
+    if not result["cache_hit"]:
+        memory_queued = _schedule_quest_memory_save(result, context, memory_mgr)
+    
+    # Return quest JSON to Unity
+    return {
+        "quest": result["quest_data"],
+        "memory_queued": memory_queued
+    }
+
+
+def _schedule_quest_memory_save(
+    result: Dict[str, Any],
+    context: QuestContext,
+    memory_mgr: MemoryManager
+) -> bool:
+    """
+    Queue the quest's memory_data for saving without delaying the response.
+    
+    Unity does not wait on the memory write, so it runs as a background task;
+    failures are logged by the task instead of failing the quest.
+    
+    Args:
+        result: Generated quest with quest_data and memory_data
+        context: Quest generation context from Unity
+        memory_mgr: Memory manager service
+    
+    Returns:
+        Whether a memory save was queued
+    """
+    memory_data = result.get("memory_data") or {}
+    npc_id = memory_data.get("npc_id")
+    content = memory_data.get("content")
+    
+    if not (npc_id and content):
+        logger.warning("Invalid memory data: npc_id=%s, content=%s", npc_id, content)
+        return False
+    
+    task = asyncio.create_task(_save_quest_memory(npc_id, content, context, memory_mgr))
+    # Keep a reference until done so the task isn't garbage collected
+    _pending_memory_saves.add(task)
+    task.add_done_callback(_pending_memory_saves.discard)
+    return True
+
+
+async def _save_quest_memory(
+    npc_id: str,
+    content: str,
+    context: QuestContext,
+    memory_mgr: MemoryManager
+) -> None:
+    """
+    Save a quest memory to the quest giver's memory (background task).
+    
+    The memory manager does blocking work (buffer file I/O, auto-embedding),
+    so it runs in a worker thread to keep the event loop free.
+    
+    Args:
+        npc_id: NPC that receives the memory
+        content: Memory content
+        context: Quest generation context from Unity
+        memory_mgr: Memory manager service
+    """
+    try:
+        # Direct internal call to memory manager (no HTTP call!), off the event loop
+        await asyncio.to_thread(
+            memory_mgr.add_memory,
+            npc_id=npc_id,
+            content=content,
+            metadata={
+                "source": "quest_generation",
+                "quest_giver": npc_id,
+                "player_dialogue": context.player_dialogue if context.player_dialogue else None
+            }
+        )
+        registry_cache.invalidate_npc(npc_id)
+        logger.info("Quest memory saved for NPC %s", npc_id)
+    
+    except Exception as e:
+        # Don't fail quest generation if memory save fails
+        logger.warning("Failed to save quest memory for NPC %s: %s", npc_id, e)
+
+
+async def drain_pending_memory_saves() -> None:
+    """
+    Wait for queued quest memory saves to finish (called on shutdown).
+    """
+    if _pending_memory_saves:
+        logger.info("Waiting for %d pending quest memory saves", len(_pending_memory_saves))
+        await asyncio.gather(*_pending_memory_saves, return_exceptions=True)
+
+
 @router.get("/health")
 async def quest_health_check():
     """
@@ -99,12 +99,52 @@ class Settings(BaseSettings):
     )
     quest_max_output_tokens: int = Field(
         default=8192,
-        description="Maximum output tokens for quest generation"
+        description="Maximum output tokens for quest generation (includes thinking tokens)"
     )
     quest_generation_enabled: bool = Field(
         default=True,
         description="Enable quest generation functionality"
     )
+    llm_concurrency: int = Field(
+        default=32,
+        description="Maximum number of concurrent Gemini calls for quest generation"
+    )
+    gemini_qpm: int = Field(
+        default=60,
+        description="Gemini requests per minute allowed by the project quota (local rate limit)"
+    )
+    gemini_rate_limit_cooldown_seconds: float = Field(
+        default=10.0,
+        description="Pause before new Gemini calls after a 429 without Retry-After"
+    )
+    llm_max_retries: int = Field(
+        default=3,
+        description="Retry attempts for transient Gemini errors (rate limit, overload, timeout)"
+    )
+    llm_max_backoff_seconds: float = Field(
+        default=30.0,
+        description="Upper bound on the wait between Gemini retry attempts in seconds"
+    )
+    quest_prompt_cache_enabled: bool = Field(
+        default=True,
+        description="Register static quest instructions as Vertex AI cached content"
+    )
+    quest_prompt_cache_ttl_minutes: int = Field(
+        default=60,
+        description="Lifetime of the cached quest instructions in minutes"
+    )
+    quest_response_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse generated quests for identical quest contexts"
+    )
+    quest_response_cache_size: int = Field(
+        default=10_000,
+        description="Maximum number of cached quest responses"
+    )
+    quest_response_cache_ttl_seconds: int = Field(
+        default=86400,
+        description="Lifetime of a cached quest response in seconds"
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
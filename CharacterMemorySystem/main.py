@@ -8,9 +8,12 @@ This module coordinates:
 - Middleware and exception handling
 - Startup and shutdown event management
 """
+import asyncio
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -27,18 +30,41 @@ from utils.embeddings import EmbeddingService
 from api import memory as memory_router_module
 from api import admin as admin_router_module
 from api import quest as quest_router_module  # NEW: Quest generation
+from services.quest_generator import get_quest_generator
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
 
+# Background listener that writes queued log records (stopped on shutdown)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging() -> None:
-    """Configure Python logging with settings from configuration."""
+    """
+    Configure Python logging with settings from configuration.
+
+    Request handlers only enqueue records; a QueueListener thread does the
+    formatting and stream I/O so slow log sinks never block the event loop.
+    """
+    global _log_listener
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        fmt='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper()),
-        format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
     )
+    _log_listener.start()
 
 
 # Initialize logging
@@ -174,6 +200,7 @@ async def startup_event() -> None:
     6. Initialize long-term memory service
     7. Initialize memory manager
     8. Inject dependencies into API routers
+    9. Initialize and warm up the quest generator (if enabled)
     """
     global chroma_client, embedding_service, recent_memory_service
     global longterm_memory_service, memory_manager
@@ -258,6 +285,12 @@ async def startup_event() -> None:
         quest_router_module.set_memory_manager(memory_manager)  # NEW: Quest generation
         logger.info("  Dependencies injected successfully")
 
+        # 9. Initialize quest generator (Vertex AI init, context cache) and warm it up
+        if settings.quest_generation_enabled:
+            logger.info("Initializing Quest Generator...")
+            quest_generator = await asyncio.to_thread(get_quest_generator)
+            await quest_generator.warmup()
+
         # Startup complete
         logger.info("=" * 70)
         logger.info(f"Server ready on http://{settings.api_host}:{settings.api_port}")
@@ -281,14 +314,18 @@ async def shutdown_event() -> None:
     Save state and cleanup on application shutdown.
 
     Tasks:
-    1. Save recent memories to disk
-    2. Log shutdown completion
+    1. Wait for pending quest memory saves
+    2. Save recent memories to disk
+    3. Log shutdown completion
     """
     logger.warning("=" * 70)
     logger.warning("Shutting down server...")
     logger.warning("=" * 70)
 
     try:
+        # Let queued quest memory saves land before backing up
+        await quest_router_module.drain_pending_memory_saves()
+
         # Save recent memories to backup
         if recent_memory_service is not None:
             logger.info(f"Saving recent memories to {settings.recent_memory_backup}...")
@@ -304,6 +341,10 @@ async def shutdown_event() -> None:
     except Exception as e:
         logger.error(f"Error during shutdown: {e}", exc_info=True)
 
+    # Flush queued log records last
+    if _log_listener is not None:
+        _log_listener.stop()
+
 
 # ============================================================================
 # ROUTER REGISTRATION
@@ -362,7 +403,11 @@ if __name__ == "__main__":
     Run the application using uvicorn.
 
     For development: python main.py
-    For production: uvicorn main:app --host 0.0.0.0 --port 8123 --workers 4
+    For production: uvicorn main:app --host 0.0.0.0 --port 8123
+
+    Run a single worker: recent memories and the write lock live in-process
+    and are not shared between worker processes. uvicorn[standard] installs
+    uvloop (non-Windows) and httptools, which uvicorn picks automatically.
     """
     uvicorn.run(
         app,
@@ -207,6 +207,10 @@ class PaginatedMemories(BaseModel):
         default_factory=list,
         description="Memories on this page"
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (pass as ?cursor=), None on the last page"
+    )
 
     class Config:
         json_schema_extra = {
@@ -216,6 +220,7 @@ class PaginatedMemories(BaseModel):
                 "limit": 50,
                 "total_memories": 246,
                 "total_pages": 5,
+                "next_cursor": "MTczMTc1MTIwMC4wfHxtZW1fYWJjMTIz",
                 "memories": [
                     {
                         "id": "mem_abc123",
@@ -7,25 +7,41 @@ This service manages the long-term memory for NPCs using a two-stage approach:
 """
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 
+from pydantic import BaseModel
+
 from models.memory import MemoryEntry, SimilarMemory
 from utils.embeddings import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
 
+class _BufferFile(BaseModel):
+    """On-disk buffer layout; only the memories are validated."""
+
+    memories: List[MemoryEntry] = []
+
+
 class LongTermMemoryService:
     """
     Manages long-term memory storage with buffering and vector embeddings.
 
     Each NPC has:
     - A buffer (JSON file) for memories awaiting embedding
+    - A buffer journal (NDJSON file) of single-item edits not yet
+      compacted into the buffer file
     - A ChromaDB collection for embedded memories
     """
 
+    # Threads used to read many NPCs' buffers/collections at once
+    STATS_WORKERS = 8
+
     def __init__(
         self,
         chroma_client,
@@ -47,6 +63,10 @@ class LongTermMemoryService:
         self.buffer_dir = Path(buffer_dir)
         self.buffer_size = buffer_size
 
+        # Per-NPC id -> memory dict view of the buffer (journal applied)
+        self._buffer_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._buffer_lock = threading.RLock()
+
         # Ensure buffer directory exists
         self.buffer_dir.mkdir(parents=True, exist_ok=True)
 
@@ -59,14 +79,30 @@ class LongTermMemoryService:
         """Get path to buffer file for an NPC."""
         return self.buffer_dir / f"{npc_id}.json"
 
+    def _get_journal_path(self, npc_id: str) -> Path:
+        """Get path to buffer journal file for an NPC."""
+        return self.buffer_dir / f"{npc_id}.buffer.journal.ndjson"
+
     def _get_collection_name(self, npc_id: str) -> str:
         """Get ChromaDB collection name for an NPC."""
         return f"npc_{npc_id}_longterm"
 
+    @staticmethod
+    def _metadata_to_entry(metadata: Dict[str, Any]) -> MemoryEntry:
+        """Build a MemoryEntry from a ChromaDB metadata record."""
+        return MemoryEntry(
+            id=metadata['memory_id'],
+            npc_id=metadata['npc_id'],
+            content=metadata['content'],
+            timestamp=datetime.fromisoformat(metadata['timestamp'])
+        )
+
     def _load_buffer(self, npc_id: str) -> List[Dict[str, Any]]:
         """
         Load buffer from disk for an NPC.
 
+        Pending journal operations are replayed on top of the buffer file.
+
         Returns:
             List of memory dicts, empty list if file doesn't exist
         """
@@ -78,7 +114,43 @@ class LongTermMemoryService:
         try:
             with open(buffer_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return data.get('memories', [])
+            memories = data.get('memories', [])
+
+            journal_path = self._get_journal_path(npc_id)
+            if journal_path.exists():
+                index = {mem['id']: mem for mem in memories}
+                with open(journal_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            self._apply_journal_op(index, json.loads(line))
+                memories = list(index.values())
+
+            return memories
+        except Exception as e:
+            logger.error(f"Failed to load buffer for {npc_id}: {e}")
+            return []
+
+    def load_buffer_entries(self, npc_id: str) -> List[MemoryEntry]:
+        """
+        Load buffer from disk for an NPC as typed MemoryEntry objects.
+
+        The file bytes are validated straight into MemoryEntry objects,
+        skipping the intermediate dicts of _load_buffer. Use this for
+        read-only access; _load_buffer remains for in-place edits.
+
+        Returns:
+            List of MemoryEntry objects, empty list if file doesn't exist
+        """
+        buffer_path = self._get_buffer_path(npc_id)
+
+        if not buffer_path.exists():
+            return []
+
+        try:
+            if self._get_journal_path(npc_id).exists():
+                # Pending edits: build from the journal-applied dicts
+                return [MemoryEntry(**mem) for mem in self._load_buffer(npc_id)]
+            return _BufferFile.model_validate_json(buffer_path.read_bytes()).memories
         except Exception as e:
             logger.error(f"Failed to load buffer for {npc_id}: {e}")
             return []
@@ -87,6 +159,9 @@ class LongTermMemoryService:
         """
         Save buffer to disk for an NPC.
 
+        A full save is also a compaction point: the journal is removed,
+        since the memories passed in already include its edits.
+
         Args:
             npc_id: NPC identifier
             memories: List of memory dicts to save
@@ -100,15 +175,102 @@ class LongTermMemoryService:
                 "last_updated": datetime.now(timezone.utc).isoformat()
             }
 
-            with open(buffer_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            with self._buffer_lock:
+                with open(buffer_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, default=str)
+
+                # Journal ops are idempotent, so a crash before this unlink
+                # only replays edits the new file already contains
+                self._get_journal_path(npc_id).unlink(missing_ok=True)
+                self._buffer_index.pop(npc_id, None)
 
-            logger.debug(f"Saved {len(memories)} memories to buffer for {npc_id}")
+            logger.debug("Saved %d memories to buffer for %s", len(memories), npc_id)
 
         except Exception as e:
             logger.error(f"Failed to save buffer for {npc_id}: {e}")
             raise
 
+    @staticmethod
+    def _apply_journal_op(index: Dict[str, Dict[str, Any]], op: Dict[str, Any]) -> None:
+        """Apply one journal operation to an id -> memory dict index."""
+        if op["op"] == "del":
+            index.pop(op["id"], None)
+        elif op["op"] == "update" and op["id"] in index:
+            index[op["id"]].update(op["fields"])
+
+    def _get_buffer_index(self, npc_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get the id -> memory dict view of an NPC's buffer, loading it on first access."""
+        index = self._buffer_index.get(npc_id)
+        if index is None:
+            index = {mem['id']: mem for mem in self._load_buffer(npc_id)}
+            self._buffer_index[npc_id] = index
+        return index
+
+    def _append_journal(self, npc_id: str, op: Dict[str, Any]) -> None:
+        """
+        Durably append one operation to an NPC's buffer journal.
+
+        Compacts the journal into the buffer file once it grows past twice
+        the buffer file's size.
+        """
+        journal_path = self._get_journal_path(npc_id)
+
+        with open(journal_path, 'ab') as f:
+            f.write(json.dumps(op, default=str).encode('utf-8') + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        if journal_path.stat().st_size > 2 * self._get_buffer_path(npc_id).stat().st_size:
+            logger.debug("Compacting buffer journal for %s", npc_id)
+            self._save_buffer(npc_id, self._load_buffer(npc_id))
+
+    def patch_buffer_item(self, npc_id: str, memory_id: str, fields: Dict[str, Any]) -> bool:
+        """
+        Update fields of one buffered memory without rewriting the buffer.
+
+        The change is appended to the NPC's journal and applied to the
+        in-memory index; the buffer file is rewritten only on compaction.
+
+        Args:
+            npc_id: NPC identifier
+            memory_id: Memory identifier
+            fields: Memory fields to overwrite (e.g. content, timestamp)
+
+        Returns:
+            True if the memory was in the buffer and was updated
+        """
+        with self._buffer_lock:
+            index = self._get_buffer_index(npc_id)
+            if memory_id not in index:
+                return False
+
+            index[memory_id].update(fields)
+            self._append_journal(npc_id, {"op": "update", "id": memory_id, "fields": fields})
+
+        logger.debug("Journaled update of buffered memory %s for %s", memory_id, npc_id)
+        return True
+
+    def delete_buffer_item(self, npc_id: str, memory_id: str) -> bool:
+        """
+        Delete one buffered memory without rewriting the buffer.
+
+        Args:
+            npc_id: NPC identifier
+            memory_id: Memory identifier
+
+        Returns:
+            True if the memory was in the buffer and was deleted
+        """
+        with self._buffer_lock:
+            index = self._get_buffer_index(npc_id)
+            if index.pop(memory_id, None) is None:
+                return False
+
+            self._append_journal(npc_id, {"op": "del", "id": memory_id})
+
+        logger.debug("Journaled delete of buffered memory %s for %s", memory_id, npc_id)
+        return True
+
     def add_to_buffer(self, npc_id: str, memory: MemoryEntry) -> None:
         """
         Add a memory to the buffer.
@@ -119,24 +281,56 @@ class LongTermMemoryService:
             npc_id: NPC identifier
             memory: Memory to add
         """
-        # Load current buffer
-        buffer = self._load_buffer(npc_id)
+        # Hold the buffer lock so journaled edits can't land between load and save
+        with self._buffer_lock:
+            # Load current buffer
+            buffer = self._load_buffer(npc_id)
 
-        # Add new memory
-        buffer.append(memory.model_dump())
+            # Add new memory
+            buffer.append(memory.model_dump())
 
-        # Save updated buffer
-        self._save_buffer(npc_id, buffer)
+            # Save updated buffer
+            self._save_buffer(npc_id, buffer)
 
-        logger.debug(
-            f"Added memory {memory.id} to buffer for {npc_id}. "
-            f"Buffer: {len(buffer)}/{self.buffer_size}"
-        )
+            logger.debug(
+                "Added memory %s to buffer for %s. Buffer: %d/%d",
+                memory.id, npc_id, len(buffer), self.buffer_size
+            )
+
+            # Check if should auto-embed
+            if self._should_embed(npc_id):
+                logger.info(f"Buffer threshold reached for {npc_id}, auto-embedding...")
+                self._embed_buffer(npc_id)
 
-        # Check if should auto-embed
-        if self._should_embed(npc_id):
-            logger.info(f"Buffer threshold reached for {npc_id}, auto-embedding...")
-            self._embed_buffer(npc_id)
+    def add_to_buffer_bulk(self, npc_id: str, memories: List[MemoryEntry]) -> int:
+        """
+        Add several memories to the buffer with a single buffer write.
+
+        If the buffer reaches the threshold, everything buffered is embedded
+        in one batch (one embedding call and one ChromaDB add).
+
+        Args:
+            npc_id: NPC identifier
+            memories: Memories to add, oldest first
+
+        Returns:
+            Number of memories embedded (0 if the threshold wasn't reached)
+        """
+        with self._buffer_lock:
+            buffer = self._load_buffer(npc_id)
+            buffer.extend(memory.model_dump() for memory in memories)
+            self._save_buffer(npc_id, buffer)
+
+            logger.debug(
+                "Added %d memories to buffer for %s. Buffer: %d/%d",
+                len(memories), npc_id, len(buffer), self.buffer_size
+            )
+
+            if len(buffer) >= self.buffer_size:
+                logger.info(f"Buffer threshold reached for {npc_id}, auto-embedding...")
+                return self._embed_buffer(npc_id)
+
+            return 0
 
     def get_buffer_count(self, npc_id: str) -> int:
         """
@@ -333,28 +527,132 @@ class LongTermMemoryService:
             results = collection.get()
 
             # Convert to MemoryEntry objects
-            memories = []
-            for i, memory_id in enumerate(results['ids']):
-                metadata = results['metadatas'][i]
-
-                memory = MemoryEntry(
-                    id=metadata['memory_id'],
-                    npc_id=metadata['npc_id'],
-                    content=metadata['content'],
-                    timestamp=datetime.fromisoformat(metadata['timestamp'])
-                )
-                memories.append(memory)
-
-            return memories
+            return [self._metadata_to_entry(metadata) for metadata in results['metadatas']]
 
         except Exception as e:
             logger.error(f"Failed to get all memories for {npc_id}: {e}")
             return []
 
+    def get_page(
+        self,
+        npc_id: str,
+        limit: int,
+        offset: int = 0,
+        end: Optional[int] = None
+    ) -> Tuple[List[MemoryEntry], int, Optional[int]]:
+        """
+        Get one page of long-term memories, newest first.
+
+        ChromaDB returns items in insertion order and buffers are embedded
+        oldest first, so the page is read backwards from insertion position
+        `end` with get(limit=, offset=) instead of fetching every memory.
+        Passing the previous page's start as `end` seeks straight to the
+        next page; that position is unaffected by newly embedded memories.
+
+        Args:
+            npc_id: NPC identifier
+            limit: Maximum number of memories to return
+            offset: Number of newest memories to skip (when end is None)
+            end: Insertion position to read before (exclusive)
+
+        Returns:
+            Tuple of (memories on the page, total long-term count,
+            insertion position of the oldest returned memory or None)
+        """
+        try:
+            collection = self.chroma_client.get_or_create_collection(
+                name=self._get_collection_name(npc_id)
+            )
+
+            total = collection.count()
+            if end is None:
+                end = total - offset
+            end = min(end, total)
+            if end <= 0 or limit <= 0:
+                return [], total, None
+
+            start = max(end - limit, 0)
+            results = collection.get(limit=end - start, offset=start, include=["metadatas"])
+
+            memories = [self._metadata_to_entry(metadata) for metadata in reversed(results['metadatas'])]
+            return memories, total, start
+
+        except Exception as e:
+            logger.error(f"Failed to get memory page for {npc_id}: {e}")
+            return [], 0, None
+
+    def iter_memories(self, npc_id: str, batch_size: int = 1000) -> Iterator[MemoryEntry]:
+        """
+        Iterate over all long-term memories, newest first.
+
+        Reads the collection batch_size memories at a time with get_page,
+        so at most one batch is held in memory.
+
+        Args:
+            npc_id: NPC identifier
+            batch_size: Number of memories fetched from ChromaDB per batch
+
+        Yields:
+            MemoryEntry objects
+        """
+        end = None
+        while True:
+            memories, _, start = self.get_page(npc_id, batch_size, end=end)
+            yield from memories
+            if not start:
+                return
+            end = start
+
+    def get_buffered_by_id(self, npc_id: str, memory_id: str) -> Optional[MemoryEntry]:
+        """
+        Get a single buffered (not yet embedded) memory by ID.
+
+        Args:
+            npc_id: NPC identifier
+            memory_id: Memory identifier
+
+        Returns:
+            MemoryEntry if found in the buffer, None otherwise
+        """
+        mem_dict = self._get_buffer_index(npc_id).get(memory_id)
+        return MemoryEntry(**mem_dict) if mem_dict is not None else None
+
+    def get_by_id(self, npc_id: str, memory_id: str) -> Optional[MemoryEntry]:
+        """
+        Get a single long-term memory by ID.
+
+        Looks the ID up directly in ChromaDB instead of fetching the
+        whole collection.
+
+        Args:
+            npc_id: NPC identifier
+            memory_id: Memory identifier
+
+        Returns:
+            MemoryEntry if found in long-term storage, None otherwise
+        """
+        try:
+            collection = self.chroma_client.get_or_create_collection(
+                name=self._get_collection_name(npc_id)
+            )
+
+            result = collection.get(ids=[memory_id])
+            if not result['ids']:
+                return None
+
+            return self._metadata_to_entry(result['metadatas'][0])
+
+        except Exception as e:
+            logger.error(f"Failed to get memory {memory_id} for {npc_id}: {e}")
+            return None
+
     def update_memory(self, npc_id: str, memory_id: str, new_content: str) -> bool:
         """
         Update a memory's content and re-embed.
 
+        The original timestamp is preserved, as in recent and buffer
+        storage, so the memory keeps its place in time order.
+
         Args:
             npc_id: NPC identifier
             memory_id: Memory identifier
@@ -381,7 +679,6 @@ class LongTermMemoryService:
             # Update metadata
             metadata = result['metadatas'][0]
             metadata['content'] = new_content
-            metadata['timestamp'] = datetime.now(timezone.utc).isoformat()
 
             # Update in ChromaDB
             collection.update(
@@ -434,7 +731,8 @@ class LongTermMemoryService:
             Number of memories embedded
         """
         logger.info(f"Force embedding requested for {npc_id}")
-        return self._embed_buffer(npc_id)
+        with self._buffer_lock:
+            return self._embed_buffer(npc_id)
 
     def clear_npc(self, npc_id: str) -> Dict[str, int]:
         """
@@ -446,30 +744,54 @@ class LongTermMemoryService:
         Returns:
             Dict with counts of deleted items
         """
-        counts = {"buffer": 0, "longterm": 0}
+        counts = {
+            "buffer": self.clear_buffer(npc_id),
+            "longterm": self.clear_vectors(npc_id)
+        }
 
-        # Clear buffer
-        buffer = self._load_buffer(npc_id)
-        counts["buffer"] = len(buffer)
-        if buffer:
-            self._save_buffer(npc_id, [])
+        logger.info(
+            f"Cleared {counts['buffer']} buffer + {counts['longterm']} "
+            f"longterm memories for {npc_id}"
+        )
+
+        return counts
+
+    def clear_buffer(self, npc_id: str) -> int:
+        """
+        Clear an NPC's embedding buffer.
+
+        Args:
+            npc_id: NPC identifier
+
+        Returns:
+            Number of buffered memories deleted
+        """
+        with self._buffer_lock:
+            buffer = self._load_buffer(npc_id)
+            if buffer:
+                self._save_buffer(npc_id, [])
+            return len(buffer)
+
+    def clear_vectors(self, npc_id: str) -> int:
+        """
+        Delete an NPC's ChromaDB collection.
+
+        Args:
+            npc_id: NPC identifier
 
-        # Delete ChromaDB collection
+        Returns:
+            Number of long-term memories deleted (0 if no collection)
+        """
         try:
             collection_name = self._get_collection_name(npc_id)
             collection = self.chroma_client.get_collection(name=collection_name)
-            counts["longterm"] = collection.count()
+            count = collection.count()
             self.chroma_client.delete_collection(name=collection_name)
-            logger.info(f"Deleted collection '{collection_name}' with {counts['longterm']} memories")
+            logger.info(f"Deleted collection '{collection_name}' with {count} memories")
+            return count
         except Exception as e:
             logger.warning(f"Collection may not exist for {npc_id}: {e}")
-
-        logger.info(
-            f"Cleared {counts['buffer']} buffer + {counts['longterm']} "
-            f"longterm memories for {npc_id}"
-        )
-
-        return counts
+            return 0
 
     def get_stats(self, npc_id: str) -> Dict[str, int]:
         """
@@ -496,3 +818,48 @@ class LongTermMemoryService:
             pass
 
         return stats
+
+    def get_stats_bulk(self, npc_ids: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Get long-term statistics for many NPCs at once.
+
+        Lists the buffer directory and the ChromaDB collections once, then
+        only reads buffers and counts collections that actually exist,
+        instead of probing both stores for every NPC. The remaining per-NPC
+        reads are independent I/O, so they run concurrently on a small
+        thread pool.
+
+        Args:
+            npc_ids: NPC identifiers
+
+        Returns:
+            Dict mapping npc_id to {"buffer_count", "longterm_count"}
+        """
+        buffered = {entry.name for entry in os.scandir(self.buffer_dir) if entry.is_file()}
+
+        try:
+            collections = {
+                collection.name: collection
+                for collection in self.chroma_client.list_collections()
+            }
+        except Exception as e:
+            logger.error(f"Failed to list collections: {e}")
+            collections = {}
+
+        def npc_stats(npc_id: str) -> Dict[str, int]:
+            stats = {"buffer_count": 0, "longterm_count": 0}
+
+            if self._get_buffer_path(npc_id).name in buffered:
+                stats["buffer_count"] = len(self._load_buffer(npc_id))
+
+            collection = collections.get(self._get_collection_name(npc_id))
+            if collection is not None:
+                try:
+                    stats["longterm_count"] = collection.count()
+                except Exception as e:
+                    logger.warning(f"Failed to count collection for {npc_id}: {e}")
+
+            return stats
+
+        with ThreadPoolExecutor(max_workers=self.STATS_WORKERS) as pool:
+            return dict(zip(npc_ids, pool.map(npc_stats, npc_ids)))
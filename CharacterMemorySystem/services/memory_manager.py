@@ -4,9 +4,11 @@ Memory Manager - Orchestration layer for NPC memory system.
 This service coordinates Recent Memory and Long-term Memory services,
 providing a unified interface for memory operations.
 """
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone
+import threading
+from typing import Iterator, Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta, timezone
 
 from models.memory import MemoryEntry, NPCMemoryStats
 from services.recent_memory import RecentMemoryService
@@ -38,8 +40,36 @@ class MemoryManager:
         self.recent_service = recent_service
         self.longterm_service = longterm_service
 
+        # Serializes writes (recent queue + buffer file read-modify-write) so
+        # callers may run them from worker threads as well as the event loop
+        self._write_lock = threading.RLock()
+
+        # memory_id -> (npc_id, location) hint for admin lookups. Entries go
+        # stale when the buffer is embedded; readers verify and re-index.
+        self._location_index: Dict[str, Tuple[str, str]] = {}
+
         logger.info("MemoryManager initialized")
 
+    def get_indexed_location(self, memory_id: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the last known (npc_id, location) of a memory.
+
+        Args:
+            memory_id: Memory identifier
+
+        Returns:
+            Tuple of (npc_id, location), or None if not indexed
+        """
+        return self._location_index.get(memory_id)
+
+    def index_location(self, memory_id: str, npc_id: str, location: str) -> None:
+        """Record where a memory lives ("recent", "buffer" or "longterm")."""
+        self._location_index[memory_id] = (npc_id, location)
+
+    def forget_location(self, memory_id: str) -> None:
+        """Drop a memory from the location index (no-op if missing)."""
+        self._location_index.pop(memory_id, None)
+
     def add_memory(
         self,
         npc_id: str,
@@ -67,53 +97,142 @@ class MemoryManager:
             - evicted_to_buffer: Whether an old memory was evicted
             - buffer_auto_embedded: Whether auto-embed was triggered
         """
-        # Create memory entry
-        memory = MemoryEntry(
-            npc_id=npc_id,
-            content=content,
-            timestamp=datetime.now(timezone.utc),
-            metadata=metadata
-        )
+        with self._write_lock:
+            # Create memory entry
+            memory = MemoryEntry(
+                npc_id=npc_id,
+                content=content,
+                timestamp=datetime.now(timezone.utc),
+                metadata=metadata
+            )
 
-        logger.info(f"Adding memory {memory.id} for NPC {npc_id}")
+            logger.info("Adding memory %s for NPC %s", memory.id, npc_id)
 
-        # Add to recent memory
-        evicted_memory = self.recent_service.add_memory(npc_id, memory)
+            # Add to recent memory
+            evicted_memory = self.recent_service.add_memory(npc_id, memory)
+            self.index_location(memory.id, npc_id, "recent")
 
-        result = {
-            "memory_id": memory.id,
-            "stored_in": "recent",
-            "evicted_to_buffer": False,
-            "buffer_auto_embedded": False
-        }
+            result = {
+                "memory_id": memory.id,
+                "stored_in": "recent",
+                "evicted_to_buffer": False,
+                "buffer_auto_embedded": False
+            }
 
-        # Handle eviction
-        if evicted_memory:
-            logger.debug(
-                f"Memory {evicted_memory.id} evicted from recent, "
-                f"adding to long-term buffer"
-            )
+            # Handle eviction
+            if evicted_memory:
+                logger.debug(
+                    "Memory %s evicted from recent, adding to long-term buffer",
+                    evicted_memory.id
+                )
 
-            # Get buffer count before adding
-            buffer_before = self.longterm_service.get_buffer_count(npc_id)
+                # Get buffer count before adding
+                buffer_before = self.longterm_service.get_buffer_count(npc_id)
 
-            # Add to buffer
-            self.longterm_service.add_to_buffer(npc_id, evicted_memory)
+                # Add to buffer
+                self.longterm_service.add_to_buffer(npc_id, evicted_memory)
+                self.index_location(evicted_memory.id, npc_id, "buffer")
 
-            result["evicted_to_buffer"] = True
+                result["evicted_to_buffer"] = True
 
-            # Check if auto-embed was triggered
-            buffer_after = self.longterm_service.get_buffer_count(npc_id)
+                # Check if auto-embed was triggered
+                buffer_after = self.longterm_service.get_buffer_count(npc_id)
 
-            if buffer_after == 0 and buffer_before > 0:
-                # Buffer was cleared, meaning auto-embed happened
-                result["buffer_auto_embedded"] = True
-                logger.info(
-                    f"Auto-embed triggered for {npc_id}, "
-                    f"{buffer_before} memories embedded"
-                )
+                if buffer_after == 0 and buffer_before > 0:
+                    # Buffer was cleared, meaning auto-embed happened
+                    result["buffer_auto_embedded"] = True
+                    logger.info(
+                        "Auto-embed triggered for %s, %d memories embedded",
+                        npc_id, buffer_before
+                    )
 
-        return result
+            return result
+
+    def add_memories_bulk(
+        self,
+        npc_id: str,
+        items: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """
+        Add many memories for an NPC at once (bulk import).
+
+        Memories go through the same recent -> buffer flow as add_memory,
+        but the recent queue is extended once and evicted memories reach the
+        buffer in a single write. Unlike per-item adds, which embed in
+        threshold-sized chunks and leave a remainder, a buffer that reaches
+        the threshold is embedded whole in one batch. Items that fail
+        validation are reported and skipped. If auto-embedding fails, the
+        memories stay in the buffer and the error is reported alongside the
+        imported IDs.
+
+        Args:
+            npc_id: NPC identifier
+            items: (content, metadata) pairs, oldest first
+
+        Returns:
+            Status dict with:
+            - memory_ids: IDs of created memories, in order
+            - errors: {item index: error message} for skipped items
+            - evicted_to_buffer: Number of memories moved to the buffer
+            - buffer_auto_embedded: Whether auto-embed was triggered
+            - embedding_error: Auto-embed error message, or None
+        """
+        memories: List[MemoryEntry] = []
+        errors: Dict[int, str] = {}
+        last_timestamp = None
+
+        for idx, (content, metadata) in enumerate(items):
+            # Keep timestamps strictly increasing so (timestamp, id) ordering
+            # matches insertion order even within one clock tick
+            timestamp = datetime.now(timezone.utc)
+            if last_timestamp is not None and timestamp <= last_timestamp:
+                timestamp = last_timestamp + timedelta(microseconds=1)
+
+            try:
+                memories.append(MemoryEntry(
+                    npc_id=npc_id,
+                    content=content,
+                    timestamp=timestamp,
+                    metadata=metadata
+                ))
+                last_timestamp = timestamp
+            except Exception as e:
+                errors[idx] = str(e)
+
+        logger.info("Adding %d memories for NPC %s in bulk", len(memories), npc_id)
+
+        with self._write_lock:
+            evicted = self.recent_service.add_memories(npc_id, memories)
+            for memory in memories:
+                self.index_location(memory.id, npc_id, "recent")
+
+            result = {
+                "memory_ids": [memory.id for memory in memories],
+                "errors": errors,
+                "evicted_to_buffer": len(evicted),
+                "buffer_auto_embedded": False,
+                "embedding_error": None
+            }
+
+            if evicted:
+                for memory in evicted:
+                    self.index_location(memory.id, npc_id, "buffer")
+                try:
+                    embedded = self.longterm_service.add_to_buffer_bulk(npc_id, evicted)
+                except RuntimeError as e:
+                    # The buffer is written before embedding, so nothing is lost;
+                    # the next auto-embed or embed-now picks the memories up
+                    logger.error("Auto-embed failed during bulk import for %s: %s", npc_id, e)
+                    result["embedding_error"] = str(e)
+                    embedded = 0
+                if embedded:
+                    result["buffer_auto_embedded"] = True
+                    logger.info(
+                        "Auto-embed triggered for %s, %d memories embedded",
+                        npc_id, embedded
+                    )
+
+            return result
 
     def get_context(
         self,
@@ -138,7 +257,7 @@ class MemoryManager:
             - recent_count: Number of recent memories
             - relevant_count: Number of relevant memories
         """
-        logger.debug(f"Getting context for {npc_id}, query: {query}")
+        logger.debug("Getting context for %s, query: %s", npc_id, query)
 
         # Get recent memories
         recent_memories = self.recent_service.get_recent(npc_id)
@@ -203,14 +322,168 @@ class MemoryManager:
             last_memory_at=last_memory_at
         )
 
-        logger.debug(f"Stats for {npc_id}: {stats.model_dump()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Stats for %s: %s", npc_id, stats.model_dump())
 
         return stats
 
-    def clear_npc(self, npc_id: str) -> Dict[str, int]:
+    def get_memories_page(
+        self,
+        npc_id: str,
+        offset: int,
+        limit: int
+    ) -> Tuple[List[Tuple[str, MemoryEntry]], int]:
+        """
+        Get one page of an NPC's memories across all storage locations.
+
+        Memories are ordered recent, buffer, longterm, newest first within
+        each. Memories move between them oldest first and edits never change
+        a timestamp, so this is the global newest-first timestamp order. Per-location offsets are derived from the counts,
+        so only the requested page is read from ChromaDB.
+
+        Args:
+            npc_id: NPC identifier
+            offset: Number of memories to skip
+            limit: Maximum number of memories to return
+
+        Returns:
+            Tuple of ([(location, MemoryEntry), ...], total memory count)
+        """
+        recent = self.recent_service.get_recent(npc_id)[::-1]
+        buffer = self.longterm_service.load_buffer_entries(npc_id)[::-1]
+
+        page: List[Tuple[str, MemoryEntry]] = []
+        skip = offset
+        for location, memories in (("recent", recent), ("buffer", buffer)):
+            page.extend((location, mem) for mem in memories[skip:skip + limit - len(page)])
+            skip = max(skip - len(memories), 0)
+
+        longterm, longterm_count, _ = self.longterm_service.get_page(
+            npc_id, limit - len(page), offset=skip
+        )
+        page.extend(("longterm", mem) for mem in longterm)
+
+        return page, len(recent) + len(buffer) + longterm_count
+
+    def iter_all_memories(self, npc_id: str) -> Iterator[Tuple[str, MemoryEntry]]:
+        """
+        Lazily iterate over all of an NPC's memories (same order as get_memories_page).
+
+        Long-term memories are read from ChromaDB in batches, so exports
+        never hold the whole collection in memory.
+
+        Args:
+            npc_id: NPC identifier
+
+        Yields:
+            (location, MemoryEntry) tuples
+        """
+        for mem in reversed(self.recent_service.get_recent(npc_id)):
+            yield "recent", mem
+        for mem in reversed(self.longterm_service.load_buffer_entries(npc_id)):
+            yield "buffer", mem
+        for mem in self.longterm_service.iter_memories(npc_id):
+            yield "longterm", mem
+
+    def get_memories_before(
+        self,
+        npc_id: str,
+        before: Optional[Tuple[float, str]],
+        longterm_end: Optional[int],
+        limit: int
+    ) -> Tuple[List[Tuple[str, MemoryEntry]], int, Optional[int]]:
+        """
+        Get one keyset page of an NPC's memories (same order as get_memories_page).
+
+        Recent and buffer memories are filtered by (timestamp, id) < before.
+        Long-term memories are sought by insertion position, ChromaDB's only
+        native order: once a page has reached long-term storage, the next
+        one starts at longterm_end and skips recent/buffer entirely. Before
+        that, long-term reads are filtered by the same key, so memories
+        embedded since the previous page (already listed as recent/buffer)
+        are skipped. They are the newest long-term entries, because timestamps
+        never change and memories are embedded oldest first.
+
+        Args:
+            npc_id: NPC identifier
+            before: (unix timestamp, memory id) of the last memory already seen
+            longterm_end: Insertion position to continue long-term reads from
+            limit: Maximum number of memories to return
+
+        Returns:
+            Tuple of ([(location, MemoryEntry), ...], total memory count,
+            insertion position of the oldest long-term memory returned or None)
+        """
+        recent = self.recent_service.get_recent(npc_id)[::-1]
+        buffer = self.longterm_service.load_buffer_entries(npc_id)[::-1]
+
+        page: List[Tuple[str, MemoryEntry]] = []
+        if longterm_end is None:
+            for location, memories in (("recent", recent), ("buffer", buffer)):
+                page.extend(
+                    (location, mem) for mem in memories
+                    if before is None or (mem.timestamp.timestamp(), mem.id) < before
+                )
+            del page[limit:]
+
+        longterm_count = 0
+        longterm_start = None
+        end = longterm_end
+        while len(page) < limit:
+            longterm, longterm_count, start = self.longterm_service.get_page(
+                npc_id, limit - len(page), end=end
+            )
+            if longterm_end is None and before is not None:
+                longterm = [
+                    mem for mem in longterm
+                    if (mem.timestamp.timestamp(), mem.id) < before
+                ]
+            if longterm:
+                page.extend(("longterm", mem) for mem in longterm)
+                longterm_start = start
+            if not start:
+                break
+            end = start
+
+        return page, len(recent) + len(buffer) + longterm_count, longterm_start
+
+    def get_stats_bulk(self, npc_ids: List[str]) -> List[NPCMemoryStats]:
+        """
+        Get memory statistics for many NPCs in one pass over each store.
+
+        Args:
+            npc_ids: NPC identifiers
+
+        Returns:
+            List of NPCMemoryStats, in the order of npc_ids
+        """
+        longterm_stats = self.longterm_service.get_stats_bulk(npc_ids)
+
+        all_stats = []
+        for npc_id in npc_ids:
+            # Recent memories are ordered oldest to newest
+            recent_memories = self.recent_service.get_recent(npc_id)
+            buffer_count = longterm_stats[npc_id]["buffer_count"]
+            longterm_count = longterm_stats[npc_id]["longterm_count"]
+
+            all_stats.append(NPCMemoryStats(
+                npc_id=npc_id,
+                recent_count=len(recent_memories),
+                buffer_count=buffer_count,
+                longterm_count=longterm_count,
+                total_count=len(recent_memories) + buffer_count + longterm_count,
+                last_memory_at=recent_memories[-1].timestamp if recent_memories else None
+            ))
+
+        return all_stats
+
+    async def clear_npc(self, npc_id: str) -> Dict[str, int]:
         """
         Clear all memories for an NPC (all storage locations).
 
+        Recent queue, buffer file and vector DB are independent, so they
+        are cleared concurrently in worker threads.
+
         Args:
             npc_id: NPC identifier
 
@@ -219,17 +492,24 @@ class MemoryManager:
         """
         logger.warning(f"Clearing ALL memories for NPC {npc_id}")
 
-        # Clear recent memory
-        self.recent_service.clear_npc(npc_id)
+        _, buffer_count, longterm_count = await asyncio.gather(
+            asyncio.to_thread(self._clear_recent, npc_id),
+            asyncio.to_thread(self.longterm_service.clear_buffer, npc_id),
+            asyncio.to_thread(self.longterm_service.clear_vectors, npc_id)
+        )
 
-        # Clear long-term (buffer + vector DB)
-        longterm_counts = self.longterm_service.clear_npc(npc_id)
+        stale = [
+            memory_id for memory_id, (owner, _) in list(self._location_index.items())
+            if owner == npc_id
+        ]
+        for memory_id in stale:
+            self.forget_location(memory_id)
 
         result = {
             "recent": self.recent_service.get_count(npc_id),  # Should be 0
-            "buffer": longterm_counts["buffer"],
-            "longterm": longterm_counts["longterm"],
-            "total": longterm_counts["buffer"] + longterm_counts["longterm"]
+            "buffer": buffer_count,
+            "longterm": longterm_count,
+            "total": buffer_count + longterm_count
         }
 
         logger.info(
@@ -239,6 +519,11 @@ class MemoryManager:
 
         return result
 
+    def _clear_recent(self, npc_id: str) -> None:
+        """Clear an NPC's recent queue without racing add_memory."""
+        with self._write_lock:
+            self.recent_service.clear_npc(npc_id)
+
     def get_all_npcs(self) -> List[str]:
         """
         Get list of all NPCs with memories.
@@ -277,8 +562,7 @@ class MemoryManager:
             "npc_stats": []
         }
 
-        for npc_id in npcs:
-            stats = self.get_stats(npc_id)
+        for stats in self.get_stats_bulk(npcs):
             total_stats["total_recent"] += stats.recent_count
             total_stats["total_buffer"] += stats.buffer_count
             total_stats["total_longterm"] += stats.longterm_count
@@ -303,7 +587,8 @@ class MemoryManager:
             Number of memories embedded
         """
         logger.info(f"Force embedding buffer for {npc_id}")
-        return self.longterm_service.force_embed(npc_id)
+        with self._write_lock:
+            return self.longterm_service.force_embed(npc_id)
 
     def search_longterm(
         self,
@@ -4,23 +4,30 @@ Quest Generation Service using Google Gemini API.
 This service handles:
 - Quest context processing from Unity
 - Gemini API interaction via Vertex AI
-- Quest JSON generation with retry logic
+- Quest JSON generation with schema-constrained output
 - Player dialogue integration
-- Error correction and validation
+- Response validation
 
 Integrated from Backend2 into CharacterMemorySystem.
 """
-import json
-import re
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from datetime import timedelta
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 import random # 임시로 테스트할때 랜덤으로 고르기 위해 추가 
 
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from google.api_core import exceptions as api_exceptions
 import vertexai
-from vertexai.generative_models import GenerativeModel, Part
-from pydantic import BaseModel
+from vertexai.generative_models import GenerationConfig, GenerativeModel, Part
+from pydantic import BaseModel, ConfigDict
 
 from config import settings
+from utils.llm_utils import llm_retrying
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,10 @@ logger = logging.getLogger(__name__)
 
 class QuestContext(BaseModel):
     """Quest generation context received from Unity."""
+    # Immutable once parsed (safe to share/cache); Unity strings arrive untrimmed.
+    # Strict: Unity sends exact JSON types, so validation skips coercion checks.
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, strict=True)
+    
     # Quest Giver NPC (NPC1)
     quest_giver_npc_id: str
     quest_giver_npc_name: str
@@ -129,6 +140,222 @@ QUEST_JSON_FORMAT_EXAMPLE = """
 """
 
 
+# ============================================================================
+# QUEST RESPONSE SCHEMA
+# ============================================================================
+
+# Dialogue line as read by Unity (DialogueLine in QuestData.cs)
+_DIALOGUE_LINE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "speaker_id": {"type": "string"},
+        "line": {"type": "string"}
+    },
+    "required": ["speaker_id", "line"]
+}
+
+# Enforced at decode time via response_schema, so Gemini can only emit
+# parseable JSON with this shape (no regex repair / retry round-trip needed)
+QUEST_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "quest_data": {
+            "type": "object",
+            "properties": {
+                "quest_title": {"type": "string"},
+                "quest_giver_npc_id": {"type": "string"},
+                "quest_type": {"type": "string"},
+                "quest_summary": {"type": "string"},
+                "quest_steps": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "step_id": {"type": "integer"},
+                            "objective_type": {
+                                "type": "string",
+                                "enum": ["TALK", "KILL", "DUNGEON", "GOTO"]
+                            },
+                            "description_for_player": {"type": "string"},
+                            "dialogues": {
+                                "type": "object",
+                                "properties": {
+                                    "on_start": {"type": "array", "items": _DIALOGUE_LINE_SCHEMA},
+                                    "on_complete": {"type": "array", "items": _DIALOGUE_LINE_SCHEMA}
+                                },
+                                "required": ["on_start", "on_complete"]
+                            },
+                            "details": {
+                                "type": "object",
+                                "properties": {
+                                    "target_npc_id": {"type": "string", "nullable": True},
+                                    "target_location_id": {"type": "string", "nullable": True},
+                                    "target_monster_id": {"type": "string", "nullable": True},
+                                    "target_dungeon_id": {"type": "string", "nullable": True}
+                                }
+                            }
+                        },
+                        "required": [
+                            "step_id", "objective_type", "description_for_player",
+                            "dialogues", "details"
+                        ]
+                    }
+                },
+                "quest_rewards": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["quest_title", "quest_giver_npc_id", "quest_type", "quest_summary", "quest_steps"]
+        },
+        "memory_data": {
+            "type": "object",
+            "properties": {
+                "npc_id": {"type": "string"},
+                "content": {"type": "string"}
+            },
+            "required": ["npc_id", "content"]
+        }
+    },
+    "required": ["quest_data", "memory_data"]
+}
+
+# The schema lets decoding stop as soon as the object is closed; the token
+# ceiling bounds over-generating runs (quest JSON is well under it)
+_GENERATION_CONFIG = GenerationConfig(
+    temperature=settings.quest_temperature,
+    max_output_tokens=settings.quest_max_output_tokens,
+    response_mime_type="application/json",
+    response_schema=QUEST_RESPONSE_SCHEMA
+)
+
+def _strip_fence(text: str) -> str:
+    """
+    Extract JSON from a fenced markdown block, if the model wrapped it in one.
+    
+    Uses str.find and a single slice rather than split(), so the (multi-KB)
+    response is scanned once and only the result is copied.
+    
+    Args:
+        text: Raw response text from Gemini
+    
+    Returns:
+        Fence contents, or the stripped text when no fence is present
+    """
+    start = text.find("```json")
+    if start >= 0:
+        start += 7
+    else:
+        start = text.find("```")
+        if start < 0:
+            return text.strip()
+        start += 3
+    
+    end = text.find("```", start)
+    return (text[start:end] if end >= 0 else text[start:]).strip()
+
+
+# ============================================================================
+# STATIC QUEST INSTRUCTIONS (shared prompt prefix)
+# ============================================================================
+
+# 여기에 게임의 전체적인 스토리나 분위기를 적으세요.
+STORY_CONTEXT = """
+    **GAME SETTING**: A dark medieval fantasy world'.
+    **CURRENT ATMOSPHERE**: Tension is high. The forest is becoming dangerous.
+    **LORE**: Long ago, the ancient kingdom fell due to betrayal. Now, monsters are agitated by the approaching eclipse.
+    """
+
+# Identical for every request, so it is registered once as Vertex AI cached
+# content (or at least sent as a stable prefix) instead of being re-sent per call.
+QUEST_SYSTEM_INSTRUCTION = f"""
+    You are a Master Quest Designer for a **Medieval Fantasy RPG**.
+    
+    *** WORLD STORY & LORE ***
+    {STORY_CONTEXT}
+
+    *** CRITICAL RULES ***
+    Rule 0 (the theme for this quest) is given with each request and has the HIGHEST PRIORITY.
+
+    1. **Intelligent Selection**: 
+       - From the `AVAILABLE RESOURCES` list in the request, **YOU (the AI) MUST SELECT 0 to 3 items** that best fit the Theme and Story.
+       - Do NOT use everything. Only use what makes sense.
+       - If the Player Input implies fighting, pick a Monster.
+       - If the Player Input implies exploration, pick a Dungeon.
+       - Always include the 'Target NPC' if one is listed.
+
+    1-2. **Exclusion of Unavailable Resources**:
+        - You can use the 'INTERACTION UNAVAILABLE RESOURCES' list for story flavor, but you CANNOT make them direct objectives. 
+        - It means you cannot have objectives like "Go to LANDMARK" or "Talk to LANDMARK".
+        - But you can mention them in dialogues or quest summaries.
+        - For example, some NPC has a shack. Shack is a landmark. You can make a dialogue like "I live near the old shack, and I need to fix it. Can you help me?" And you can make an objective like "Talk to NPC to get wood planks to fix the shack.", but you cannot make an objective like "Go to the shack and fix it."
+
+    2. **The "Bridge" Rule (Causality)**: 
+       - Every dialogue MUST explain *why* the player needs to do the NEXT objective.
+       - Connect the selected resources to the Quest Giver's problem and the World Lore.
+
+    3. **Mandatory Structure**:
+       - **Step 1**: Interaction with Quest Giver.
+       - **Middle Steps**: Steps for the resources YOU SELECTED (Kill X, Go to Y, Talk to Z).
+       - **Final Step**: MUST return to the Quest Giver (ID given in the request).
+
+    4. **JSON Keys**:
+       - KILL -> `target_monster_id`
+       - DUNGEON -> `target_dungeon_id`
+       - TALK -> `target_npc_id`
+       - GOTO -> `target_location_id`
+
+    5. **Output**: A single JSON object with `quest_data` and `memory_data`.
+    6. **Language**: KOREAN ONLY. Use a tone appropriate for the Medieval Fantasy setting.
+
+    *** JSON OUTPUT FORMAT ***
+    {QUEST_JSON_FORMAT_EXAMPLE}
+    """
+
+
+# ============================================================================
+# PER-REQUEST PROMPT TEMPLATES
+# ============================================================================
+
+# Built once at import; _create_quest_prompt only fills in the placeholders
+QUEST_GIVER_TEMPLATE = """- Quest Giver: {quest_giver_npc_name} (ID: {quest_giver_npc_id})
+      Role: {quest_giver_npc_role}
+      Personality: {quest_giver_npc_personality}
+      Speaking Style: {quest_giver_npc_speaking_style}
+      Location: {location_name}"""
+
+PLAYER_INPUT_TEMPLATE = '*** PLAYER INPUT: "{player_dialogue}" ***'
+
+DEFAULT_THEME_RULE = "0. Create a quest that fits the WORLD LORE and NPC's situation."
+
+PLAYER_THEME_RULE_TEMPLATE = """0. **THEME ENFORCEMENT (HIGHEST PRIORITY)**: 
+       - The quest MUST revolve around "{player_dialogue}".
+       - **SELECTION RULE**: Look at the 'AVAILABLE RESOURCES' list. Pick only the Monsters/Dungeons that logically fit this theme.
+       - If the theme is "Hunger", pick a Beast-type monster (for meat).
+       - If the theme is "Treasure", pick a Dungeon.
+       - If nothing fits perfectly, pick the closest one and invent a creative reason."""
+
+# Static role, lore, rules and output format live in QUEST_SYSTEM_INSTRUCTION
+# (sent once as the cached prefix); only per-request context goes here.
+QUEST_PROMPT_TEMPLATE = """
+    {player_theme_section}
+    {memory_section}
+    
+    *** QUEST GIVER ***
+    {quest_giver_str}
+
+    *** AVAILABLE RESOURCES (MENU) ***
+    {resources_str}
+
+    *** INTERACTION UNAVAILABLE RESOURCES (CANNOT INTERACT) ***
+    {interaction_unavailable_resources_str}
+
+    *** RULE 0 (THIS REQUEST) ***
+    {theme_rule}
+
+    Final step MUST return to the Quest Giver (`{quest_giver_npc_id}`).
+
+    Generate the JSON now.
+    """
+
+
 # ============================================================================
 # QUEST GENERATOR SERVICE
 # ============================================================================
@@ -148,8 +375,33 @@ class QuestGeneratorService:
             location=settings.google_cloud_location
         )
         
-        self.model = GenerativeModel(settings.gemini_model)
-        logger.info(f"Quest generator initialized: {settings.gemini_model} @ {settings.google_cloud_project}")
+        # Model is built once and shared; the semaphore caps concurrent Gemini calls
+        self.model = GenerativeModel(
+            settings.gemini_model,
+            system_instruction=QUEST_SYSTEM_INSTRUCTION
+        )
+        self._semaphore = asyncio.Semaphore(settings.llm_concurrency)
+        
+        # Local view of the Gemini quota: calls wait for capacity instead of
+        # spending a round-trip on a 429; a 429 pauses new calls for a cooldown
+        self._rate_limiter = AsyncLimiter(settings.gemini_qpm, time_period=60)
+        self._cooldown_until = 0.0
+        
+        # Static instructions registered as Vertex AI cached content (if enabled)
+        self._cache_enabled = settings.quest_prompt_cache_enabled
+        self._cached_model: Optional[GenerativeModel] = None
+        self._cache_refresh_at = 0.0
+        if self._cache_enabled:
+            self._refresh_cached_model()
+        
+        # Generated quests keyed on the request context (exact-match response cache)
+        self._response_cache: Optional[TTLCache] = None
+        if settings.quest_response_cache_enabled:
+            self._response_cache = TTLCache(
+                maxsize=settings.quest_response_cache_size,
+                ttl=settings.quest_response_cache_ttl_seconds
+            )
+        logger.info("Quest generator initialized: %s @ %s", settings.gemini_model, settings.google_cloud_project)
     
     async def generate_quest(self, context: QuestContext) -> Dict[str, Any]:
         """
@@ -160,40 +412,184 @@ class QuestGeneratorService:
         
         Returns:
             {
-                "quest_data": {...},  # Quest JSON for Unity
-                "memory_data": {...}  # Memory to save to CharacterMemorySystem
+                "quest_data": {...},   # Quest JSON for Unity
+                "memory_data": {...},  # Memory to save to CharacterMemorySystem
+                "cache_hit": bool      # Served from the response cache (memory already saved)
             }
         
         Raises:
-            Exception: If quest generation fails after retry
+            Exception: If quest generation fails
         """
+        cache_key = self._cache_key(context)
+        if self._response_cache is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Quest cache hit for NPC %s", context.quest_giver_npc_id)
+                return {**cached, "cache_hit": True}
+        
         prompt = self._create_quest_prompt(context)
-        raw_response = None  # Initialize to avoid UnboundLocalError
         
         try:
-            # First attempt
-            logger.info(f"Generating quest for NPC {context.quest_giver_npc_id}")
+            # Single attempt: response_schema guarantees parseable JSON
+            logger.info("Generating quest for NPC %s", context.quest_giver_npc_id)
             raw_response = await self._call_gemini(prompt)
-            quest_json = self._parse_and_validate(raw_response, context)
+            quest_json = self._parse_and_validate(raw_response)
             
             logger.info("Quest generated successfully")
-            return quest_json
+            if self._response_cache is not None:
+                self._response_cache[cache_key] = quest_json
+            return {**quest_json, "cache_hit": False}
             
         except Exception as e:
-            # Retry logic with error feedback
-            logger.warning(f"First attempt failed: {e}. Retrying with error feedback...")
-            retry_prompt = self._create_retry_prompt(prompt, raw_response if raw_response else "", str(e))
+            logger.error("Quest generation failed: %s", e)
+            raise Exception(f"Quest generation failed: {e}")
+    
+    async def stream_quest(self, context: QuestContext) -> AsyncIterator[Tuple[str, bool]]:
+        """
+        Generate quest JSON from game context, yielding text as Gemini produces it.
+        
+        The concatenated chunks form the quest_data/memory_data object that
+        generate_quest returns. Once the stream completes, the result is
+        validated and cached.
+        
+        Args:
+            context: Quest generation context from Unity
+        
+        Yields:
+            (raw JSON text fragment, whether it came from the response cache)
+        """
+        cache_key = self._cache_key(context)
+        if self._response_cache is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Quest cache hit for NPC %s", context.quest_giver_npc_id)
+                yield orjson.dumps(cached).decode("utf-8"), True
+                return
+        
+        prompt = self._create_quest_prompt(context)
+        logger.info("Streaming quest for NPC %s", context.quest_giver_npc_id)
+        
+        model = await self._get_model()
+        chunks: List[str] = []
+        await self._wait_for_quota()
+        async with self._semaphore:
+            try:
+                responses = await model.generate_content_async(
+                    [Part.from_text(prompt)],
+                    generation_config=_GENERATION_CONFIG,
+                    stream=True
+                )
+            except api_exceptions.ResourceExhausted as e:
+                self._start_cooldown(e)
+                raise
+            async for response in responses:
+                text = response.text
+                if text:
+                    chunks.append(text)
+                    yield text, False
+        
+        quest_json = self._parse_and_validate(_strip_fence("".join(chunks)))
+        logger.info("Quest streamed successfully")
+        if self._response_cache is not None:
+            self._response_cache[cache_key] = quest_json
+    
+    @staticmethod
+    def _cache_key(context: QuestContext) -> str:
+        """
+        Build a canonical hash of the quest context for the response cache.
+        
+        Args:
+            context: Quest generation context from Unity
+        
+        Returns:
+            Hex digest identifying the context
+        """
+        canonical = orjson.dumps(context.model_dump(), option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+    
+    def _refresh_cached_model(self) -> None:
+        """
+        (Re)create the cached-content model for the static quest instructions.
+        
+        Falls back to the plain model (static prefix sent with every request)
+        if cached content cannot be created, e.g. when the prefix is below the
+        model's minimum cacheable size.
+        """
+        ttl_seconds = settings.quest_prompt_cache_ttl_minutes * 60
+        try:
+            from vertexai.preview.caching import CachedContent
             
+            cached_content = CachedContent.create(
+                model_name=settings.gemini_model,
+                system_instruction=QUEST_SYSTEM_INSTRUCTION,
+                ttl=timedelta(seconds=ttl_seconds)
+            )
+            self._cached_model = GenerativeModel.from_cached_content(cached_content=cached_content)
+            # Refresh a minute before the server-side cache expires
+            self._cache_refresh_at = time.monotonic() + max(ttl_seconds - 60, 0)
+            logger.info("Quest instructions cached on Vertex AI (ttl=%ss)", ttl_seconds)
+        except Exception as e:
+            self._cached_model = None
+            self._cache_enabled = False
+            logger.warning("Context caching unavailable, sending instructions per request: %s", e)
+    
+    async def _get_model(self) -> GenerativeModel:
+        """
+        Get the model to call: the cached-content model when available.
+        
+        Returns:
+            GenerativeModel instance
+        """
+        if not self._cache_enabled:
+            return self.model
+        if self._cached_model is None or time.monotonic() >= self._cache_refresh_at:
+            await asyncio.to_thread(self._refresh_cached_model)
+        return self._cached_model or self.model
+    
+    async def warmup(self) -> None:
+        """
+        Send a one-token request so the first player doesn't pay cold-start cost.
+        
+        Absorbs the TLS handshake, auth token fetch and (cached) prefix setup
+        at startup. Failures are logged and otherwise ignored.
+        """
+        try:
+            model = await self._get_model()
+            await model.generate_content_async(
+                [Part.from_text("ping")],
+                generation_config=GenerationConfig(max_output_tokens=1)
+            )
+            logger.info("Quest generator warmed up")
+        except Exception as e:
+            logger.warning("Quest generator warmup failed: %s", e)
+    
+    async def _wait_for_quota(self) -> None:
+        """
+        Wait out any 429 cooldown, then take one call from the rate limiter.
+        """
+        remaining = self._cooldown_until - time.monotonic()
+        if remaining > 0:
+            logger.info("Gemini quota cooldown: waiting %.2f seconds", remaining)
+            await asyncio.sleep(remaining)
+        await self._rate_limiter.acquire()
+    
+    def _start_cooldown(self, error: api_exceptions.ResourceExhausted) -> None:
+        """
+        Pause new Gemini calls after a 429, honoring Retry-After when present.
+        
+        Args:
+            error: The rate-limit error returned by Vertex AI
+        """
+        cooldown = settings.gemini_rate_limit_cooldown_seconds
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("Retry-After") if response is not None else None
+        if retry_after:
             try:
-                raw_response_v2 = await self._call_gemini(retry_prompt)
-                quest_json = self._parse_and_validate(raw_response_v2, context)
-                
-                logger.info("Quest generated successfully on retry")
-                return quest_json
-                
-            except Exception as e2:
-                logger.error(f"Quest generation failed after retry: {e2}")
-                raise Exception(f"Quest generation failed: {e2}")
+                cooldown = float(retry_after)
+            except ValueError:
+                pass
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + cooldown)
+        logger.warning("Gemini rate limit hit, pausing new calls for %.2f seconds", cooldown)
     
     async def _call_gemini(self, prompt: str) -> str:
         """
@@ -205,16 +601,24 @@ class QuestGeneratorService:
         Returns:
             Raw response text from Gemini
         """
-        response = await self.model.generate_content_async([Part.from_text(prompt)])
-        response_text = response.text
+        model = await self._get_model()
+        # Transient errors are retried with jittered backoff (see utils.llm_utils);
+        # the concurrency slot is released while waiting between attempts
+        async for attempt in llm_retrying():
+            with attempt:
+                await self._wait_for_quota()
+                async with self._semaphore:
+                    try:
+                        response = await model.generate_content_async(
+                            [Part.from_text(prompt)],
+                            generation_config=_GENERATION_CONFIG
+                        )
+                    except api_exceptions.ResourceExhausted as e:
+                        self._start_cooldown(e)
+                        raise
         
         # Remove code fences if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
-        
-        return response_text.strip()
+        return _strip_fence(response.text)
     
     def _create_quest_prompt(self, context: QuestContext) -> str:
         """
@@ -223,18 +627,8 @@ class QuestGeneratorService:
         """
         
         # [DEBUG] 로그 출력
-        logger.info(f"====== [Prompt Gen] Player Dialogue: '{context.player_dialogue}' ======")
+        logger.debug("====== [Prompt Gen] Player Dialogue: '%s' ======", context.player_dialogue)
         
-        # ==================================================================
-        # 0. GAME STORY & ATMOSPHERE (New!)
-        # ==================================================================
-        # 여기에 게임의 전체적인 스토리나 분위기를 적으세요.
-        story_context = """
-    **GAME SETTING**: A dark medieval fantasy world'.
-    **CURRENT ATMOSPHERE**: Tension is high. The forest is becoming dangerous.
-    **LORE**: Long ago, the ancient kingdom fell due to betrayal. Now, monsters are agitated by the approaching eclipse.
-    """
-
         # ==================================================================
         # 1. SMART SELECTION LOGIC (Target NPC Only)
         # ==================================================================
@@ -244,16 +638,22 @@ class QuestGeneratorService:
         target_npc_id = None
         relation_info = "None"
         
+        # Search results are used for both NPC selection and the memory section
+        search_data = None
+        if context.search_results_json:
+            try:
+                search_data = orjson.loads(context.search_results_json)
+            except: pass
+        
         if context.inLocation_npc_ids and len(context.inLocation_npc_ids) > 0:
             candidate_indices = range(len(context.inLocation_npc_ids))
             best_idx = -1
             selection_reason = ""
             
             # --- Logic A: Check Search Results ---
-            if context.search_results_json:
+            if search_data is not None:
                 try:
-                    s_data = json.loads(context.search_results_json)
-                    for result in s_data.get("results", []):
+                    for result in search_data.get("results", []):
                         if best_idx != -1: break 
                         if result.get("similarity_score", 0.0) < 0.35: continue 
 
@@ -264,7 +664,7 @@ class QuestGeneratorService:
                             if n_id in memory_content or n_name in memory_content:
                                 best_idx = i
                                 selection_reason = f"(Selected: Related to Input)"
-                                logger.info(f"   [Reasoning] Match found! NPC: {n_name}")
+                                logger.debug("   [Reasoning] Match found! NPC: %s", n_name)
                                 break
                 except: pass
 
@@ -317,111 +717,56 @@ class QuestGeneratorService:
         # 3. PROMPT CONSTRUCTION
         # ==================================================================
 
-        elements = [
-            f"- Quest Giver: {context.quest_giver_npc_name} (ID: {context.quest_giver_npc_id})",
-            f"  Role: {context.quest_giver_npc_role}",
-            f"  Personality: {context.quest_giver_npc_personality}",
-            f"  Speaking Style: {context.quest_giver_npc_speaking_style}",
-            f"  Location: {context.location_name}"
-        ]
+        quest_giver_str = QUEST_GIVER_TEMPLATE.format(
+            quest_giver_npc_name=context.quest_giver_npc_name,
+            quest_giver_npc_id=context.quest_giver_npc_id,
+            quest_giver_npc_role=context.quest_giver_npc_role,
+            quest_giver_npc_personality=context.quest_giver_npc_personality,
+            quest_giver_npc_speaking_style=context.quest_giver_npc_speaking_style,
+            location_name=context.location_name
+        )
         
         # Theme & Mood Logic
         player_theme_section = ""
-        theme_rule = "0. Create a quest that fits the WORLD LORE and NPC's situation."
+        theme_rule = DEFAULT_THEME_RULE
         
         if context.player_dialogue and context.player_dialogue.strip():
-            player_theme_section = f"*** PLAYER INPUT: \"{context.player_dialogue}\" ***"
-            theme_rule = f"""0. **THEME ENFORCEMENT (HIGHEST PRIORITY)**: 
-       - The quest MUST revolve around "{context.player_dialogue}".
-       - **SELECTION RULE**: Look at the 'AVAILABLE RESOURCES' list. Pick only the Monsters/Dungeons that logically fit this theme.
-       - If the theme is "Hunger", pick a Beast-type monster (for meat).
-       - If the theme is "Treasure", pick a Dungeon.
-       - If nothing fits perfectly, pick the closest one and invent a creative reason."""
+            player_theme_section = PLAYER_INPUT_TEMPLATE.format(player_dialogue=context.player_dialogue)
+            theme_rule = PLAYER_THEME_RULE_TEMPLATE.format(player_dialogue=context.player_dialogue)
 
         # Memory Logic
         memory_section = ""
         if context.search_results_json or context.recent_memories_json:
-            memory_section = "*** MEMORY CONTEXT ***\n"
-            # (Memory parsing omitted for brevity - same as before)
-            if context.search_results_json:
+            memory_lines = ["*** MEMORY CONTEXT ***"]
+            if search_data is not None:
                 try:
-                    s_data = json.loads(context.search_results_json)
-                    for res in s_data.get("results", []):
-                        memory_section += f"    - [Related]: {res.get('memory', {}).get('content')}\n"
+                    for res in search_data.get("results", []):
+                        memory_lines.append(f"    - [Related]: {res.get('memory', {}).get('content')}")
                 except: pass
             if context.recent_memories_json:
                 try:
-                    recent_data = json.loads(context.recent_memories_json)
+                    recent_data = orjson.loads(context.recent_memories_json)
                     for mem in recent_data.get("memories", []):
-                        memory_section += f"    - [Recent]: {mem.get('content')}\n"
+                        memory_lines.append(f"    - [Recent]: {mem.get('content')}")
                 except: pass
-
-        quest_giver_str = "\n    ".join(elements)
-
-        return f"""
-    You are a Master Quest Designer for a **Medieval Fantasy RPG**.
-    
-    *** WORLD STORY & LORE ***
-    {story_context}
-    
-    {player_theme_section}
-    {memory_section}
+            memory_section = "\n".join(memory_lines) + "\n"
+
+        return QUEST_PROMPT_TEMPLATE.format(
+            player_theme_section=player_theme_section,
+            memory_section=memory_section,
+            quest_giver_str=quest_giver_str,
+            resources_str=resources_str,
+            interaction_unavailable_resources_str=interaction_unavailable_resources_str,
+            theme_rule=theme_rule,
+            quest_giver_npc_id=context.quest_giver_npc_id
+        )
     
-    *** QUEST GIVER ***
-    {quest_giver_str}
-
-    *** AVAILABLE RESOURCES (MENU) ***
-    {resources_str}
-
-    *** INTERACTION UNAVAILABLE RESOURCES (CANNOT INTERACT) ***
-    {interaction_unavailable_resources_str}
-
-    *** CRITICAL RULES ***
-    {theme_rule}
-
-    1. **Intelligent Selection**: 
-       - From the `AVAILABLE RESOURCES` list above, **YOU (the AI) MUST SELECT 0 to 3 items** that best fit the Theme and Story.
-       - Do NOT use everything. Only use what makes sense.
-       - If the Player Input implies fighting, pick a Monster.
-       - If the Player Input implies exploration, pick a Dungeon.
-       - Always include the 'Target NPC' if one is listed.
-
-    1-2. **Exclusion of Unavailable Resources**:
-        - You can use the 'INTERACTION UNAVAILABLE RESOURCES' list for story flavor, but you CANNOT make them direct objectives. 
-        - It means you cannot have objectives like "Go to LANDMARK" or "Talk to LANDMARK".
-        - But you can mention them in dialogues or quest summaries.
-        - For example, some NPC has a shack. Shack is a landmark. You can make a dialogue like "I live near the old shack, and I need to fix it. Can you help me?" And you can make an objective like "Talk to NPC to get wood planks to fix the shack.", but you cannot make an objective like "Go to the shack and fix it."
-
-    2. **The "Bridge" Rule (Causality)**: 
-       - Every dialogue MUST explain *why* the player needs to do the NEXT objective.
-       - Connect the selected resources to the Quest Giver's problem and the World Lore.
-
-    3. **Mandatory Structure**:
-       - **Step 1**: Interaction with Quest Giver.
-       - **Middle Steps**: Steps for the resources YOU SELECTED (Kill X, Go to Y, Talk to Z).
-       - **Final Step**: MUST return to Quest Giver (`{context.quest_giver_npc_id}`).
-
-    4. **JSON Keys**:
-       - KILL -> `target_monster_id`
-       - DUNGEON -> `target_dungeon_id`
-       - TALK -> `target_npc_id`
-       - GOTO -> `target_location_id`
-
-    5. **Output**: A single JSON object with `quest_data` and `memory_data`.
-    6. **Language**: KOREAN ONLY. Use a tone appropriate for the Medieval Fantasy setting.
-
-    *** JSON OUTPUT FORMAT ***
-    {QUEST_JSON_FORMAT_EXAMPLE}
-
-    Generate the JSON now.
-    """
-    def _parse_and_validate(self, json_str: str, context: QuestContext) -> Dict:
+    def _parse_and_validate(self, json_str: str) -> Dict:
         """
         Parse and validate JSON response from Gemini.
         
         Args:
             json_str: Raw JSON string from Gemini
-            context: Original quest context for error fixing
         
         Returns:
             Validated JSON dict with quest_data and memory_data
@@ -429,13 +774,10 @@ class QuestGeneratorService:
         Raises:
             ValueError: If JSON is invalid or missing required keys
         """
-        # Fix common formatting errors
-        fixed = self._fix_common_errors(json_str, context)
-        
         # Parse JSON
         try:
-            data = json.loads(fixed)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
         
         # Validate structure
@@ -445,47 +787,6 @@ class QuestGeneratorService:
             raise ValueError("Missing 'memory_data' key in response")
         
         return data
-    
-    def _fix_common_errors(self, json_str: str, context: QuestContext) -> str:
-        """
-        Fix common JSON formatting errors using regex.
-        
-        Specifically fixes dialogue array format issues.
-        """
-        corrected_str = json_str
-        
-        try:
-            # Fix "on_start": [ "dialogue text" ] -> proper format
-            pattern = r'("on_start"\s*:\s*\[\s*)"([\s\S]*?)"(\s*\])'
-            replacement = r'\1{"speaker_id": "' + context.quest_giver_npc_id + r'", "line": "\2"}\3'
-            corrected_str = re.sub(pattern, replacement, corrected_str, flags=re.IGNORECASE)
-        except Exception as e:
-            logger.warning(f"Error while fixing JSON: {e}")
-            return json_str
-        
-        return corrected_str
-    
-    def _create_retry_prompt(self, original_prompt: str, bad_json: str, error_message: str) -> str:
-        """
-        Create retry prompt with error feedback.
-        
-        Args:
-            original_prompt: The original prompt that failed
-            bad_json: The invalid JSON that was generated
-            error_message: Error message from parsing
-        
-        Returns:
-            New prompt with error feedback
-        """
-        return f"""
-    Your previous JSON generation failed. Error: {error_message}
-    Failed JSON: {bad_json}
-    
-    Please correct the JSON structure. 
-    Ensure you generate a ROOT object containing both "quest_data" and "memory_data".
-    
-    Original Instructions: {original_prompt}
-    """
 
 
 # ============================================================================
@@ -55,7 +55,7 @@ class RecentMemoryService:
         # Initialize deque for NPC if not exists
         if npc_id not in self._storage:
             self._storage[npc_id] = deque(maxlen=self.max_size)
-            logger.debug(f"Created new memory queue for NPC: {npc_id}")
+            logger.debug("Created new memory queue for NPC: %s", npc_id)
 
         queue = self._storage[npc_id]
 
@@ -65,18 +65,54 @@ class RecentMemoryService:
             # deque will auto-evict, but we need to capture it first
             evicted_memory = queue[0]  # Oldest item (will be evicted)
             logger.debug(
-                f"Queue full for {npc_id}. Evicting memory: {evicted_memory.id}"
+                "Queue full for %s. Evicting memory: %s", npc_id, evicted_memory.id
             )
 
         # Add new memory (deque automatically evicts oldest if full)
         queue.append(memory)
         logger.debug(
-            f"Added memory {memory.id} to {npc_id}. "
-            f"Queue size: {len(queue)}/{self.max_size}"
+            "Added memory %s to %s. Queue size: %d/%d",
+            memory.id, npc_id, len(queue), self.max_size
         )
 
         return evicted_memory
 
+    def add_memories(
+        self,
+        npc_id: str,
+        memories: List[MemoryEntry]
+    ) -> List[MemoryEntry]:
+        """
+        Add several memories to an NPC's recent memory queue at once.
+
+        Same result as calling add_memory for each memory in order.
+
+        Args:
+            npc_id: NPC identifier
+            memories: MemoryEntry objects to add, oldest first
+
+        Returns:
+            Evicted MemoryEntry objects, oldest first (empty if none)
+        """
+        # Initialize deque for NPC if not exists
+        if npc_id not in self._storage:
+            self._storage[npc_id] = deque(maxlen=self.max_size)
+            logger.debug("Created new memory queue for NPC: %s", npc_id)
+
+        queue = self._storage[npc_id]
+
+        # Everything beyond max_size (oldest first) falls out of the queue
+        overflow = len(queue) + len(memories) - self.max_size
+        evicted = (list(queue) + memories)[:overflow] if overflow > 0 else []
+
+        queue.extend(memories)
+        logger.debug(
+            "Added %d memories to %s, evicted %d. Queue size: %d/%d",
+            len(memories), npc_id, len(evicted), len(queue), self.max_size
+        )
+
+        return evicted
+
     def get_recent(self, npc_id: str) -> List[MemoryEntry]:
         """
         Get all recent memories for an NPC.
@@ -90,14 +126,30 @@ class RecentMemoryService:
             List of MemoryEntry objects (up to 5), empty list if NPC not found
         """
         if npc_id not in self._storage:
-            logger.debug(f"No recent memories found for NPC: {npc_id}")
+            logger.debug("No recent memories found for NPC: %s", npc_id)
             return []
 
         # Convert deque to list (maintains order: oldest to newest)
         memories = list(self._storage[npc_id])
-        logger.debug(f"Retrieved {len(memories)} recent memories for {npc_id}")
+        logger.debug("Retrieved %d recent memories for %s", len(memories), npc_id)
         return memories
 
+    def get_by_id(self, npc_id: str, memory_id: str) -> Optional[MemoryEntry]:
+        """
+        Get a single recent memory by ID.
+
+        Args:
+            npc_id: NPC identifier
+            memory_id: Memory identifier
+
+        Returns:
+            MemoryEntry if found, None otherwise
+        """
+        queue = self._storage.get(npc_id)
+        if not queue:
+            return None
+        return next((memory for memory in queue if memory.id == memory_id), None)
+
     def get_all_npcs(self) -> List[str]:
         """
         Get list of all NPC IDs that have memories.
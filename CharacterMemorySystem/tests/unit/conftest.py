@@ -0,0 +1,94 @@
+"""
+Shared fixtures for CharacterMemorySystem unit tests.
+
+Services run against a temporary buffer directory and a throwaway ChromaDB
+store. Embeddings come from a small deterministic fake, so no model is
+downloaded or loaded.
+
+Run from the CharacterMemorySystem directory:
+    python -m pytest tests/unit
+"""
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+np = pytest.importorskip("numpy")
+
+# Make the service packages importable (services/, api/, models/, ...)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from services.recent_memory import RecentMemoryService  # noqa: E402
+from services.longterm_memory import LongTermMemoryService  # noqa: E402
+from services.memory_manager import MemoryManager  # noqa: E402
+
+RECENT_SIZE = 2
+BUFFER_SIZE = 3
+
+
+class FakeEmbeddingService:
+    """Deterministic stand-in for EmbeddingService."""
+
+    def is_loaded(self) -> bool:
+        return True
+
+    def embed(self, texts, show_progress: bool = False):
+        is_single = isinstance(texts, str)
+        items = [texts] if is_single else texts
+        vectors = np.array(
+            [[float(len(text)), float(sum(map(ord, text)) % 101), 1.0] for text in items]
+        )
+        return vectors[0] if is_single else vectors
+
+
+@pytest.fixture
+def npc_id() -> str:
+    """Unique NPC id per test (the admin response cache is process-wide)."""
+    return f"npc_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def buffer_dir(tmp_path) -> Path:
+    return tmp_path / "buffers"
+
+
+@pytest.fixture
+def chroma_client(tmp_path):
+    return chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+
+
+@pytest.fixture
+def longterm_service(chroma_client, buffer_dir) -> LongTermMemoryService:
+    return LongTermMemoryService(
+        chroma_client=chroma_client,
+        embedding_service=FakeEmbeddingService(),
+        buffer_dir=str(buffer_dir),
+        buffer_size=BUFFER_SIZE
+    )
+
+
+@pytest.fixture
+def manager(longterm_service) -> MemoryManager:
+    return MemoryManager(
+        recent_service=RecentMemoryService(max_size=RECENT_SIZE),
+        longterm_service=longterm_service
+    )
+
+
+@pytest.fixture
+def admin_client(manager):
+    """TestClient for the admin router, wired to the test MemoryManager."""
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from api import admin
+
+    app = FastAPI()
+    app.include_router(admin.router)
+    admin.set_memory_manager(manager)
+
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,59 @@
+"""
+Journaled buffer edits must survive a restart before the journal is compacted.
+"""
+from datetime import datetime, timedelta, timezone
+
+from models.memory import MemoryEntry
+from services.longterm_memory import LongTermMemoryService
+
+from conftest import BUFFER_SIZE, FakeEmbeddingService
+
+
+def _restart(chroma_client, buffer_dir) -> LongTermMemoryService:
+    """Drop the in-memory buffer index, as a crash would, and reopen the store."""
+    return LongTermMemoryService(
+        chroma_client=chroma_client,
+        embedding_service=FakeEmbeddingService(),
+        buffer_dir=str(buffer_dir),
+        buffer_size=BUFFER_SIZE
+    )
+
+
+def _buffer_two(longterm_service, npc_id):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    memories = [
+        MemoryEntry(npc_id=npc_id, content=f"memory {i}", timestamp=start + timedelta(seconds=i))
+        for i in range(2)
+    ]
+    for memory in memories:
+        longterm_service.add_to_buffer(npc_id, memory)
+    return memories
+
+
+def test_journal_replayed_after_restart(longterm_service, chroma_client, buffer_dir, npc_id):
+    kept, deleted = _buffer_two(longterm_service, npc_id)
+
+    assert longterm_service.patch_buffer_item(npc_id, kept.id, {"content": "edited"})
+    assert longterm_service.delete_buffer_item(npc_id, deleted.id)
+    assert longterm_service._get_journal_path(npc_id).exists()
+
+    reopened = _restart(chroma_client, buffer_dir)
+
+    entries = reopened.load_buffer_entries(npc_id)
+    assert [(mem.id, mem.content) for mem in entries] == [(kept.id, "edited")]
+    assert entries[0].timestamp == kept.timestamp
+    assert reopened.get_buffer_count(npc_id) == 1
+
+
+def test_edits_after_restart_build_on_journal(longterm_service, chroma_client, buffer_dir, npc_id):
+    kept, deleted = _buffer_two(longterm_service, npc_id)
+    longterm_service.delete_buffer_item(npc_id, deleted.id)
+
+    reopened = _restart(chroma_client, buffer_dir)
+
+    # The replayed delete must not resurface, and a new edit stacks on top
+    assert not reopened.patch_buffer_item(npc_id, deleted.id, {"content": "ghost"})
+    assert reopened.patch_buffer_item(npc_id, kept.id, {"content": "edited again"})
+
+    entries = _restart(chroma_client, buffer_dir).load_buffer_entries(npc_id)
+    assert [(mem.id, mem.content) for mem in entries] == [(kept.id, "edited again")]
@@ -0,0 +1,52 @@
+"""
+Keyset (cursor) pagination stays consistent when memories are embedded
+between page requests.
+"""
+from test_memory_ordering import _populate
+
+
+def _get_page(client, npc_id, limit, cursor=None):
+    params = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    response = client.get(f"/admin/npc/{npc_id}/memories", params=params)
+    assert response.status_code == 200
+    body = response.json()
+    return [mem["id"] for mem in body["memories"]], body["next_cursor"]
+
+
+def _walk(client, npc_id, limit, cursor):
+    ids = []
+    while cursor:
+        page_ids, cursor = _get_page(client, npc_id, limit, cursor)
+        ids.extend(page_ids)
+    return ids
+
+
+def test_force_embed_between_pages(admin_client, manager, npc_id):
+    memory_ids = _populate(manager, npc_id)
+
+    # First page ends inside the buffer
+    first_ids, cursor = _get_page(admin_client, npc_id, limit=3)
+    assert first_ids == memory_ids[:8:-1]
+
+    # Buffered memories (one already listed) move to long-term storage
+    response = admin_client.post(f"/admin/npc/{npc_id}/embed-now")
+    assert response.status_code == 200
+
+    rest = _walk(admin_client, npc_id, limit=3, cursor=cursor)
+    assert first_ids + rest == memory_ids[::-1]
+
+
+def test_auto_embed_between_pages(admin_client, manager, npc_id):
+    memory_ids = _populate(manager, npc_id)
+
+    first_ids, cursor = _get_page(admin_client, npc_id, limit=3)
+
+    # A new memory evicts into the buffer, which fills up and auto-embeds
+    result = manager.add_memory(npc_id, "memory added between pages")
+    assert result["buffer_auto_embedded"]
+
+    rest = _walk(admin_client, npc_id, limit=3, cursor=cursor)
+    # Memories newer than the cursor are not listed; nothing repeats or goes missing
+    assert first_ids + rest == memory_ids[::-1]
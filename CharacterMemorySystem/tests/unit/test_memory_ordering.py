@@ -0,0 +1,77 @@
+"""
+Paginated memory listings must match the export order (newest first).
+"""
+from conftest import RECENT_SIZE
+
+
+def _populate(manager, npc_id):
+    """
+    Create 12 memories: 8 long-term, 2 buffered, 2 recent.
+
+    Returns:
+        Memory ids, oldest first
+    """
+    first = manager.add_memories_bulk(npc_id, [(f"memory {i}", None) for i in range(10)])
+    second = manager.add_memories_bulk(npc_id, [(f"memory {i}", None) for i in range(10, 12)])
+
+    stats = manager.get_stats(npc_id)
+    assert (stats.recent_count, stats.buffer_count, stats.longterm_count) == (RECENT_SIZE, 2, 8)
+
+    return first["memory_ids"] + second["memory_ids"]
+
+
+def _export_ids(client, npc_id):
+    response = client.get(f"/admin/export/{npc_id}")
+    assert response.status_code == 200
+    return [mem["id"] for mem in response.json()["memories"]]
+
+
+def _offset_page_ids(client, npc_id, limit):
+    ids = []
+    page = 1
+    while True:
+        response = client.get(f"/admin/npc/{npc_id}/memories", params={"page": page, "limit": limit})
+        assert response.status_code == 200
+        body = response.json()
+        ids.extend(mem["id"] for mem in body["memories"])
+        if page >= body["total_pages"]:
+            return ids
+        page += 1
+
+
+def _cursor_page_ids(client, npc_id, limit):
+    ids = []
+    params = {"limit": limit}
+    while True:
+        response = client.get(f"/admin/npc/{npc_id}/memories", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        ids.extend(mem["id"] for mem in body["memories"])
+        if not body["next_cursor"]:
+            return ids
+        params = {"limit": limit, "cursor": body["next_cursor"]}
+
+
+def test_pages_match_export_order(admin_client, manager, npc_id):
+    memory_ids = _populate(manager, npc_id)
+    expected = memory_ids[::-1]
+
+    assert _export_ids(admin_client, npc_id) == expected
+    assert _offset_page_ids(admin_client, npc_id, limit=5) == expected
+    assert _cursor_page_ids(admin_client, npc_id, limit=5) == expected
+
+
+def test_edits_keep_place_in_every_tier(admin_client, manager, npc_id):
+    memory_ids = _populate(manager, npc_id)
+    # One long-term, one buffered and one recent memory
+    for memory_id in (memory_ids[2], memory_ids[8], memory_ids[11]):
+        response = admin_client.put(
+            f"/admin/memory/{npc_id}/{memory_id}",
+            json={"content": f"edited {memory_id}"}
+        )
+        assert response.status_code == 200
+
+    expected = memory_ids[::-1]
+    assert _export_ids(admin_client, npc_id) == expected
+    assert _offset_page_ids(admin_client, npc_id, limit=5) == expected
+    assert _cursor_page_ids(admin_client, npc_id, limit=5) == expected
@@ -0,0 +1,71 @@
+"""
+LLM Utilities - Shared retry policy for Gemini calls.
+
+Centralizes which Vertex AI errors are transient and how long to back off
+between attempts, so every Gemini call site retries the same way.
+"""
+import asyncio
+import logging
+
+import httpx
+from google.api_core import exceptions as api_exceptions
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: rate limiting, overload, timeouts, transient 5xx,
+# dropped connections (httpx transport errors don't subclass ConnectionError)
+RETRYABLE_ERRORS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    httpx.TimeoutException,
+)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """Log a failed attempt before tenacity sleeps and retries it."""
+    logger.warning(
+        "Gemini attempt %d failed: %s. Retrying in %.2f seconds...",
+        retry_state.attempt_number,
+        retry_state.outcome.exception(),
+        retry_state.next_action.sleep
+    )
+
+
+def llm_retrying() -> AsyncRetrying:
+    """
+    Build the retry controller for an async Gemini call.
+
+    Transient errors are retried with exponential backoff plus jitter so
+    concurrent requests hitting the same quota do not retry in lockstep.
+    Other errors are raised immediately; the last error is re-raised once
+    all attempts fail.
+
+    Returns:
+        AsyncRetrying instance to iterate with ``async for``
+
+    Example:
+        >>> async for attempt in llm_retrying():
+        ...     with attempt:
+        ...         response = await model.generate_content_async(...)
+    """
+    return AsyncRetrying(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=wait_exponential_jitter(initial=1, max=settings.llm_max_backoff_seconds),
+        stop=stop_after_attempt(settings.llm_max_retries + 1),
+        before_sleep=_log_retry,
+        reraise=True
+    )